@@ -9,11 +9,23 @@ from app.controllers import (
     user_controller,
     stats_controller
 )
+from app.utils import db, compression, json_provider, swr_cache
+from app.utils.db_pool import PoolTimeoutError
+from app.search.index import job_index
 
 def create_app():
     app = Flask(__name__)
     app.config.from_pyfile('config.py')
 
+    # 요청 단위 DB 연결 반환
+    db.init_app(app)
+
+    # 공고 검색 역색인 (SEARCH_BACKEND=index일 때 시작 시 DB에서 구성)
+    job_index.init_app(app)
+
+    # 통계 캐시 백그라운드 갱신
+    swr_cache.init_app(app)
+
     # 블루프린트 등록
     app.register_blueprint(auth_controller.auth_bp)  # 인증
     app.register_blueprint(job_controller.job_bp)  # 채용 공고
@@ -21,6 +33,12 @@ def create_app():
     app.register_blueprint(user_controller.user_bp)  # 사용자 (북마크 및 지원 내역 포함)
     app.register_blueprint(stats_controller.stats_bp)  # 통계
 
+    # JSON 직렬화 (orjson, 미설치 시 기본 provider)
+    json_provider.init_app(app)
+
+    # 응답 압축 (gzip, 설치 시 brotli/zstd)
+    compression.init_app(app)
+
     # Swagger UI 설정
     SWAGGER_URL = '/api/docs'
     API_URL = '/static/swagger.yaml'  # YAML 파일 경로
@@ -67,6 +85,11 @@ def create_app():
     def not_found_error(error):
         return jsonify({"error": "Not Found", "message": str(error)}), 404
 
+    @app.errorhandler(PoolTimeoutError)
+    def pool_timeout_error(error):
+        app.logger.warning(f"Database pool timeout: {str(error)}")
+        return jsonify({"error": "Service Unavailable", "message": "Database is busy, please retry"}), 503
+
     @app.errorhandler(Exception)
     def internal_server_error(error):
         app.logger.error(f"Unexpected error: {str(error)}")
@@ -29,3 +29,87 @@ DATABASE_CONFIG = {
 
 if not all(DATABASE_CONFIG.values()):
     raise ValueError("DATABASE_CONFIG variables (host, user, password, database) must be set in the environment")
+
+# 연결 풀 설정
+try:
+    DB_POOL_CONFIG = {
+        'pool_size': int(os.getenv('DB_POOL_SIZE', 30)),  # 유지할 연결 수
+        'max_overflow': int(os.getenv('DB_POOL_MAX_OVERFLOW', 10)),  # 초과 허용 연결 수
+        'timeout': float(os.getenv('DB_POOL_TIMEOUT', 5)),  # 연결 대기 시간 (초)
+        'recycle': int(os.getenv('DB_POOL_RECYCLE', 3600)),  # 연결 최대 수명 (초)
+        'pre_ping': os.getenv('DB_POOL_PRE_PING', 'true').lower() == 'true',  # 대여 전 연결 확인
+    }
+    DB_POOL_WARMUP = int(os.getenv('DB_POOL_WARMUP', 5))  # 시작 시 미리 생성할 연결 수
+except ValueError:
+    raise ValueError("DB_POOL_SIZE, DB_POOL_MAX_OVERFLOW, DB_POOL_TIMEOUT, DB_POOL_RECYCLE and DB_POOL_WARMUP must be valid numbers")
+
+# 읽기 전용 복제본 설정 (예: "127.0.0.1:3307,127.0.0.1:3308", 비어 있으면 모든 읽기를 주 DB에서 처리)
+DB_REPLICA_HOSTS = [host.strip() for host in os.getenv('DB_REPLICA_HOSTS', '').split(',') if host.strip()]
+try:
+    DB_REPLICA_RETRY_INTERVAL = int(os.getenv('DB_REPLICA_RETRY_INTERVAL', 30))  # 장애 복제본 재시도 간격 (초)
+    READ_YOUR_WRITES_WINDOW = int(os.getenv('READ_YOUR_WRITES_WINDOW', 5))  # 쓰기 후 주 DB에서 읽는 시간 (초)
+except ValueError:
+    raise ValueError("DB_REPLICA_RETRY_INTERVAL and READ_YOUR_WRITES_WINDOW must be valid integers")
+
+# 캐시 설정
+try:
+    JOB_DETAIL_CACHE_TTL = int(os.getenv('JOB_DETAIL_CACHE_TTL', 300))  # 공고 상세 캐시 만료 시간 (초)
+except ValueError:
+    raise ValueError("JOB_DETAIL_CACHE_TTL must be a valid integer")
+
+# 응답 압축 설정
+try:
+    COMPRESS_MIN_SIZE = int(os.getenv('COMPRESS_MIN_SIZE', 1024))  # 압축할 최소 본문 크기 (바이트)
+    COMPRESS_LEVEL = int(os.getenv('COMPRESS_LEVEL', 6))  # gzip 압축 레벨
+    COMPRESS_CACHE_SIZE = int(os.getenv('COMPRESS_CACHE_SIZE', 256))  # 압축 결과 캐시 항목 수
+except ValueError:
+    raise ValueError("COMPRESS_MIN_SIZE, COMPRESS_LEVEL and COMPRESS_CACHE_SIZE must be valid integers")
+
+# JSON 응답 설정 ('http': Flask 기본 HTTP 날짜 형식, 'iso': ISO 8601)
+JSON_DATETIME_FORMAT = os.getenv('JSON_DATETIME_FORMAT', 'http')
+
+# 공고 내보내기(스트리밍) 설정
+try:
+    EXPORT_CHUNK_SIZE = int(os.getenv('EXPORT_CHUNK_SIZE', 1000))  # 한 번에 가져와 전송할 행 수
+except ValueError:
+    raise ValueError("EXPORT_CHUNK_SIZE must be a valid integer")
+
+# 검색 설정
+SEARCH_BACKEND = os.getenv('SEARCH_BACKEND', 'like')  # 'like', 'fulltext'(migrations/003 적용 필요) 또는 'index'(메모리 역색인)
+try:
+    NGRAM_TOKEN_SIZE = int(os.getenv('NGRAM_TOKEN_SIZE', 2))  # MySQL ngram_token_size와 동일하게 설정
+    SEARCH_INDEX_SYNC_INTERVAL = float(os.getenv('SEARCH_INDEX_SYNC_INTERVAL', 1.0))  # 다른 프로세스의 변경 반영 주기 (초)
+    SEARCH_INDEX_REBUILD_INTERVAL = int(os.getenv('SEARCH_INDEX_REBUILD_INTERVAL', 3600))  # 전체 재구성 주기 (초, 0이면 사용 안 함)
+except ValueError:
+    raise ValueError("NGRAM_TOKEN_SIZE, SEARCH_INDEX_SYNC_INTERVAL and SEARCH_INDEX_REBUILD_INTERVAL must be valid numbers")
+
+try:
+    SEARCH_MAX_PAGE_SIZE = int(os.getenv('SEARCH_MAX_PAGE_SIZE', 100))  # 공고 목록/검색 결과 페이지 최대 크기
+    SEARCH_COUNT_TTL = int(os.getenv('SEARCH_COUNT_TTL', 300))  # 검색 결과 수 캐시 만료 시간 (초)
+    SEARCH_FACET_LIMIT = int(os.getenv('SEARCH_FACET_LIMIT', 20))  # 패싯별 반환할 최대 값 수
+    SEARCH_RESULT_CACHE_TTL = int(os.getenv('SEARCH_RESULT_CACHE_TTL', 60))  # 검색 결과 캐시 만료 시간 (초, 0이면 사용 안 함)
+    SEARCH_RESULT_CACHE_MAX_IDS = int(os.getenv('SEARCH_RESULT_CACHE_MAX_IDS', 1000))  # 검색당 캐시할 최대 공고 ID 수
+except ValueError:
+    raise ValueError("SEARCH_MAX_PAGE_SIZE, SEARCH_COUNT_TTL, SEARCH_FACET_LIMIT, SEARCH_RESULT_CACHE_TTL "
+                     "and SEARCH_RESULT_CACHE_MAX_IDS must be valid integers")
+
+if SEARCH_BACKEND not in ('like', 'fulltext', 'index'):
+    raise ValueError("SEARCH_BACKEND must be 'like', 'fulltext' or 'index'")
+
+# 추천 설정
+try:
+    RECOMMEND_TOP_N = int(os.getenv('RECOMMEND_TOP_N', 50))  # 사용자별로 저장할 추천 공고 수
+    RECOMMEND_TTL = int(os.getenv('RECOMMEND_TTL', 172800))  # 추천 목록 만료 시간 (초, 배치 실행 주기보다 길게)
+    RECOMMEND_WORKERS = int(os.getenv('RECOMMEND_WORKERS', os.cpu_count() or 1))  # 배치 계산 프로세스 수
+except ValueError:
+    raise ValueError("RECOMMEND_TOP_N, RECOMMEND_TTL and RECOMMEND_WORKERS must be valid integers")
+
+# 통계 캐시 설정
+try:
+    STATS_CACHE_TTL = int(os.getenv('STATS_CACHE_TTL', 60))  # 통계를 다시 계산하지 않고 그대로 반환하는 시간 (초)
+    STATS_CACHE_STALE_TTL = int(os.getenv('STATS_CACHE_STALE_TTL', 600))  # 신선 기간 이후 재계산 중에 이전 값을 반환하는 시간 (초)
+    STATS_CACHE_REFRESH_INTERVAL = int(os.getenv('STATS_CACHE_REFRESH_INTERVAL', 10))  # 백그라운드 미리 갱신 확인 주기 (초, 0이면 사용 안 함)
+    STATS_CACHE_LOCK_TIMEOUT = int(os.getenv('STATS_CACHE_LOCK_TIMEOUT', 30))  # 재계산 잠금 만료 시간 (초, 계산 시간보다 길게)
+except ValueError:
+    raise ValueError("STATS_CACHE_TTL, STATS_CACHE_STALE_TTL, STATS_CACHE_REFRESH_INTERVAL "
+                     "and STATS_CACHE_LOCK_TIMEOUT must be valid integers")
@@ -3,6 +3,7 @@ from app.models.user_model import User
 from app.utils.jwt_handler import generate_access_token, generate_refresh_token, decode_token
 from app.utils.redis_client import add_to_blacklist, is_token_blacklisted
 from app.middlewares.auth import jwt_required
+from app.utils.db_pool import PoolTimeoutError
 
 auth_bp = Blueprint('auth', __name__, url_prefix='/api/auth')
 
@@ -66,6 +67,8 @@ def logout():
         add_to_blacklist(refresh_token)  # Refresh Token
 
         return jsonify({"message": "Logged out successfully"}), 200
+    except PoolTimeoutError:
+        raise  # 전역 처리기에서 503 반환
     except Exception as e:
         return jsonify({"error": f"An error occurred: {str(e)}"}), 500
 
@@ -142,6 +145,8 @@ def signup():
 
         return jsonify(result), 201
 
+    except PoolTimeoutError:
+        raise  # 전역 처리기에서 503 반환
     except Exception as e:
         return jsonify({"error": f"An error occurred: {str(e)}"}), 500
 
@@ -194,6 +199,8 @@ def login():
         else:
             return jsonify({"error": "Invalid email or password"}), 401
 
+    except PoolTimeoutError:
+        raise  # 전역 처리기에서 503 반환
     except Exception as e:
         return jsonify({"error": f"An error occurred: {str(e)}"}), 500
 
@@ -254,5 +261,7 @@ def refresh():
             "role": decoded_token['role']
         })
         return jsonify({"access_token": access_token}), 200
+    except PoolTimeoutError:
+        raise  # 전역 처리기에서 503 반환
     except Exception as e:
         return jsonify({"error": f"An error occurred: {str(e)}"}), 500
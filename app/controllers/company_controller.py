@@ -1,9 +1,12 @@
 from flask import Blueprint, jsonify, request
 from app.models.company_model import Company
+from app.utils.conditional import conditional
+from app.utils.db_pool import PoolTimeoutError
 
 company_bp = Blueprint('company', __name__, url_prefix='/api/companies')
 
 @company_bp.route('/', methods=['GET'])
+@conditional(['company'])
 def list_companies():
     """
     ---
@@ -14,12 +17,16 @@ def list_companies():
     responses:
       200:
         description: "List of companies fetched successfully."
+      304:
+        description: "Not modified (If-None-Match / If-Modified-Since matched)."
       500:
         description: "Internal server error."
     """
     try:
         companies = Company.get_all()
         return jsonify(companies), 200
+    except PoolTimeoutError:
+        raise  # 전역 처리기에서 503 반환
     except Exception as e:
         return jsonify({"error": f"An error occurred: {str(e)}"}), 500
 
@@ -51,6 +58,8 @@ def get_company(company_id):
         if not company:
             return jsonify({"error": "Company not found"}), 404
         return jsonify(company), 200
+    except PoolTimeoutError:
+        raise  # 전역 처리기에서 503 반환
     except Exception as e:
         return jsonify({"error": f"An error occurred: {str(e)}"}), 500
 
@@ -92,6 +101,8 @@ def add_company():
             return jsonify({"error": "Name and link are required"}), 400
         result = Company.create(data)
         return jsonify(result), 201
+    except PoolTimeoutError:
+        raise  # 전역 처리기에서 503 반환
     except Exception as e:
         return jsonify({"error": f"An error occurred: {str(e)}"}), 500
 
@@ -138,6 +149,8 @@ def update_company(company_id):
         if "error" in result:
             return jsonify(result), 400
         return jsonify(result), 200
+    except PoolTimeoutError:
+        raise  # 전역 처리기에서 503 반환
     except Exception as e:
         return jsonify({"error": f"An error occurred: {str(e)}"}), 500
 
@@ -170,5 +183,7 @@ def delete_company(company_id):
         if "error" in result:
             return jsonify(result), 400
         return jsonify(result), 200
+    except PoolTimeoutError:
+        raise  # 전역 처리기에서 503 반환
     except Exception as e:
         return jsonify({"error": f"An error occurred: {str(e)}"}), 500
@@ -1,32 +1,51 @@
-from flask import Blueprint, jsonify, request
+import csv
+import io
+from datetime import date
+from flask import Blueprint, Response, current_app, jsonify, request, stream_with_context
 from app.models.job_model import Job
 from app.models.application_model import Application
 from app.middlewares.auth import jwt_required
+from app.utils.pagination import encode_cursor, decode_cursor, InvalidCursorError
+from app.utils.fields import parse_fields, project, InvalidFieldsError
+from app.utils.conditional import conditional
+from app.search.index import job_index
+from app.search.suggest import job_suggest
+from app.search.similar import MAX_NEIGHBOURS
+from app.utils.db_pool import PoolTimeoutError
 
 # Blueprint: API 엔드포인트 그룹화
 job_bp = Blueprint('job', __name__, url_prefix='/api/jobs')
 
 @job_bp.route('/', methods=['GET'])
+@conditional(['job', 'company'])
 def list_jobs():
     """
     ---
     tags:
       - Jobs
     summary: "List Jobs"
-    description: "Retrieve a list of jobs with pagination and sorting."
+    description: >
+      Retrieve a list of jobs with pagination and sorting.
+      Pass `cursor` (empty for the first page, then `next_cursor` from the previous response)
+      to use keyset pagination instead of page/size offsets.
     parameters:
       - in: query
         name: page
         schema:
           type: integer
           default: 1
-        description: "Page number."
+        description: "Page number (ignored when cursor is given)."
+      - in: query
+        name: cursor
+        schema:
+          type: string
+        description: "Opaque cursor returned as next_cursor by the previous page."
       - in: query
         name: size
         schema:
           type: integer
           default: 20
-        description: "Number of items per page."
+        description: "Number of items per page (capped at SEARCH_MAX_PAGE_SIZE)."
       - in: query
         name: sort_by
         schema:
@@ -40,26 +59,79 @@ def list_jobs():
           enum: [asc, desc]
           default: "desc"
         description: "Sort order."
+      - in: query
+        name: fields
+        schema:
+          type: string
+        description: "Comma-separated job fields to return (e.g. id,title,deadline)."
+      - in: query
+        name: include
+        schema:
+          type: string
+        description: "Comma-separated relations to embed: tech, locations, company."
     responses:
       200:
         description: "List of jobs retrieved successfully."
+      304:
+        description: "Not modified (If-None-Match / If-Modified-Since matched)."
+      400:
+        description: "Invalid page, size, order, fields, include or cursor parameter."
       500:
         description: "Internal server error."
     """
     try:
-        page = int(request.args.get('page', 1))
-        size = int(request.args.get('size', 20))
+        try:
+            page = int(request.args.get('page', 1))
+            size = int(request.args.get('size', 20))
+        except ValueError:
+            return jsonify({"error": "page and size must be integers"}), 400
+        if page < 1 or size < 1:
+            return jsonify({"error": "page and size must be positive"}), 400
+        size = min(size, current_app.config.get('SEARCH_MAX_PAGE_SIZE', 100))  # 서버 측 최대 페이지 크기
+
         sort_by = request.args.get('sort_by', 'id')
         order = request.args.get('order', 'desc')
 
         if order not in ['asc', 'desc']:
             return jsonify({"error": "Invalid order parameter"}), 400
 
-        jobs = Job.get_all_sorted(page, size, sort_by, order)
+        try:
+            fields = parse_fields(request.args.get('fields'), Job.FIELDS)
+            include = parse_fields(request.args.get('include'), tuple(Job.INCLUDES), label='include')
+        except InvalidFieldsError as e:
+            return jsonify({"error": str(e)}), 400
+        query_fields, output_fields = _relation_fields(fields, include)
+
+        # 커서 페이지네이션
+        if 'cursor' in request.args:
+            if sort_by not in Job.SORT_FIELDS:
+                sort_by = 'id'  # 기본값
+
+            cursor = request.args.get('cursor')
+            try:
+                after = decode_cursor(cursor, sort_by, order) if cursor else None
+            except InvalidCursorError as e:
+                return jsonify({"error": str(e)}), 400
+
+            jobs = Job.get_all_by_cursor(after, size, sort_by, order, query_fields)
+            has_next = len(jobs) > size
+            jobs = Job.attach_relations(jobs[:size], include)
+            next_cursor = encode_cursor(sort_by, order, jobs[-1]) if has_next else None
+
+            return jsonify({
+                "data": project(jobs, output_fields),
+                "pagination": {
+                    "page_size": size,
+                    "next_cursor": next_cursor
+                }
+            }), 200
+
+        jobs = Job.get_all_sorted(page, size, sort_by, order, query_fields)
+        jobs = Job.attach_relations(jobs, include)
         total_count = Job.get_total_count()
 
         return jsonify({
-            "data": jobs,
+            "data": project(jobs, output_fields),
             "pagination": {
                 "current_page": page,
                 "page_size": size,
@@ -67,9 +139,27 @@ def list_jobs():
                 "total_pages": (total_count + size - 1) // size
             }
         }), 200
+    except PoolTimeoutError:
+        raise  # 전역 처리기에서 503 반환
     except Exception as e:
         return jsonify({"error": f"An error occurred: {str(e)}"}), 500
 
+def _relation_fields(fields, include):
+    """
+    fields와 include를 함께 쓸 때 조회할 컬럼과 응답에 남길 키 계산
+    - 관계 연결에 필요한 id/company 컬럼은 조회하되, 요청하지 않았으면 응답에서 제외
+    Returns:
+        tuple: (조회할 필드 목록, 응답 필드 목록), fields가 없으면 (None, None)
+    """
+    if not fields:
+        return None, None
+
+    query_fields = list(fields) + ['id']
+    if include and 'company' in include:
+        query_fields.append('company')
+    output_fields = list(fields) + [Job.INCLUDES[name] for name in include or []]
+    return list(dict.fromkeys(query_fields)), output_fields
+
 @job_bp.route('/', methods=['POST'])
 @jwt_required(required_roles=['admin', 'employer'])
 def add_job():
@@ -175,6 +265,8 @@ def add_job():
         result = Job.create(job_data)
         return jsonify(result), 201
 
+    except PoolTimeoutError:
+        raise  # 전역 처리기에서 503 반환
     except Exception as e:
         return jsonify({"error": f"Failed to create job: {str(e)}"}), 500
 
@@ -253,6 +345,8 @@ def update_job(job_id):
 
         return jsonify({"message": "Job updated successfully"}), 200
 
+    except PoolTimeoutError:
+        raise  # 전역 처리기에서 503 반환
     except Exception as e:
         return jsonify({"error": f"An error occurred: {str(e)}"}), 500
 
@@ -287,10 +381,67 @@ def delete_job(job_id):
 
         return jsonify({"message": "Job deleted successfully"}), 200
 
+    except PoolTimeoutError:
+        raise  # 전역 처리기에서 503 반환
+    except Exception as e:
+        return jsonify({"error": f"An error occurred: {str(e)}"}), 500
+
+@job_bp.route('/suggest', methods=['GET'])
+def suggest_jobs():
+    """
+    ---
+    tags:
+      - Jobs
+    summary: "Autocomplete Job Titles and Companies"
+    description: >
+      Returns job titles and company names that start with (or have a word starting with) the query,
+      ranked by the number of postings. Served from an in-memory prefix index without querying MySQL.
+      The index is built in the background at startup; until it is ready the list is empty.
+    parameters:
+      - in: query
+        name: q
+        required: true
+        schema:
+          type: string
+        description: "Text typed so far."
+      - in: query
+        name: limit
+        schema:
+          type: integer
+          default: 10
+        description: "Maximum number of suggestions (up to 20)."
+    responses:
+      200:
+        description: "Suggestions returned successfully."
+      400:
+        description: "Invalid limit parameter."
+      500:
+        description: "Internal server error."
+    """
+    try:
+        try:
+            limit = min(int(request.args.get('limit', 10)), 20)
+        except ValueError:
+            return jsonify({"error": "limit must be an integer"}), 400
+        if limit < 1:
+            return jsonify({"error": "limit must be positive"}), 400
+
+        # 색인 구성 중에는 요청 경로에서 DB를 읽지 않고 빈 목록 반환 (캐시하지 않음)
+        if not job_index.ready():
+            response = jsonify({"suggestions": []})
+            response.headers['Cache-Control'] = 'no-store'
+            return response, 200
+
+        response = jsonify({"suggestions": job_suggest.suggest(request.args.get('q', ''), limit)})
+        response.headers['Cache-Control'] = 'public, max-age=30'
+        return response, 200
+    except PoolTimeoutError:
+        raise  # 전역 처리기에서 503 반환
     except Exception as e:
         return jsonify({"error": f"An error occurred: {str(e)}"}), 500
 
 @job_bp.route('/search', methods=['GET'])
+@conditional(['job', 'company'])
 def search_jobs():
     """
     --- 
@@ -308,43 +459,344 @@ def search_jobs():
         name: location
         schema:
           type: string
-        description: "Location filter (ID)."
+        description: "Location filter: one or more IDs separated by commas (e.g. 3,7)."
+      - in: query
+        name: location_mode
+        schema:
+          type: string
+          enum: [any, all]
+          default: "any"
+        description: "Match jobs with any (OR) or all (AND) of the given location IDs."
       - in: query
         name: tech
         schema:
           type: string
-        description: "Technology filter (ID)."
+        description: "Technology filter: one or more IDs separated by commas (e.g. 3,7)."
+      - in: query
+        name: tech_mode
+        schema:
+          type: string
+          enum: [any, all]
+          default: "any"
+        description: "Match jobs with any (OR) or all (AND) of the given tech IDs."
       - in: query
         name: career_condition
         schema:
           type: string
         description: "Keyword for career condition (e.g., '3년') (partial match)."
+      - in: query
+        name: career_min
+        schema:
+          type: integer
+        description: "Minimum required years of experience, lower bound (parsed from career_condition)."
+      - in: query
+        name: career_max
+        schema:
+          type: integer
+        description: "Minimum required years of experience, upper bound (e.g. 3 for jobs open to 3-year developers)."
+      - in: query
+        name: closing_before
+        schema:
+          type: string
+          format: date
+        description: "Only jobs whose parsed deadline is on or before this date (YYYY-MM-DD)."
+      - in: query
+        name: page
+        schema:
+          type: integer
+          default: 1
+        description: "Page number."
+      - in: query
+        name: size
+        schema:
+          type: integer
+          default: 20
+        description: "Page size (capped at SEARCH_MAX_PAGE_SIZE)."
+      - in: query
+        name: sort_by
+        schema:
+          type: string
+          enum: [id, title, deadline, job_sector, deadline_date, relevance]
+        description: "Sort field. Defaults to relevance when a keyword is given, otherwise id. relevance uses FULLTEXT scores with SEARCH_BACKEND=fulltext, BM25 over title, company name and sector with SEARCH_BACKEND=index, and id order with like."
+      - in: query
+        name: order
+        schema:
+          type: string
+          enum: [asc, desc]
+          default: "desc"
+        description: "Sort order."
+      - in: query
+        name: cursor
+        schema:
+          type: string
+        description: "Keyset pagination cursor (empty for the first page, then next_cursor). relevance is not supported with cursors."
+      - in: query
+        name: count
+        schema:
+          type: string
+          enum: [exact, approx]
+        description: "Return the number of matches in the X-Total-Count header (approx uses the optimizer estimate)."
+      - in: query
+        name: include
+        schema:
+          type: string
+        description: "Comma-separated relations to embed: tech, locations, company."
+      - in: query
+        name: facets
+        schema:
+          type: string
+        description: "Comma-separated facets to count over the whole result set: tech, location, career, sector. All requested facets are computed together in a single pass (one query, or one scan of the in-memory index)."
     responses:
       200:
         description: "Search results returned successfully."
+      400:
+        description: "Invalid pagination, sort or cursor parameter."
+      304:
+        description: "Not modified (If-None-Match / If-Modified-Since matched)."
       500:
         description: "Internal server error."
     """
     try:
-        keyword = request.args.get('keyword', '').strip()
-        location = request.args.get('location')
-        tech = request.args.get('tech')
-        career_condition = request.args.get('career_condition')
-
-        filters = {
-            "keyword": keyword,
-            "location": location,
-            "tech": tech,
-            "career_condition": career_condition
-        }
-        results = Job.search_and_filter(filters)
+        try:
+            filters = _search_filters(request.args)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        keyword = filters['keyword']
+
+        count_mode = request.args.get('count')
+        if count_mode not in (None, 'exact', 'approx'):
+            return jsonify({"error": "Invalid count parameter"}), 400
+
+        try:
+            page = int(request.args.get('page', 1))
+            size = int(request.args.get('size', 20))
+        except ValueError:
+            return jsonify({"error": "page and size must be integers"}), 400
+        if page < 1 or size < 1:
+            return jsonify({"error": "page and size must be positive"}), 400
+        size = min(size, current_app.config.get('SEARCH_MAX_PAGE_SIZE', 100))  # 서버 측 최대 페이지 크기
+
+        sort_by = request.args.get('sort_by', 'relevance' if keyword else 'id')
+        order = request.args.get('order', 'desc')
+        if order not in ['asc', 'desc']:
+            return jsonify({"error": "Invalid order parameter"}), 400
+
+        try:
+            include = parse_fields(request.args.get('include'), tuple(Job.INCLUDES), label='include')
+            facets = parse_fields(request.args.get('facets'), Job.FACETS, label='facet')
+        except InvalidFieldsError as e:
+            return jsonify({"error": str(e)}), 400
+
+        # 커서 페이지네이션 (전체 결과 수는 검색 조건별로 캐시되어 페이지 간 재사용)
+        if 'cursor' in request.args:
+            if sort_by not in Job.SORT_FIELDS:
+                sort_by = 'id'  # 관련도 순은 커서를 지원하지 않음
+
+            cursor = request.args.get('cursor')
+            try:
+                after = decode_cursor(cursor, sort_by, order) if cursor else None
+            except InvalidCursorError as e:
+                return jsonify({"error": str(e)}), 400
+
+            total_count = Job.count_search(filters)
+            results = Job.search_by_cursor(filters, after, size, sort_by, order)
+            has_next = len(results) > size
+            results = Job.attach_relations(results[:size], include)
+            pagination = {
+                "page_size": size,
+                "total_items": total_count,
+                "next_cursor": encode_cursor(sort_by, order, results[-1]) if has_next else None
+            }
+        else:
+            # 결과 ID 목록과 전체 수는 Redis 검색 결과 캐시에서 재사용
+            results, total_count = Job.search_sorted(filters, page, size, sort_by, order)
+            results = Job.attach_relations(results, include)
+            pagination = {
+                "current_page": page,
+                "page_size": size,
+                "total_items": total_count,
+                "total_pages": (total_count + size - 1) // size
+            }
+
+        body = {"data": results, "pagination": pagination}
+        if facets:
+            body["facets"] = Job.search_facets(filters, facets, current_app.config.get('SEARCH_FACET_LIMIT', 20))
+        response = jsonify(body)
+
+        # 결과 수 헤더 (exact는 캐시된 전체 수, approx는 COUNT(*) 없이 추정)
+        if count_mode:
+            approximate = count_mode == 'approx'
+            response.headers['X-Total-Count'] = Job.count_filtered(filters, approximate=True) if approximate else total_count
+            response.headers['X-Total-Count-Approximate'] = str(approximate).lower()
 
-        return jsonify(results), 200
+        return response, 200
 
+    except PoolTimeoutError:
+        raise  # 전역 처리기에서 503 반환
     except Exception as e:
         return jsonify({"error": f"An error occurred: {str(e)}"}), 500
 
+def _search_filters(args):
+    """
+    쿼리 파라미터를 Job 검색 필터로 변환
+    - tech/location은 쉼표로 구분한 여러 ID (예: tech=3,7), tech_mode/location_mode는 any(OR, 기본) 또는 all(AND)
+    - career_min/career_max는 요구 최소 경력 연수 범위, closing_before는 마감일 상한 (YYYY-MM-DD)
+    Args:
+        args (MultiDict): request.args
+    Returns:
+        dict: keyword, location, location_mode, tech, tech_mode, career_condition, career_min, career_max, closing_before
+    Raises:
+        ValueError: ID 또는 mode 값이 잘못된 경우
+    """
+    filters = {
+        "keyword": args.get('keyword', '').strip(),
+        "career_condition": args.get('career_condition')
+    }
+    for name in ('location', 'tech'):
+        raw = args.get(name) or ''
+        try:
+            ids = sorted({int(value) for value in raw.split(',') if value.strip()})
+        except ValueError:
+            raise ValueError(f"Invalid {name} parameter")
+
+        mode = args.get(f"{name}_mode", 'any')
+        if mode not in ('any', 'all'):
+            raise ValueError(f"Invalid {name}_mode parameter")
+
+        filters[name] = ids
+        filters[f"{name}_mode"] = mode if len(ids) > 1 else None  # 값이 하나면 mode는 결과에 영향 없음
+
+    # 요구 경력 연수 범위와 마감일 상한 (구조화 컬럼)
+    for name in ('career_min', 'career_max'):
+        raw = args.get(name)
+        try:
+            filters[name] = int(raw) if raw not in (None, '') else None
+        except ValueError:
+            raise ValueError(f"Invalid {name} parameter")
+        if filters[name] is not None and filters[name] < 0:
+            raise ValueError(f"Invalid {name} parameter")
+
+    raw = args.get('closing_before')
+    try:
+        filters['closing_before'] = date.fromisoformat(raw) if raw else None
+    except ValueError:
+        raise ValueError("Invalid closing_before parameter (expected YYYY-MM-DD)")
+    return filters
+
+@job_bp.route('/export', methods=['GET'])
+def export_jobs():
+    """
+    ---
+    tags:
+      - Jobs
+    summary: "Export Jobs"
+    description: >
+      Streams the whole job catalogue (or the subset matching the search filters) as NDJSON or CSV.
+      Rows are read from an unbuffered server-side cursor and flushed in chunks, so memory use is constant.
+    parameters:
+      - in: query
+        name: format
+        schema:
+          type: string
+          enum: [ndjson, csv]
+          default: "ndjson"
+        description: "Output format."
+      - in: query
+        name: keyword
+        schema:
+          type: string
+        description: "Search keyword for job titles or company names (partial match)."
+      - in: query
+        name: location
+        schema:
+          type: string
+        description: "Location filter: one or more IDs separated by commas (e.g. 3,7)."
+      - in: query
+        name: location_mode
+        schema:
+          type: string
+          enum: [any, all]
+          default: "any"
+        description: "Match jobs with any (OR) or all (AND) of the given location IDs."
+      - in: query
+        name: tech
+        schema:
+          type: string
+        description: "Technology filter: one or more IDs separated by commas (e.g. 3,7)."
+      - in: query
+        name: tech_mode
+        schema:
+          type: string
+          enum: [any, all]
+          default: "any"
+        description: "Match jobs with any (OR) or all (AND) of the given tech IDs."
+      - in: query
+        name: career_condition
+        schema:
+          type: string
+        description: "Keyword for career condition (partial match)."
+      - in: query
+        name: career_min
+        schema:
+          type: integer
+        description: "Minimum required years of experience, lower bound (parsed from career_condition)."
+      - in: query
+        name: career_max
+        schema:
+          type: integer
+        description: "Minimum required years of experience, upper bound (e.g. 3 for jobs open to 3-year developers)."
+      - in: query
+        name: closing_before
+        schema:
+          type: string
+          format: date
+        description: "Only jobs whose parsed deadline is on or before this date (YYYY-MM-DD)."
+    responses:
+      200:
+        description: "Export stream started."
+      400:
+        description: "Invalid format or filter parameter."
+    """
+    export_format = request.args.get('format', 'ndjson')
+    if export_format not in ('ndjson', 'csv'):
+        return jsonify({"error": "Invalid format parameter"}), 400
+
+    try:
+        filters = _search_filters(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    chunk_size = current_app.config.get('EXPORT_CHUNK_SIZE', 1000)
+
+    def generate_ndjson():
+        chunks = Job.iter_search(filters, chunk_size)
+        columns = next(chunks)
+        for rows in chunks:
+            yield "".join(current_app.json.dumps(dict(zip(columns, row))) + "\n" for row in rows)
+
+    def generate_csv():
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        chunks = Job.iter_search(filters, chunk_size)
+        writer.writerow(next(chunks))
+        for rows in chunks:
+            writer.writerows(rows)
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+        if buffer.tell():
+            yield buffer.getvalue()  # 결과가 없으면 헤더만 전송
+
+    if export_format == 'csv':
+        generate, mimetype = generate_csv, 'text/csv'
+    else:
+        generate, mimetype = generate_ndjson, 'application/x-ndjson'
+
+    response = Response(stream_with_context(generate()), mimetype=mimetype)
+    response.headers['Content-Disposition'] = f'attachment; filename="jobs.{export_format}"'
+    return response
+
 @job_bp.route('/<int:job_id>', methods=['GET'])
+@conditional(lambda job_id: [f'job:{job_id}', 'company'])
 def get_job_details(job_id):
     """
     ---
@@ -362,6 +814,8 @@ def get_job_details(job_id):
     responses:
       200:
         description: "Job details returned successfully."
+      304:
+        description: "Not modified (If-None-Match / If-Modified-Since matched)."
       404:
         description: "Job not found."
       500:
@@ -374,6 +828,70 @@ def get_job_details(job_id):
 
         return jsonify(job_details), 200
 
+    except PoolTimeoutError:
+        raise  # 전역 처리기에서 503 반환
+    except Exception as e:
+        return jsonify({"error": f"An error occurred: {str(e)}"}), 500
+
+@job_bp.route('/<int:job_id>/similar', methods=['GET'])
+@conditional(['job', 'company'])
+def get_similar_jobs(job_id):
+    """
+    ---
+    tags:
+      - Jobs
+    summary: "Get Similar Jobs"
+    description: >
+      Returns jobs that share techs, locations, company and sectors with the given job,
+      ranked by Jaccard similarity. Neighbour lists are precomputed from the in-memory job index and cached.
+      Returns 503 (with Retry-After) while the index is still being built at startup.
+    parameters:
+      - in: path
+        name: job_id
+        required: true
+        schema:
+          type: integer
+        description: "The ID of the job to find similar jobs for."
+      - in: query
+        name: limit
+        schema:
+          type: integer
+          default: 10
+        description: "Maximum number of similar jobs (up to 50)."
+    responses:
+      200:
+        description: "Similar jobs returned successfully."
+      304:
+        description: "Not modified (If-None-Match / If-Modified-Since matched)."
+      400:
+        description: "Invalid limit parameter."
+      404:
+        description: "Job not found."
+      500:
+        description: "Internal server error."
+      503:
+        description: "Similar jobs index is being built."
+    """
+    try:
+        try:
+            limit = min(int(request.args.get('limit', 10)), MAX_NEIGHBOURS)
+        except ValueError:
+            return jsonify({"error": "limit must be an integer"}), 400
+        if limit < 1:
+            return jsonify({"error": "limit must be positive"}), 400
+
+        if not job_index.ready():
+            response = jsonify({"error": "Similar jobs index is being built, please retry"})
+            response.headers['Retry-After'] = '5'
+            return response, 503
+
+        jobs = Job.get_similar(job_id, limit)
+        if jobs is None:
+            return jsonify({"error": "Job not found"}), 404
+
+        return jsonify({"data": jobs}), 200
+    except PoolTimeoutError:
+        raise  # 전역 처리기에서 503 반환
     except Exception as e:
         return jsonify({"error": f"An error occurred: {str(e)}"}), 500
 
@@ -423,6 +941,8 @@ def get_applications_by_job(job_id):
 
         logging.info(f"User {request.user['id']} accessed applications for Job {job_id}")
         return jsonify(applications), 200
+    except PoolTimeoutError:
+        raise  # 전역 처리기에서 503 반환
     except Exception as e:
         logging.error(f"Error while retrieving applications for Job {job_id}: {str(e)}")
         return jsonify({"error": f"An error occurred: {str(e)}"}), 500
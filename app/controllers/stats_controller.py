@@ -1,64 +1,123 @@
 from flask import Blueprint, jsonify
 from app.models.stats_model import Stats
+from app.middlewares.auth import jwt_required
+from app.utils.db import pool_stats
+from app.utils.conditional import conditional
+from app.utils import swr_cache
+from app.search import result_cache
+from app.utils.db_pool import PoolTimeoutError
 
 stats_bp = Blueprint('stats', __name__, url_prefix='/api/stats')
 
 @stats_bp.route('/companies', methods=['GET'])
+@conditional(['job', 'company'])
 def company_stats():
     """
     ---
     tags:
       - Statistics
     summary: "Company Statistics"
-    description: "Retrieves the number of job postings for each company."
+    description: "Retrieves the number of job postings for each company (company_id, company_name, job_count, percentage), read from a count table maintained on job writes and cached with stale-while-revalidate (a stale value may be served while it is recomputed in the background)."
     responses:
       200:
         description: "Company statistics retrieved successfully."
+      304:
+        description: "Not modified (If-None-Match / If-Modified-Since matched)."
       500:
         description: "Internal server error."
     """
     try:
-        stats = Stats.get_company_job_count()
+        stats = swr_cache.get_or_compute('stats:companies', Stats.get_company_job_count, ['job', 'company'])
         return jsonify(stats), 200
+    except PoolTimeoutError:
+        raise  # 전역 처리기에서 503 반환
     except Exception as e:
         return jsonify({"error": f"An error occurred: {str(e)}"}), 500
 
 @stats_bp.route('/techs', methods=['GET'])
+@conditional(['job'])
 def tech_stats():
     """
     ---
     tags:
       - Statistics
     summary: "Technology Statistics"
-    description: "Retrieves the number of job postings for each technology."
+    description: "Retrieves the number of job postings for each technology (tech_id, tech_name, job_count, percentage), read from a count table maintained on job writes and cached with stale-while-revalidate (a stale value may be served while it is recomputed in the background)."
     responses:
       200:
         description: "Technology statistics retrieved successfully."
+      304:
+        description: "Not modified (If-None-Match / If-Modified-Since matched)."
       500:
         description: "Internal server error."
     """
     try:
-        stats = Stats.get_tech_job_count()
+        stats = swr_cache.get_or_compute('stats:techs', Stats.get_tech_job_count, ['job'])
         return jsonify(stats), 200
+    except PoolTimeoutError:
+        raise  # 전역 처리기에서 503 반환
     except Exception as e:
         return jsonify({"error": f"An error occurred: {str(e)}"}), 500
 
 @stats_bp.route('/jobs', methods=['GET'])
+@conditional(['job', 'application'])
 def job_application_stats():
     """
     ---
     tags:
       - Statistics
     summary: "Job Application Statistics"
-    description: "Retrieves the number of applications for each job posting."
+    description: "Retrieves the number of applications for each job posting (job_id, job_title, application_count, percentage), read from a count table maintained on application writes and cached with stale-while-revalidate (a stale value may be served while it is recomputed in the background)."
     responses:
       200:
         description: "Job application statistics retrieved successfully."
+      304:
+        description: "Not modified (If-None-Match / If-Modified-Since matched)."
       500:
         description: "Internal server error."
     """
     try:
-        stats = Stats.get_job_application_count()
+        stats = swr_cache.get_or_compute('stats:jobs', Stats.get_job_application_count, ['job', 'application'])
         return jsonify(stats), 200
+    except PoolTimeoutError:
+        raise  # 전역 처리기에서 503 반환
     except Exception as e:
-        return jsonify({"error": f"An error occurred: {str(e)}"}), 500
\ No newline at end of file
+        return jsonify({"error": f"An error occurred: {str(e)}"}), 500
+
+@stats_bp.route('/db-pool', methods=['GET'])
+@jwt_required(required_roles=['admin'])  # 관리자 권한 필요
+def db_pool_stats():
+    """
+    ---
+    tags:
+      - Statistics
+    summary: "Database Pool Statistics"
+    description: "Retrieves live connection pool counters (in-use/idle connections, checkouts, timeouts, wait-time histogram)."
+    security:
+      - bearerAuth: []
+    responses:
+      200:
+        description: "Pool statistics retrieved successfully."
+      403:
+        description: "Permission denied."
+    """
+    return jsonify(pool_stats()), 200
+
+@stats_bp.route('/search-cache', methods=['GET'])
+@jwt_required(required_roles=['admin'])  # 관리자 권한 필요
+def search_cache_stats():
+    """
+    ---
+    tags:
+      - Statistics
+    summary: "Search Result Cache Statistics"
+    description: "Retrieves search result cache hit/miss counters and hit ratio for the serving worker process."
+    security:
+      - bearerAuth: []
+    responses:
+      200:
+        description: "Cache statistics retrieved successfully."
+      403:
+        description: "Permission denied."
+    """
+    return jsonify(result_cache.stats()), 200
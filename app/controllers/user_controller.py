@@ -1,6 +1,11 @@
 from flask import Blueprint, jsonify, request
 from app.models.user_model import User
+from app.models.application_model import Application
+from app.models.job_model import Job
 from app.middlewares.auth import jwt_required
+from app.utils.fields import parse_fields, InvalidFieldsError
+from app.config import RECOMMEND_TOP_N
+from app.utils.db_pool import PoolTimeoutError
 
 user_bp = Blueprint('user', __name__, url_prefix='/api/users')
 
@@ -44,6 +49,8 @@ def get_user_details(user_id):
             return jsonify({"error": "User not found"}), 404
 
         return jsonify(user.to_dict()), 200
+    except PoolTimeoutError:
+        raise  # 전역 처리기에서 503 반환
     except Exception as e:
         return jsonify({"error": f"An error occurred: {str(e)}"}), 500
 
@@ -149,6 +156,8 @@ def update_user(user_id):
             return jsonify(result), 400
 
         return jsonify({"message": "User profile updated successfully"}), 200
+    except PoolTimeoutError:
+        raise  # 전역 처리기에서 503 반환
     except Exception as e:
         return jsonify({"error": f"An error occurred: {str(e)}"}), 500
 
@@ -197,6 +206,8 @@ def delete_user(user_id):
             return jsonify(result), 400
 
         return jsonify({"message": "User account deleted successfully"}), 200
+    except PoolTimeoutError:
+        raise  # 전역 처리기에서 503 반환
     except Exception as e:
         return jsonify({"error": f"An error occurred: {str(e)}"}), 500
 
@@ -265,16 +276,28 @@ def list_bookmarks(user_id):
         schema:
           type: integer
         description: "The ID of the user."
+      - in: query
+        name: fields
+        schema:
+          type: string
+        description: "Comma-separated job fields to return (e.g. id,title,deadline)."
     responses:
       200:
         description: "Bookmarks retrieved successfully."
+      400:
+        description: "Invalid fields parameter."
       403:
         description: "Permission denied."
     """
     if user_id != request.user['id']:
         return jsonify({"error": "Permission denied"}), 403
 
-    bookmarks = User.get_bookmarks(user_id)
+    try:
+        fields = parse_fields(request.args.get('fields'), Job.FIELDS)
+    except InvalidFieldsError as e:
+        return jsonify({"error": str(e)}), 400
+
+    bookmarks = User.get_bookmarks(user_id, fields)
     return jsonify(bookmarks), 200
 
 @user_bp.route('/<int:user_id>/applications', methods=['POST'])
@@ -349,16 +372,28 @@ def list_applications(user_id):
         schema:
           type: integer
         description: "The ID of the user."
+      - in: query
+        name: fields
+        schema:
+          type: string
+        description: "Comma-separated fields to return (job fields and content)."
     responses:
       200:
         description: "Applications retrieved successfully."
+      400:
+        description: "Invalid fields parameter."
       403:
         description: "Permission denied."
     """
     if user_id != request.user['id']:
         return jsonify({"error": "Permission denied"}), 403
 
-    applications = User.get_applications(user_id)
+    try:
+        fields = parse_fields(request.args.get('fields'), Application.FIELDS)
+    except InvalidFieldsError as e:
+        return jsonify({"error": str(e)}), 400
+
+    applications = User.get_applications(user_id, fields)
     return jsonify(applications), 200
 
 @user_bp.route('/<int:user_id>/applications/<int:job_id>', methods=['DELETE'])
@@ -397,3 +432,55 @@ def delete_application(user_id, job_id):
         return jsonify(result), 400
 
     return jsonify(result), 200
+
+@user_bp.route('/<int:user_id>/recommendations', methods=['GET'])
+@jwt_required()
+def get_recommendations(user_id):
+    """
+    ---
+    tags:
+      - Users
+    summary: "Get Job Recommendations"
+    description: >
+      Returns jobs recommended from the user's bookmarks and applications (item-item collaborative filtering).
+      Lists are precomputed by a batch job and refreshed when the user toggles a bookmark or applies;
+      users without recommendations get the most bookmarked/applied jobs.
+    parameters:
+      - in: path
+        name: user_id
+        required: true
+        schema:
+          type: integer
+        description: "The ID of the user."
+      - in: query
+        name: limit
+        schema:
+          type: integer
+          default: 20
+        description: "Maximum number of jobs (up to RECOMMEND_TOP_N)."
+    responses:
+      200:
+        description: "Recommendations retrieved successfully."
+      400:
+        description: "Invalid limit parameter."
+      403:
+        description: "Permission denied."
+      500:
+        description: "Internal server error."
+    """
+    if user_id != request.user['id']:
+        return jsonify({"error": "Permission denied"}), 403
+
+    try:
+        try:
+            limit = min(int(request.args.get('limit', 20)), RECOMMEND_TOP_N)
+        except ValueError:
+            return jsonify({"error": "limit must be an integer"}), 400
+        if limit < 1:
+            return jsonify({"error": "limit must be positive"}), 400
+
+        return jsonify(User.get_recommendations(user_id, limit)), 200
+    except PoolTimeoutError:
+        raise  # 전역 처리기에서 503 반환
+    except Exception as e:
+        return jsonify({"error": f"An error occurred: {str(e)}"}), 500
@@ -1,6 +1,14 @@
 from app.utils.db import get_db
+from app.utils.fields import select_columns
+from app.utils.conditional import bump_generation
+from app.search.recommend import recommender
+from app.models.stats_model import Stats
+from app.utils.db_pool import PoolTimeoutError
 
 class Application:
+    # fields 파라미터로 선택할 수 있는 필드 (공고 필드 + 지원 내용)
+    FIELDS = ('id', 'company', 'creator', 'title', 'link', 'career_condition', 'education', 'deadline', 'job_sector', 'content')
+
     @staticmethod
     def add(user_id, job_id, content):
         """
@@ -25,27 +33,41 @@ class Application:
                 "INSERT INTO application (user, job, content) VALUES (%s, %s, %s)",
                 (user_id, job_id, content)
             )
+            Stats.adjust_job_applications(cursor, job_id, 1)
             db.commit()
+            bump_generation('application')
+            recommender.refresh_user(user_id)
             return {"message": "Application added"}
+        except PoolTimeoutError:
+            raise  # 전역 처리기에서 503 반환
         except Exception as e:
             return {"error": f"Failed to add application: {str(e)}"}
         finally:
             cursor.close()
 
     @staticmethod
-    def get_by_user(user_id):
+    def get_by_user(user_id, fields=None):
         """
         특정 사용자의 지원 내역 조회
         Args:
             user_id (int): 사용자 ID
+            fields (list, optional): 조회할 필드 목록 (기본값: 전체)
         Returns:
             list: 지원 내역 목록
         """
-        db = get_db()
+        if fields:
+            job_fields = [field for field in fields if field != 'content']
+            columns = ", ".join(
+                [f"job.{field}" for field in job_fields] + (["a.content"] if 'content' in fields else [])
+            )
+        else:
+            columns = f"{select_columns(None, 'job')}, a.content"
+
+        db = get_db(read_only=True)
         cursor = db.cursor(dictionary=True)
         try:
-            cursor.execute("""
-                SELECT job.*, a.content FROM job
+            cursor.execute(f"""
+                SELECT {columns} FROM job
                 JOIN application a ON job.id = a.job
                 WHERE a.user = %s
             """, (user_id,))
@@ -67,8 +89,14 @@ class Application:
         cursor = db.cursor()
         try:
             cursor.execute("DELETE FROM application WHERE user = %s AND job = %s", (user_id, job_id))
+            if cursor.rowcount:
+                Stats.adjust_job_applications(cursor, job_id, -1)
             db.commit()
+            bump_generation('application')
+            recommender.refresh_user(user_id)
             return {"message": "Application deleted"}
+        except PoolTimeoutError:
+            raise  # 전역 처리기에서 503 반환
         except Exception as e:
             return {"error": f"Failed to delete application: {str(e)}"}
         finally:
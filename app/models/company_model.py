@@ -1,4 +1,9 @@
 from app.utils.db import get_db
+from app.models.job_model import Job
+from app.utils.conditional import bump_generation
+from app.search.index import job_index
+from app.models.stats_model import Stats
+from app.utils.db_pool import PoolTimeoutError
 
 class Company:
     @staticmethod
@@ -43,8 +48,13 @@ class Company:
                 "INSERT INTO company (name, link) VALUES (%s, %s)",
                 (name, link)
             )
+            company_id = cursor.lastrowid
+            Stats.add_company(cursor, company_id)
             db.commit()
-            return cursor.lastrowid  # 새로 생성된 회사 ID 반환
+            bump_generation('company')
+            return company_id  # 새로 생성된 회사 ID 반환
+        except PoolTimeoutError:
+            raise  # 전역 처리기에서 503 반환
         except Exception as e:
             raise Exception(f"Failed to get or create company: {str(e)}")
         finally:
@@ -52,7 +62,7 @@ class Company:
 
     @staticmethod
     def get_all():
-        db = get_db()
+        db = get_db(read_only=True)
         cursor = db.cursor(dictionary=True)
         try:
             cursor.execute("SELECT * FROM company")
@@ -62,7 +72,7 @@ class Company:
 
     @staticmethod
     def get_by_id(company_id):
-        db = get_db()
+        db = get_db(read_only=True)
         cursor = db.cursor(dictionary=True)
         try:
             cursor.execute("SELECT * FROM company WHERE id = %s", (company_id,))
@@ -79,8 +89,13 @@ class Company:
                 "INSERT INTO company (name, link) VALUES (%s, %s)",
                 (data['name'], data['link'])
             )
+            company_id = cursor.lastrowid
+            Stats.add_company(cursor, company_id)
             db.commit()
-            return {"message": "Company created successfully", "id": cursor.lastrowid}
+            bump_generation('company')
+            return {"message": "Company created successfully", "id": company_id}
+        except PoolTimeoutError:
+            raise  # 전역 처리기에서 503 반환
         except Exception as e:
             return {"error": f"Failed to create company: {str(e)}"}
         finally:
@@ -94,8 +109,15 @@ class Company:
             set_clause = ", ".join(f"{key} = %s" for key in data.keys())
             values = list(data.values()) + [company_id]
             cursor.execute(f"UPDATE company SET {set_clause} WHERE id = %s", values)
+            job_ids = Company._job_ids(cursor, company_id)
             db.commit()
+            Job.invalidate_details(*job_ids)  # 상세 캐시의 회사명 갱신
+            bump_generation('company')
+            if 'name' in data:
+                job_index.notify_changed(*job_ids)  # 검색 색인의 회사명 갱신
             return {"message": "Company updated successfully"}
+        except PoolTimeoutError:
+            raise  # 전역 처리기에서 503 반환
         except Exception as e:
             return {"error": f"Failed to update company: {str(e)}"}
         finally:
@@ -106,10 +128,23 @@ class Company:
         db = get_db()
         cursor = db.cursor()
         try:
+            job_ids = Company._job_ids(cursor, company_id)
+            Stats.remove_jobs(cursor, job_ids)  # 공고가 CASCADE로 지워지기 전에 카운터/통계 집계 테이블에서 제외
             cursor.execute("DELETE FROM company WHERE id = %s", (company_id,))
             db.commit()
+            Job.invalidate_details(*job_ids)
+            bump_generation('company', 'job')
+            job_index.notify_changed(*job_ids)
             return {"message": "Company deleted successfully"}
+        except PoolTimeoutError:
+            raise  # 전역 처리기에서 503 반환
         except Exception as e:
             return {"error": f"Failed to delete company: {str(e)}"}
         finally:
             cursor.close()
+
+    @staticmethod
+    def _job_ids(cursor, company_id):
+        # 회사에 속한 공고 ID (상세 캐시 무효화용)
+        cursor.execute("SELECT id FROM job WHERE company = %s", (company_id,))
+        return [row[0] for row in cursor.fetchall()]
@@ -1,6 +1,36 @@
+import json
+from collections import Counter, defaultdict
+import mysql.connector
+from redis.exceptions import RedisError
+from app.config import (
+    JOB_DETAIL_CACHE_TTL, SEARCH_BACKEND, NGRAM_TOKEN_SIZE, SEARCH_COUNT_TTL, SEARCH_RESULT_CACHE_MAX_IDS
+)
 from app.utils.db import get_db
+from app.utils.cache import cache_get_json, cache_set_json, cache_delete
+from app.utils.conditional import bump_generation, get_generations
+from app.utils.fields import select_columns
+from app.utils.job_parsing import structured_fields
+from app.search.index import job_index, sectors
+from app.search import result_cache
+from app.search.ranking import job_ranker
+from app.search.similar import job_similar
+from app.search.result_cache import active_filters, filters_digest
+from app.models.stats_model import Stats
 
 class Job:
+    # 목록 정렬에 사용할 수 있는 필드
+    SORT_FIELDS = ('id', 'title', 'deadline', 'job_sector', 'deadline_date')
+
+    # fields 파라미터로 선택할 수 있는 필드
+    FIELDS = ('id', 'company', 'creator', 'title', 'link', 'career_condition', 'education', 'deadline', 'job_sector',
+              'min_career_years', 'max_career_years', 'deadline_date')
+
+    # include 파라미터로 함께 조회할 수 있는 관계와 응답 키
+    INCLUDES = {'tech': 'tech_stack', 'locations': 'locations', 'company': 'company_info'}
+
+    # 검색 결과와 함께 값별 개수를 계산할 수 있는 패싯
+    FACETS = ('tech', 'location', 'career', 'sector')
+
     def __init__(self, company, creator, title, link, career_condition, education, deadline, job_sector):
         self.company = company
         self.creator = creator
@@ -12,22 +42,24 @@ class Job:
         self.job_sector = job_sector
 
     @staticmethod
-    def get_all():
+    def get_all(fields=None):
         """
         데이터베이스에서 모든 공고를 조회.
+        Args:
+            fields (list, optional): 조회할 필드 목록 (기본값: 전체)
         Returns:
             list: 공고 데이터 리스트
         """
-        db = get_db()
+        db = get_db(read_only=True)
         cursor = db.cursor(dictionary=True)
         try:
-            cursor.execute("SELECT * FROM job")
+            cursor.execute(f"SELECT {select_columns(fields, 'job')} FROM job")
             return cursor.fetchall()
         finally:
             cursor.close()
     
     @staticmethod
-    def get_all_sorted(page, size, sort_by, order):
+    def get_all_sorted(page, size, sort_by, order, fields=None):
         """
         공고 목록 정렬 및 페이지네이션
         Args:
@@ -35,21 +67,21 @@ class Job:
             size (int): 페이지 크기
             sort_by (str): 정렬 기준 필드
             order (str): 정렬 순서 ('asc', 'desc')
+            fields (list, optional): 조회할 필드 목록 (기본값: 전체)
         Returns:
             list: 정렬된 공고 목록
         """
-        db = get_db()
+        db = get_db(read_only=True)
         cursor = db.cursor(dictionary=True)
         try:
             offset = (page - 1) * size
 
             # 정렬 기준 및 순서 검증
-            valid_fields = {'id', 'title', 'deadline', 'job_sector'}
-            if sort_by not in valid_fields:
+            if sort_by not in Job.SORT_FIELDS:
                 sort_by = 'id'  # 기본값
 
             query = f"""
-                SELECT * FROM job
+                SELECT {select_columns(fields, 'job')} FROM job
                 ORDER BY {sort_by} {order}
                 LIMIT %s OFFSET %s
             """
@@ -58,9 +90,75 @@ class Job:
         finally:
             cursor.close()
 
+    @staticmethod
+    def get_all_by_cursor(after, size, sort_by, order, fields=None):
+        """
+        키셋(커서) 방식 공고 목록 조회
+        - OFFSET 없이 마지막 (정렬 필드, id) 이후 행을 인덱스 범위 탐색으로 조회
+        Args:
+            after (tuple): 이전 페이지 마지막 행의 (정렬 필드 값, id), 첫 페이지는 None
+            size (int): 페이지 크기
+            sort_by (str): 정렬 기준 필드 (Job.SORT_FIELDS 중 하나)
+            order (str): 정렬 순서 ('asc', 'desc')
+            fields (list, optional): 조회할 필드 목록 (기본값: 전체, 커서 계산용 id/정렬 필드는 항상 포함)
+        Returns:
+            list: 정렬된 공고 목록 (다음 페이지 존재 여부 확인을 위해 최대 size + 1개)
+        """
+        db = get_db(read_only=True)
+        cursor = db.cursor(dictionary=True)
+        try:
+            conditions = ""
+            values = []
+            if after is not None:
+                condition, values = Job._keyset_condition(sort_by, 'id', order, after)
+                conditions = f"WHERE {condition}"
+
+            if fields:
+                fields = list(dict.fromkeys(list(fields) + ['id', sort_by]))
+
+            order_clause = "id" if sort_by == 'id' else f"{sort_by} {order}, id"
+            query = f"""
+                SELECT {select_columns(fields, 'job')} FROM job
+                {conditions}
+                ORDER BY {order_clause} {order}
+                LIMIT %s
+            """
+            cursor.execute(query, values + [size + 1])
+            return cursor.fetchall()
+        finally:
+            cursor.close()
+
+    @staticmethod
+    def _keyset_condition(column, id_column, order, after):
+        """
+        커서 이후 행을 고르는 WHERE 조건 (NULL 허용 정렬 필드 지원, 예: deadline_date)
+        - MySQL 정렬 순서를 따름: 오름차순은 NULL 행이 가장 앞, 내림차순은 가장 뒤 (같은 값은 id 순)
+        - (column, id) > (NULL, id) 비교는 NULL이 되어 이후 행을 모두 놓치므로, NULL 구간을 따로 조건으로 만듦
+        Args:
+            column (str): 정렬 컬럼 (id 컬럼과 같으면 id만 비교)
+            id_column (str): id 컬럼
+            order (str): 정렬 순서 ('asc', 'desc')
+            after (tuple): 이전 페이지 마지막 행의 (정렬 필드 값, id)
+        Returns:
+            tuple: (조건 문자열, 바인딩 값 리스트)
+        """
+        value, last_id = after
+        op = '>' if order == 'asc' else '<'
+        if column == id_column:
+            return f"{id_column} {op} %s", [last_id]
+
+        if order == 'asc':
+            if value is None:
+                return f"(({column} IS NULL AND {id_column} > %s) OR {column} IS NOT NULL)", [last_id]
+            return f"({column}, {id_column}) > (%s, %s)", [value, last_id]
+
+        if value is None:
+            return f"({column} IS NULL AND {id_column} < %s)", [last_id]
+        return f"(({column}, {id_column}) < (%s, %s) OR {column} IS NULL)", [value, last_id]
+
     @staticmethod
     def get_paginated(page, size):
-        db = get_db()
+        db = get_db(read_only=True)
         cursor = db.cursor(dictionary=True)
         try:
             offset = (page - 1) * size
@@ -71,19 +169,110 @@ class Job:
 
     @staticmethod
     def get_total_count():
-        db = get_db()
+        """
+        전체 공고 수 조회
+        - COUNT(*) 대신 Job.create/Job.delete가 유지하는 table_counter 값을 사용
+        - 카운터가 없으면 COUNT(*)로 대체
+        Returns:
+            int: 전체 공고 수
+        """
+        db = get_db(read_only=True)
         cursor = db.cursor()
         try:
+            cursor.execute("SELECT value FROM table_counter WHERE name = 'job'")
+            row = cursor.fetchone()
+            if row is not None:
+                return row[0]
+
             cursor.execute("SELECT COUNT(*) FROM job")
             return cursor.fetchone()[0]
         finally:
             cursor.close()
 
+    @staticmethod
+    def reconcile_total_count():
+        """
+        table_counter의 공고 수를 실제 COUNT(*)로 보정
+        - 값이 바뀌었으면 공고 세대를 올려 목록 ETag/캐시 무효화
+        Returns:
+            int: 보정된 공고 수
+        """
+        db = get_db()
+        cursor = db.cursor()
+        try:
+            cursor.execute("""
+                INSERT INTO table_counter (name, value)
+                SELECT 'job', COUNT(*) FROM job
+                ON DUPLICATE KEY UPDATE value = VALUES(value)
+            """)
+            changed = cursor.rowcount > 0
+            db.commit()
+            if changed:
+                bump_generation('job')
+            cursor.execute("SELECT value FROM table_counter WHERE name = 'job'")
+            return cursor.fetchone()[0]
+        finally:
+            cursor.close()
+
+    @staticmethod
+    def backfill_structured_fields(batch_size=1000):
+        """
+        기존 공고의 min_career_years/max_career_years/deadline_date를 원문에서 다시 계산 (migrations/004 이후)
+        - id 순으로 batch_size개씩 처리하고 배치마다 커밋
+        - 마감일 연도는 실행일 기준으로 추정
+        Args:
+            batch_size (int): 한 번에 처리할 공고 수
+        Returns:
+            int: 갱신한 공고 수
+        """
+        db = get_db()
+        cursor = db.cursor()
+        updated = 0
+        last_id = 0
+        try:
+            while True:
+                cursor.execute(
+                    "SELECT id, career_condition, deadline FROM job WHERE id > %s ORDER BY id LIMIT %s",
+                    (last_id, batch_size)
+                )
+                rows = cursor.fetchall()
+                if not rows:
+                    break
+
+                values = []
+                for job_id, career_condition, deadline in rows:
+                    parsed = structured_fields(career_condition or '', deadline or '')
+                    values.append((parsed['min_career_years'], parsed['max_career_years'], parsed['deadline_date'], job_id))
+                cursor.executemany(
+                    "UPDATE job SET min_career_years = %s, max_career_years = %s, deadline_date = %s WHERE id = %s",
+                    values
+                )
+                db.commit()
+                updated += len(rows)
+                last_id = rows[-1][0]
+        finally:
+            cursor.close()
+
+        if updated:
+            bump_generation('job')
+        return updated
+
     @staticmethod
     def update(job_id, fields):
         db = get_db()
         cursor = db.cursor()
         try:
+            # 경력/마감일 원문이 바뀌면 구조화 컬럼도 함께 갱신
+            fields = {**fields, **structured_fields(fields.get('career_condition'), fields.get('deadline'))}
+
+            # 통계 집계 테이블 갱신용 이전 회사 (동시 수정과 겹치지 않도록 잠금)
+            if 'company' in fields:
+                cursor.execute("SELECT company FROM job WHERE id = %s FOR UPDATE", (job_id,))
+                row = cursor.fetchone()
+                if row is not None and row[0] != fields['company']:
+                    Stats.adjust_company_jobs(cursor, row[0], -1)
+                    Stats.adjust_company_jobs(cursor, fields['company'], 1)
+
             # 공고 데이터 업데이트
             set_clause = ", ".join(f"{key} = %s" for key in fields.keys() if key not in ['tech_ids', 'location_ids'])
             values = [fields[key] for key in fields.keys() if key not in ['tech_ids', 'location_ids']] + [job_id]
@@ -92,9 +281,19 @@ class Job:
 
             # 기술 및 위치 데이터 업데이트
             if 'tech_ids' in fields:
-                cursor.execute("DELETE FROM job_tech WHERE job = %s", (job_id,))
-                for tech_id in fields['tech_ids']:
-                    cursor.execute("INSERT INTO job_tech (job, tech) VALUES (%s, %s)", (job_id, tech_id))
+                # 바뀐 기술만 삭제/추가하고 기술별 공고 수도 차이만큼 갱신
+                cursor.execute("SELECT tech FROM job_tech WHERE job = %s FOR UPDATE", (job_id,))
+                old_techs = {row[0] for row in cursor.fetchall()}
+                new_techs = set(fields['tech_ids'])
+                removed, added = sorted(old_techs - new_techs), sorted(new_techs - old_techs)
+                if removed:
+                    cursor.executemany("DELETE FROM job_tech WHERE job = %s AND tech = %s",
+                                       [(job_id, tech_id) for tech_id in removed])
+                if added:
+                    cursor.executemany("INSERT INTO job_tech (job, tech) VALUES (%s, %s)",
+                                       [(job_id, tech_id) for tech_id in added])
+                Stats.adjust_tech_jobs(cursor, removed, -1)
+                Stats.adjust_tech_jobs(cursor, added, 1)
 
             if 'location_ids' in fields:
                 cursor.execute("DELETE FROM job_location WHERE job = %s", (job_id,))
@@ -102,6 +301,9 @@ class Job:
                     cursor.execute("INSERT INTO job_location (job, location) VALUES (%s, %s)", (job_id, location_id))
 
             db.commit()
+            Job.invalidate_details(job_id)
+            bump_generation('job', f'job:{job_id}')
+            job_index.notify_changed(job_id)
             return {"message": "Job updated successfully"}
         finally:
             cursor.close()
@@ -113,12 +315,15 @@ class Job:
         cursor = db.cursor()
         try:
             # 공고 데이터 추가
+            parsed = structured_fields(data['career_condition'], data['deadline'])
             cursor.execute(
-                "INSERT INTO job (company, creator, title, link, career_condition, education, deadline, job_sector) "
-                "VALUES (%s, %s, %s, %s, %s, %s, %s, %s)",
+                "INSERT INTO job (company, creator, title, link, career_condition, education, deadline, job_sector, "
+                "min_career_years, max_career_years, deadline_date) "
+                "VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)",
                 (
                     data['company'], data['creator'], data['title'], data['link'],
-                    data['career_condition'], data['education'], data['deadline'], data['job_sector']
+                    data['career_condition'], data['education'], data['deadline'], data['job_sector'],
+                    parsed['min_career_years'], parsed['max_career_years'], parsed['deadline_date']
                 )
             )
             job_id = cursor.lastrowid
@@ -130,7 +335,12 @@ class Job:
             for location_id in data.get('location_ids', []):
                 cursor.execute("INSERT INTO job_location (job, location) VALUES (%s, %s)", (job_id, location_id))
 
+            # 공고 수 카운터와 통계 집계 테이블 갱신
+            Stats.add_job(cursor, job_id, data['company'], data.get('tech_ids', []))
+
             db.commit()
+            bump_generation('job')
+            job_index.notify_changed(job_id)
             return {"id": job_id, "message": "Job created successfully"}
         finally:
             cursor.close()
@@ -140,16 +350,145 @@ class Job:
         db = get_db()
         cursor = db.cursor()
         try:
+            # 공고 수 카운터와 통계 집계 테이블에서 제외 (관계 데이터가 지워지기 전에)
+            Stats.remove_jobs(cursor, [job_id])
+
             # 공고 삭제 (관계 데이터는 ON DELETE CASCADE로 자동 처리)
             cursor.execute("DELETE FROM job WHERE id = %s", (job_id,))
             db.commit()
+            Job.invalidate_details(job_id)
+            bump_generation('job', f'job:{job_id}')
+            job_index.notify_changed(job_id)
             return {"message": "Job deleted successfully"}
         finally:
             cursor.close()
 
+    @staticmethod
+    def _fulltext_query(filters):
+        """
+        키워드를 FULLTEXT BOOLEAN MODE 구문 검색어로 변환
+        - SEARCH_BACKEND가 'fulltext'가 아니거나, 키워드가 ngram 토큰보다 짧으면 None (LIKE 검색 사용)
+        Args:
+            filters (dict): 검색 필터
+        Returns:
+            str: '"키워드"' 형태의 구문 검색어 또는 None
+        """
+        keyword = (filters.get('keyword') or '').replace('"', ' ').strip()
+        if SEARCH_BACKEND != 'fulltext' or len(keyword) < NGRAM_TOKEN_SIZE:
+            return None
+        return f'"{keyword}"'
+
+    @staticmethod
+    def _build_search_conditions(filters):
+        """
+        검색 필터를 WHERE 조건과 바인딩 값으로 변환
+        Args:
+            filters (dict): keyword, location, tech, career_condition
+                - location/tech는 ID 하나 또는 ID 목록, location_mode/tech_mode는 'any'(기본) 또는 'all'
+                - career_min/career_max는 요구 최소 경력 연수 범위, closing_before는 마감일(date) 상한
+        Returns:
+            tuple: (조건 문자열 리스트, 바인딩 값 리스트)
+        """
+        conditions = []
+        values = []
+
+        # 키워드 검색 (공고 제목 또는 회사명)
+        boolean_query = Job._fulltext_query(filters)
+        if boolean_query:
+            # ngram FULLTEXT 인덱스 사용 (migrations/003)
+            conditions.append("""(
+                job.id IN (SELECT ft.id FROM job ft WHERE MATCH(ft.title) AGAINST (%s IN BOOLEAN MODE))
+                OR job.company IN (SELECT fc.id FROM company fc WHERE MATCH(fc.name) AGAINST (%s IN BOOLEAN MODE))
+            )""")
+            values.extend([boolean_query, boolean_query])
+        elif filters.get('keyword'):
+            conditions.append("(job.title LIKE %s OR company.name LIKE %s)")
+            keyword = f"%{filters['keyword']}%"
+            values.extend([keyword, keyword])
+
+        # 위치/기술 스택 필터 (여러 값: any는 하나 이상, all은 모두 포함)
+        for key, table in (('location', 'job_location'), ('tech', 'job_tech')):
+            ids = filters.get(key)
+            if not ids:
+                continue
+            ids = list(dict.fromkeys(ids)) if isinstance(ids, (list, tuple)) else [ids]
+            placeholders = ", ".join(["%s"] * len(ids))
+            if filters.get(f"{key}_mode") == 'all' and len(ids) > 1:
+                conditions.append(
+                    f"job.id IN (SELECT job FROM {table} WHERE {key} IN ({placeholders}) "
+                    f"GROUP BY job HAVING COUNT(*) = %s)"
+                )
+                values.extend(ids + [len(ids)])
+            else:
+                conditions.append(f"job.id IN (SELECT job FROM {table} WHERE {key} IN ({placeholders}))")
+                values.extend(ids)
+
+        # 경력 조건 키워드 검색
+        if filters.get('career_condition'):
+            conditions.append("job.career_condition LIKE %s")
+            career_condition_keyword = f"%{filters['career_condition']}%"
+            values.append(career_condition_keyword)
+
+        # 경력 연수/마감일 범위 (구조화 컬럼 인덱스 사용, migrations/004)
+        if filters.get('career_min') is not None:
+            conditions.append("job.min_career_years >= %s")
+            values.append(filters['career_min'])
+        if filters.get('career_max') is not None:
+            conditions.append("job.min_career_years <= %s")
+            values.append(filters['career_max'])
+        if filters.get('closing_before') is not None:
+            conditions.append("job.deadline_date <= %s")
+            values.append(filters['closing_before'])
+
+        return conditions, values
+
+    @staticmethod
+    def _iter_rows_by_ids(job_ids, chunk_size=1000, dictionary=False):
+        """
+        검색 색인이 찾은 공고 ID로 검색 결과 행 조회 (기본 키 조회, ID 순)
+        Args:
+            job_ids (array): 정렬된 공고 ID 목록
+            chunk_size (int): 한 번에 조회할 ID 수
+            dictionary (bool): 딕셔너리 커서 사용 여부
+        Yields:
+            tuple: 첫 번째로 컬럼 이름 목록, 이후 행 목록(chunk)
+        """
+        db = get_db(read_only=True)
+        cursor = db.cursor(dictionary=dictionary)
+        query = """
+            SELECT job.*, company.name AS company_name
+            FROM job
+            JOIN company ON job.company = company.id
+            WHERE {condition}
+            ORDER BY job.id
+        """
+        try:
+            if not job_ids:
+                cursor.execute(query.format(condition="FALSE"))
+                cursor.fetchall()
+                yield cursor.column_names
+                return
+
+            for start in range(0, len(job_ids), chunk_size):
+                chunk = list(job_ids[start:start + chunk_size])
+                placeholders = ", ".join(["%s"] * len(chunk))
+                cursor.execute(query.format(condition=f"job.id IN ({placeholders})"), chunk)
+                rows = cursor.fetchall()
+                if start == 0:
+                    yield cursor.column_names
+                yield rows
+        finally:
+            cursor.close()
+
     @staticmethod
     def search_and_filter(filters):
-        db = get_db()
+        if SEARCH_BACKEND == 'index':
+            # 메모리 역색인으로 필터를 계산하고, 행은 기본 키로 조회
+            chunks = Job._iter_rows_by_ids(job_index.search(filters), dictionary=True)
+            next(chunks)
+            return [row for rows in chunks for row in rows]
+
+        db = get_db(read_only=True)
         cursor = db.cursor(dictionary=True)
         try:
             query = """
@@ -157,37 +496,456 @@ class Job:
                 FROM job
                 JOIN company ON job.company = company.id
             """
-            conditions = []
-            values = []
+            conditions, values = Job._build_search_conditions(filters)
+
+            # 조건 추가
+            if conditions:
+                query += " WHERE " + " AND ".join(conditions)
 
-            # 키워드 검색 (공고 제목 또는 회사명)
-            if filters.get('keyword'):
-                conditions.append("(job.title LIKE %s OR company.name LIKE %s)")
-                keyword = f"%{filters['keyword']}%"
-                values.extend([keyword, keyword])
+            # FULLTEXT 검색이면 관련도 순으로 정렬
+            boolean_query = Job._fulltext_query(filters)
+            if boolean_query:
+                query += """
+                    ORDER BY MATCH(job.title) AGAINST (%s IN BOOLEAN MODE)
+                           + MATCH(company.name) AGAINST (%s IN BOOLEAN MODE) DESC, job.id
+                """
+                values = values + [boolean_query, boolean_query]
 
-            # 위치 필터
-            if filters.get('location'):
-                conditions.append("job.id IN (SELECT job FROM job_location WHERE location = %s)")
-                values.append(filters['location'])
+            cursor.execute(query, values)
+            return cursor.fetchall()
+        finally:
+            cursor.close()
 
-            # 기술 스택 필터
-            if filters.get('tech'):
-                conditions.append("job.id IN (SELECT job FROM job_tech WHERE tech = %s)")
-                values.append(filters['tech'])
+    @staticmethod
+    def _search_order_clause(filters, sort_by, order):
+        """
+        검색 결과 ORDER BY 절과 추가 바인딩 값
+        - sort_by='relevance'는 FULLTEXT 검색일 때 MATCH 점수 순, 그 외에는 id 순 (index 백엔드의 BM25 정렬은 _ranked_ids)
+        Returns:
+            tuple: (ORDER BY 절, 바인딩 값 리스트)
+        """
+        boolean_query = Job._fulltext_query(filters)
+        if sort_by == 'relevance' and boolean_query:
+            return """
+                ORDER BY MATCH(job.title) AGAINST (%s IN BOOLEAN MODE)
+                       + MATCH(company.name) AGAINST (%s IN BOOLEAN MODE) DESC, job.id
+            """, [boolean_query, boolean_query]
 
-            # 경력 조건 키워드 검색
-            if filters.get('career_condition'):
-                conditions.append("job.career_condition LIKE %s")
-                career_condition_keyword = f"%{filters['career_condition']}%"
-                values.append(career_condition_keyword)
+        if sort_by not in Job.SORT_FIELDS:
+            sort_by = 'id'
+        if sort_by == 'id':
+            return f"ORDER BY job.id {order}", []
+        return f"ORDER BY job.{sort_by} {order}, job.id {order}", []
 
-            # 조건 추가
+    @staticmethod
+    def search_sorted(filters, page, size, sort_by, order):
+        """
+        검색 결과 정렬 및 페이지네이션
+        - 정렬된 결과 공고 ID(앞에서부터 SEARCH_RESULT_CACHE_MAX_IDS개)와 전체 수를 Redis에 캐시하고,
+          캐시된 범위의 페이지는 해당 ID의 행만 기본 키로 조회
+        Args:
+            filters (dict): search_and_filter와 같은 필터
+            page (int): 페이지 번호
+            size (int): 페이지 크기
+            sort_by (str): 정렬 기준 필드 (Job.SORT_FIELDS 또는 'relevance')
+            order (str): 정렬 순서 ('asc', 'desc')
+        Returns:
+            tuple: (검색 결과 한 페이지 (company_name 포함), 전체 결과 수)
+        """
+        offset = (page - 1) * size
+        key, entry = result_cache.lookup(filters, sort_by, order)
+        if key is not None and entry is None:
+            job_ids = Job._search_ids(filters, sort_by, order, SEARCH_RESULT_CACHE_MAX_IDS + 1)
+            complete = len(job_ids) <= SEARCH_RESULT_CACHE_MAX_IDS
+            job_ids = job_ids[:SEARCH_RESULT_CACHE_MAX_IDS]
+            total = len(job_ids) if complete else Job.count_search(filters)
+            result_cache.store(key, job_ids, total, complete)
+            entry = {"ids": job_ids, "total": total, "complete": complete}
+
+        if entry is not None and (entry['complete'] or offset + size <= len(entry['ids'])):
+            return Job._rows_in_order(entry['ids'][offset:offset + size]), entry['total']
+
+        # 캐시를 사용할 수 없거나 캐시된 범위 밖의 페이지
+        total = entry['total'] if entry is not None else Job.count_search(filters)
+        return Job._search_page(filters, offset, size, sort_by, order), total
+
+    @staticmethod
+    def _search_ids(filters, sort_by, order, limit):
+        """
+        정렬된 검색 결과 공고 ID 조회 (최대 limit개)
+        """
+        if Job._uses_bm25(filters, sort_by):
+            return Job._ranked_ids(filters)[:limit]
+        if SEARCH_BACKEND == 'index':
+            return job_index.sort_page(job_index.search(filters), sort_by, order, limit=limit)
+
+        conditions, values = Job._build_search_conditions(filters)
+        order_clause, order_values = Job._search_order_clause(filters, sort_by, order)
+        query = f"""
+            SELECT job.id
+            FROM job
+            JOIN company ON job.company = company.id
+            {"WHERE " + " AND ".join(conditions) if conditions else ""}
+            {order_clause}
+            LIMIT %s
+        """
+        db = get_db(read_only=True)
+        cursor = db.cursor()
+        try:
+            cursor.execute(query, values + order_values + [limit])
+            return [row[0] for row in cursor.fetchall()]
+        finally:
+            cursor.close()
+
+    @staticmethod
+    def _uses_bm25(filters, sort_by):
+        # 관련도 정렬: index 백엔드는 메모리 색인의 BM25 점수, fulltext는 MATCH 점수, like는 id 순
+        # (like/fulltext에서는 요청 처리 중에 메모리 색인을 구성하지 않고, SQL 결과와 다른 후보를 쓰지 않음)
+        return sort_by == 'relevance' and bool(filters.get('keyword')) and SEARCH_BACKEND == 'index'
+
+    @staticmethod
+    def _ranked_ids(filters):
+        """
+        BM25 관련도 순 검색 결과 공고 ID (제목/회사명/분야 기준, 후보 전체를 한 번에 점수 계산)
+        """
+        return job_ranker.rank(job_index.search(filters), filters['keyword'])
+
+    @staticmethod
+    def _search_page(filters, offset, size, sort_by, order):
+        """
+        검색 결과 한 페이지를 캐시 없이 조회
+        """
+        if Job._uses_bm25(filters, sort_by):
+            return Job._rows_in_order(Job._ranked_ids(filters)[offset:offset + size])
+        if SEARCH_BACKEND == 'index':
+            job_ids = job_index.sort_page(job_index.search(filters), sort_by, order, offset=offset, limit=size)
+            return Job._rows_in_order(job_ids)
+
+        conditions, values = Job._build_search_conditions(filters)
+        order_clause, order_values = Job._search_order_clause(filters, sort_by, order)
+        query = f"""
+            SELECT job.*, company.name AS company_name
+            FROM job
+            JOIN company ON job.company = company.id
+            {"WHERE " + " AND ".join(conditions) if conditions else ""}
+            {order_clause}
+            LIMIT %s OFFSET %s
+        """
+        db = get_db(read_only=True)
+        cursor = db.cursor(dictionary=True)
+        try:
+            cursor.execute(query, values + order_values + [size, offset])
+            return cursor.fetchall()
+        finally:
+            cursor.close()
+
+    @staticmethod
+    def search_by_cursor(filters, after, size, sort_by, order):
+        """
+        키셋(커서) 방식 검색 결과 조회
+        Args:
+            filters (dict): search_and_filter와 같은 필터
+            after (tuple): 이전 페이지 마지막 행의 (정렬 필드 값, id), 첫 페이지는 None
+            size (int): 페이지 크기
+            sort_by (str): 정렬 기준 필드 (Job.SORT_FIELDS 중 하나)
+            order (str): 정렬 순서 ('asc', 'desc')
+        Returns:
+            list: 정렬된 검색 결과 (다음 페이지 존재 여부 확인을 위해 최대 size + 1개)
+        """
+        if SEARCH_BACKEND == 'index':
+            job_ids = job_index.sort_page(job_index.search(filters), sort_by, order, limit=size + 1, after=after)
+            return Job._rows_in_order(job_ids)
+
+        conditions, values = Job._build_search_conditions(filters)
+        if after is not None:
+            condition, after_values = Job._keyset_condition(f"job.{sort_by}", 'job.id', order, after)
+            conditions.append(condition)
+            values.extend(after_values)
+
+        order_clause, _ = Job._search_order_clause(filters, sort_by, order)
+        query = f"""
+            SELECT job.*, company.name AS company_name
+            FROM job
+            JOIN company ON job.company = company.id
+            {"WHERE " + " AND ".join(conditions) if conditions else ""}
+            {order_clause}
+            LIMIT %s
+        """
+        db = get_db(read_only=True)
+        cursor = db.cursor(dictionary=True)
+        try:
+            cursor.execute(query, values + [size + 1])
+            return cursor.fetchall()
+        finally:
+            cursor.close()
+
+    @staticmethod
+    def get_by_ids(job_ids):
+        """
+        공고 ID 목록 순서대로 공고 조회 (추천 목록 등 순서가 이미 정해진 경우)
+        Args:
+            job_ids (list): 공고 ID 목록
+        Returns:
+            list: 공고 목록 (삭제된 공고는 제외)
+        """
+        return Job._rows_in_order(job_ids)
+
+    @staticmethod
+    def _rows_in_order(job_ids):
+        """
+        공고 ID 목록 순서대로 검색 결과 행 조회
+        """
+        if not job_ids:
+            return []
+        chunks = Job._iter_rows_by_ids(job_ids, dictionary=True)
+        next(chunks)
+        rows = {row['id']: row for chunk in chunks for row in chunk}
+        return [rows[job_id] for job_id in job_ids if job_id in rows]
+
+    @staticmethod
+    def count_search(filters):
+        """
+        검색 결과 전체 수 (같은 검색의 모든 페이지에서 재사용)
+        - 정규화한 필터와 job/company 세대 번호로 캐시하므로, 데이터가 바뀌기 전까지 COUNT는 검색당 한 번만 실행
+        Args:
+            filters (dict): search_and_filter와 같은 필터
+        Returns:
+            int: 검색 결과 수
+        """
+        if not active_filters(filters):
+            return Job.get_total_count()
+
+        try:
+            (job_generation, _), (company_generation, _) = get_generations(['job', 'company'])
+        except RedisError:
+            return Job.count_filtered(filters)
+
+        key = f"search:count:{SEARCH_BACKEND}:{filters_digest(filters)}:{job_generation}:{company_generation}"
+        total = cache_get_json(key)
+        if total is None:
+            total = Job.count_filtered(filters)
+            cache_set_json(key, total, SEARCH_COUNT_TTL)
+        return total
+
+    @staticmethod
+    def search_facets(filters, facets, limit=20):
+        """
+        검색 결과 전체에 대한 패싯별 값 개수
+        - 결과 목록과 같은 공고 집합에서 계산: SEARCH_BACKEND=index이면 메모리 색인의 결과 ID를 한 번 순회하고,
+          like/fulltext이면 결과 목록과 같은 검색 조건으로 DB에서 집계 (색인과 DB의 결과 차이로 개수가 어긋나지 않도록)
+        Args:
+            filters (dict): search_and_filter와 같은 필터
+            facets (list): Job.FACETS 중 계산할 패싯
+            limit (int): 패싯별로 반환할 최대 값 수 (개수 많은 순)
+        Returns:
+            dict: 패싯 이름 -> [{"id", "name", "count"}] (tech/location) 또는 [{"value", "count"}] (career/sector)
+        """
+        if SEARCH_BACKEND == 'index':
+            return Job._index_facets(filters, facets, limit)
+        return Job._sql_facets(filters, facets, limit)
+
+    @staticmethod
+    def _index_facets(filters, facets, limit):
+        """
+        메모리 색인에서 패싯 계산 (기술/지역 이름만 DB에서 조회)
+        """
+        counters = job_index.facet_counts(job_index.search(filters), facets)
+        result = {}
+
+        db = get_db(read_only=True)
+        cursor = db.cursor(dictionary=True)
+        try:
+            for facet, table in (('tech', 'tech'), ('location', 'location')):
+                if facet not in counters:
+                    continue
+                top = counters[facet].most_common(limit)
+                names = {}
+                if top:
+                    placeholders = ", ".join(["%s"] * len(top))
+                    cursor.execute(f"SELECT id, name FROM {table} WHERE id IN ({placeholders})",
+                                   [value_id for value_id, _ in top])
+                    names = {row['id']: row['name'] for row in cursor.fetchall()}
+                result[facet] = [{"id": value_id, "name": names.get(value_id), "count": count}
+                                 for value_id, count in top]
+        finally:
+            cursor.close()
+
+        for facet in ('career', 'sector'):
+            if facet in counters:
+                result[facet] = [{"value": value, "count": count} for value, count in counters[facet].most_common(limit)]
+        return result
+
+    @staticmethod
+    def _sql_facets(filters, facets, limit):
+        """
+        검색 조건(_build_search_conditions)으로 DB에서 패싯 계산
+        - 검색 결과 공고 집합을 CTE로 한 번만 구하고, 요청한 패싯의 GROUP BY를 UNION ALL로 묶어 쿼리 한 번에 집계
+        - 분야는 job_sector 값별 개수를 분야 목록으로 나눠 합산
+        """
+        conditions, values = Job._build_search_conditions(filters)
+        parts = []
+        for facet, table, link in (('tech', 'tech', 'job_tech'), ('location', 'location', 'job_location')):
+            if facet in facets:
+                parts.append(f"""
+                    SELECT '{facet}' AS facet, facet_value.id AS value_id, facet_value.name AS value, COUNT(*) AS count
+                    FROM matched
+                    JOIN {link} facet_link ON facet_link.job = matched.id
+                    JOIN {table} facet_value ON facet_value.id = facet_link.{table}
+                    GROUP BY facet_value.id, facet_value.name
+                """)
+        if 'career' in facets:
+            parts.append("""
+                SELECT 'career' AS facet, NULL AS value_id, matched.career_condition AS value, COUNT(*) AS count
+                FROM matched
+                WHERE matched.career_condition <> ''
+                GROUP BY matched.career_condition
+            """)
+        if 'sector' in facets:
+            parts.append("""
+                SELECT 'sector' AS facet, NULL AS value_id, matched.job_sector AS value, COUNT(*) AS count
+                FROM matched
+                GROUP BY matched.job_sector
+            """)
+        if not parts:
+            return {}
+
+        db = get_db(read_only=True)
+        cursor = db.cursor(dictionary=True)
+        try:
+            cursor.execute(f"""
+                WITH matched AS (
+                    SELECT job.id, job.career_condition, job.job_sector
+                    FROM job
+                    JOIN company ON job.company = company.id
+                    {"WHERE " + " AND ".join(conditions) if conditions else ""}
+                )
+                {" UNION ALL ".join(parts)}
+            """, values)
+            rows = cursor.fetchall()
+        finally:
+            cursor.close()
+
+        grouped = {facet: [] for facet in facets}
+        for row in rows:
+            grouped[row['facet']].append(row)
+
+        result = {}
+        for facet in ('tech', 'location'):
+            if facet in grouped:
+                top = sorted(grouped[facet], key=lambda row: (-row['count'], row['value_id']))[:limit]
+                result[facet] = [{"id": row['value_id'], "name": row['value'], "count": row['count']} for row in top]
+        if 'career' in grouped:
+            top = sorted(grouped['career'], key=lambda row: (-row['count'], row['value']))[:limit]
+            result['career'] = [{"value": row['value'], "count": row['count']} for row in top]
+        if 'sector' in grouped:
+            counter = Counter()
+            for row in grouped['sector']:
+                for sector in sectors(row['value']):
+                    counter[sector] += row['count']
+            result['sector'] = [{"value": value, "count": count} for value, count in counter.most_common(limit)]
+        return result
+
+    @staticmethod
+    def get_similar(job_id, limit=10):
+        """
+        기술/지역/회사/분야가 비슷한 공고 조회 (Jaccard 유사도 순)
+        - 이웃 목록은 메모리 색인에서 계산해 캐시해 두고, 공고 행만 DB에서 조회
+        Args:
+            job_id (int): 기준 공고 ID
+            limit (int): 최대 개수
+        Returns:
+            list: 공고 목록 (각 공고에 similarity 포함), 공고가 없으면 None
+        """
+        neighbours = job_similar.neighbours(job_id, limit)
+        if neighbours is None:
+            return None
+        similarity = dict(neighbours)
+        rows = Job._rows_in_order([neighbour_id for neighbour_id, _ in neighbours])
+        for row in rows:
+            row['similarity'] = similarity[row['id']]
+        return rows
+
+    @staticmethod
+    def iter_search(filters, chunk_size=1000):
+        """
+        검색 조건에 맞는 공고를 스트리밍 조회 (내보내기용)
+        - 버퍼링하지 않는 서버 측 커서로 chunk_size개씩 가져오므로 전체 결과를 메모리에 올리지 않음
+        Args:
+            filters (dict): search_and_filter와 같은 필터
+            chunk_size (int): 한 번에 가져올 행 수
+        Yields:
+            tuple: 첫 번째로 컬럼 이름 목록, 이후 행 튜플 목록(chunk)
+        """
+        if SEARCH_BACKEND == 'index':
+            yield from Job._iter_rows_by_ids(job_index.search(filters), chunk_size)
+            return
+
+        db = get_db(read_only=True)
+        cursor = db.cursor(buffered=False)
+        try:
+            query = """
+                SELECT job.*, company.name AS company_name
+                FROM job
+                JOIN company ON job.company = company.id
+            """
+            conditions, values = Job._build_search_conditions(filters)
             if conditions:
                 query += " WHERE " + " AND ".join(conditions)
+            query += " ORDER BY job.id"
 
             cursor.execute(query, values)
-            return cursor.fetchall()
+            yield cursor.column_names
+
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                yield rows
+        finally:
+            try:
+                cursor.close()
+            except mysql.connector.Error:
+                pass  # 중단된 스트림: 남은 결과가 있는 연결은 풀 반환 시 롤백 실패로 폐기됨
+
+    @staticmethod
+    def count_filtered(filters, approximate=False):
+        """
+        검색 조건에 맞는 공고 수 조회
+        - 필터가 없으면 table_counter 값을 사용
+        - approximate=True이면 COUNT(*)를 실행하지 않고 EXPLAIN의 예상 행 수로 추정
+        Args:
+            filters (dict): search_and_filter와 같은 필터
+            approximate (bool): 추정치 사용 여부
+        Returns:
+            int: 공고 수 (approximate=True이면 추정치)
+        """
+        if SEARCH_BACKEND == 'index':
+            return len(job_index.search(filters)) if active_filters(filters) else Job.get_total_count()
+
+        conditions, values = Job._build_search_conditions(filters)
+        if not conditions:
+            return Job.get_total_count()
+
+        query = """
+            SELECT COUNT(*) AS total
+            FROM job
+            JOIN company ON job.company = company.id
+            WHERE """ + " AND ".join(conditions)
+
+        db = get_db(read_only=True)
+        cursor = db.cursor(dictionary=True)
+        try:
+            if not approximate:
+                cursor.execute(query, values)
+                return cursor.fetchone()['total']
+
+            # 최상위 조인 테이블의 (예상 행 수 × 필터 비율)을 곱해 결과 행 수를 추정
+            cursor.execute("EXPLAIN " + query, values)
+            estimate = 1.0
+            for row in cursor.fetchall():
+                if row['select_type'] in ('SIMPLE', 'PRIMARY') and row['rows'] is not None:
+                    estimate *= row['rows'] * float(row.get('filtered') or 100) / 100
+            return int(round(estimate))
         finally:
             cursor.close()
 
@@ -221,43 +979,129 @@ class Job:
         finally:
             cursor.close()
 
+    @staticmethod
+    def detail_cache_key(job_id):
+        return f"job_detail:{job_id}"
+
+    @staticmethod
+    def invalidate_details(*job_ids):
+        """
+        공고 상세 캐시 무효화
+        Args:
+            job_ids (int): 무효화할 공고 ID 목록
+        """
+        cache_delete(*(Job.detail_cache_key(job_id) for job_id in job_ids))
+
     @staticmethod
     def get_details(job_id):
         """
         특정 공고의 세부 정보를 반환
+        - 캐시(Redis)를 먼저 확인하고, 없으면 DB에서 조회 후 캐시에 저장 (read-through)
+        - 공고 정보, 회사명, 기술 스택, 위치를 한 번의 쿼리로 조회 (JSON 집계)
+        - 캐시는 주 DB에서 채움 (지연된 복제본의 수정 전 데이터가 JOB_DETAIL_CACHE_TTL 동안 남지 않도록)
         Args:
             job_id (int): 조회할 공고 ID
         Returns:
             dict: 공고 세부 정보
         """
+        key = Job.detail_cache_key(job_id)
+        job = cache_get_json(key)
+        if job is not None:
+            return job
+
         db = get_db()
         cursor = db.cursor(dictionary=True)
         try:
-            # 기본 공고 정보 조회
-            cursor.execute("SELECT * FROM job WHERE id = %s", (job_id,))
+            cursor.execute("""
+                SELECT
+                    job.*,
+                    company.name AS company_name,
+                    (SELECT JSON_ARRAYAGG(JSON_OBJECT('id', tech.id, 'name', tech.name))
+                     FROM job_tech
+                     JOIN tech ON tech.id = job_tech.tech
+                     WHERE job_tech.job = job.id) AS tech_stack,
+                    (SELECT JSON_ARRAYAGG(JSON_OBJECT('id', location.id, 'name', location.name))
+                     FROM job_location
+                     JOIN location ON location.id = job_location.location
+                     WHERE job_location.job = job.id) AS locations
+                FROM job
+                LEFT JOIN company ON company.id = job.company
+                WHERE job.id = %s
+            """, (job_id,))
             job = cursor.fetchone()
             if not job:
                 return None
 
-            # 기술 스택 정보 조회
-            cursor.execute("""
-                SELECT tech.id, tech.name 
-                FROM tech 
-                JOIN job_tech ON tech.id = job_tech.tech 
-                WHERE job_tech.job = %s
-            """, (job_id,))
-            job['tech_stack'] = cursor.fetchall()
+            # JSON 집계 결과 변환 (관계가 없으면 NULL)
+            for relation in ('tech_stack', 'locations'):
+                value = job[relation]
+                job[relation] = json.loads(value) if value else []
+        finally:
+            cursor.close()
 
-            # 위치 정보 조회
-            cursor.execute("""
-                SELECT location.id, location.name 
-                FROM location 
-                JOIN job_location ON location.id = job_location.location 
-                WHERE job_location.job = %s
-            """, (job_id,))
-            job['locations'] = cursor.fetchall()
+        cache_set_json(key, job, JOB_DETAIL_CACHE_TTL)
+        return job
 
-            return job
+    @staticmethod
+    def attach_relations(jobs, include):
+        """
+        공고 목록에 기술 스택/위치/회사 정보를 일괄 조회하여 추가
+        - 관계마다 IN (...) 쿼리 한 번으로 페이지 전체를 조회 (공고별 N+1 조회 방지)
+        Args:
+            jobs (list): id(회사 포함 시 company)가 있는 공고 행 목록
+            include (list): Job.INCLUDES 중 추가할 관계 목록
+        Returns:
+            list: 관계가 추가된 공고 목록 (같은 객체를 수정하여 반환)
+        """
+        if not jobs or not include:
+            return jobs
+
+        job_ids = list({job['id'] for job in jobs})
+        placeholders = ", ".join(["%s"] * len(job_ids))
+
+        db = get_db(read_only=True)
+        cursor = db.cursor(dictionary=True)
+        try:
+            # 기술 스택
+            if 'tech' in include:
+                cursor.execute(f"""
+                    SELECT job_tech.job, tech.id, tech.name
+                    FROM job_tech
+                    JOIN tech ON tech.id = job_tech.tech
+                    WHERE job_tech.job IN ({placeholders})
+                """, job_ids)
+                tech_by_job = defaultdict(list)
+                for row in cursor.fetchall():
+                    tech_by_job[row.pop('job')].append(row)
+                for job in jobs:
+                    job['tech_stack'] = tech_by_job.get(job['id'], [])
+
+            # 위치
+            if 'locations' in include:
+                cursor.execute(f"""
+                    SELECT job_location.job, location.id, location.name
+                    FROM job_location
+                    JOIN location ON location.id = job_location.location
+                    WHERE job_location.job IN ({placeholders})
+                """, job_ids)
+                locations_by_job = defaultdict(list)
+                for row in cursor.fetchall():
+                    locations_by_job[row.pop('job')].append(row)
+                for job in jobs:
+                    job['locations'] = locations_by_job.get(job['id'], [])
+
+            # 회사
+            if 'company' in include:
+                company_ids = list({job['company'] for job in jobs})
+                cursor.execute(
+                    f"SELECT id, name, link FROM company WHERE id IN ({', '.join(['%s'] * len(company_ids))})",
+                    company_ids
+                )
+                companies = {row['id']: row for row in cursor.fetchall()}
+                for job in jobs:
+                    job['company_info'] = companies.get(job['company'])
+
+            return jobs
         finally:
             cursor.close()
 
@@ -1,25 +1,28 @@
 from app.utils.db import get_db
+from app.utils.conditional import bump_generation
 
 class Stats:
     @staticmethod
     def get_company_job_count():
         """
         회사별 공고 수 통계
+        - 공고 쓰기 시 함께 갱신되는 company_job_count를 읽음 (요청마다 job 테이블을 GROUP BY 하지 않음)
         Returns:
-            list: 회사 이름, 공고 수, 전체 대비 비율
+            list: 회사 ID, 회사 이름, 공고 수, 전체 대비 비율
         """
-        db = get_db()
+        db = get_db(read_only=True)
         cursor = db.cursor(dictionary=True)
         try:
             cursor.execute("""
-                SELECT 
+                SELECT
+                    company.id AS company_id,
                     company.name AS company_name,
-                    COUNT(job.id) AS job_count,
-                    ROUND((COUNT(job.id) / (SELECT COUNT(*) FROM job)) * 100, 2) AS percentage
-                FROM company
-                LEFT JOIN job ON company.id = job.company
-                GROUP BY company.name
-                ORDER BY job_count DESC
+                    counts.job_count,
+                    ROUND((counts.job_count / total.value) * 100, 2) AS percentage
+                FROM company_job_count counts
+                JOIN company ON company.id = counts.company
+                LEFT JOIN table_counter total ON total.name = 'job'
+                ORDER BY counts.job_count DESC, counts.company
             """)
             return cursor.fetchall()
         finally:
@@ -29,21 +32,23 @@ class Stats:
     def get_tech_job_count():
         """
         기술별 공고 수 통계
+        - 공고 쓰기 시 함께 갱신되는 tech_job_count를 읽음
         Returns:
-            list: 기술 이름, 공고 수, 전체 대비 비율
+            list: 기술 ID, 기술 이름, 공고 수, 전체 대비 비율
         """
-        db = get_db()
+        db = get_db(read_only=True)
         cursor = db.cursor(dictionary=True)
         try:
             cursor.execute("""
-                SELECT 
+                SELECT
+                    tech.id AS tech_id,
                     tech.name AS tech_name,
-                    COUNT(job_tech.job) AS job_count,
-                    ROUND((COUNT(job_tech.job) / (SELECT COUNT(*) FROM job)) * 100, 2) AS percentage
-                FROM tech
-                LEFT JOIN job_tech ON tech.id = job_tech.tech
-                GROUP BY tech.name
-                ORDER BY job_count DESC
+                    counts.job_count,
+                    ROUND((counts.job_count / total.value) * 100, 2) AS percentage
+                FROM tech_job_count counts
+                JOIN tech ON tech.id = counts.tech
+                LEFT JOIN table_counter total ON total.name = 'job'
+                ORDER BY counts.job_count DESC, counts.tech
             """)
             return cursor.fetchall()
         finally:
@@ -53,22 +58,206 @@ class Stats:
     def get_job_application_count():
         """
         공고별 지원 수 통계
+        - 지원 추가/삭제 시 함께 갱신되는 job_application_count를 읽음
         Returns:
-            list: 공고 제목, 지원 수, 전체 지원 대비 비율
+            list: 공고 ID, 공고 제목, 지원 수, 전체 지원 대비 비율
         """
-        db = get_db()
+        db = get_db(read_only=True)
         cursor = db.cursor(dictionary=True)
         try:
             cursor.execute("""
-                SELECT 
+                SELECT
+                    job.id AS job_id,
                     job.title AS job_title,
-                    COUNT(application.user) AS application_count,
-                    ROUND((COUNT(application.user) / (SELECT COUNT(*) FROM application)) * 100, 2) AS percentage
-                FROM job
-                LEFT JOIN application ON job.id = application.job
-                GROUP BY job.title
-                ORDER BY application_count DESC
+                    counts.application_count,
+                    ROUND((counts.application_count / total.value) * 100, 2) AS percentage
+                FROM job_application_count counts
+                JOIN job ON job.id = counts.job
+                LEFT JOIN table_counter total ON total.name = 'application'
+                ORDER BY counts.application_count DESC, counts.job
             """)
             return cursor.fetchall()
         finally:
-            cursor.close()
\ No newline at end of file
+            cursor.close()
+
+    # --- 집계 테이블 갱신 (호출자의 트랜잭션 안에서 실행, 커밋은 호출자가 함) ---
+
+    @staticmethod
+    def add_job(cursor, job_id, company_id, tech_ids):
+        """
+        새 공고를 집계 테이블에 반영 (Job.create)
+        Args:
+            cursor: 공고 추가와 같은 트랜잭션의 커서
+            job_id (int): 추가된 공고 ID
+            company_id (int): 회사 ID
+            tech_ids (list): 기술 ID 목록
+        """
+        cursor.execute("UPDATE table_counter SET value = value + 1 WHERE name = 'job'")
+        Stats.adjust_company_jobs(cursor, company_id, 1)
+        Stats.adjust_tech_jobs(cursor, tech_ids, 1)
+        cursor.execute("INSERT IGNORE INTO job_application_count (job, application_count) VALUES (%s, 0)", (job_id,))
+
+    @staticmethod
+    def add_company(cursor, company_id):
+        """
+        새 회사를 공고 0건으로 집계 테이블에 추가 (통계에 공고 없는 회사도 포함)
+        """
+        cursor.execute("INSERT IGNORE INTO company_job_count (company, job_count) VALUES (%s, 0)", (company_id,))
+
+    @staticmethod
+    def remove_jobs(cursor, job_ids):
+        """
+        삭제할 공고를 집계 테이블에서 제외 (Job.delete, Company.delete)
+        - 공고 삭제 전에 호출 (ON DELETE CASCADE로 지워질 job_tech/application 수를 먼저 반영)
+        Args:
+            cursor: 공고 삭제와 같은 트랜잭션의 커서
+            job_ids (list): 삭제할 공고 ID 목록
+        """
+        if not job_ids:
+            return
+        placeholders = ", ".join(["%s"] * len(job_ids))
+        job_ids = list(job_ids)
+
+        cursor.execute(f"""
+            UPDATE company_job_count counts
+            JOIN (SELECT company, COUNT(*) AS removed FROM job WHERE id IN ({placeholders}) GROUP BY company) removed
+                ON removed.company = counts.company
+            SET counts.job_count = counts.job_count - removed.removed
+        """, job_ids)
+        cursor.execute(f"""
+            UPDATE tech_job_count counts
+            JOIN (SELECT tech, COUNT(*) AS removed FROM job_tech WHERE job IN ({placeholders}) GROUP BY tech) removed
+                ON removed.tech = counts.tech
+            SET counts.job_count = counts.job_count - removed.removed
+        """, job_ids)
+        cursor.execute(f"""
+            UPDATE table_counter
+            SET value = value - (SELECT COALESCE(SUM(application_count), 0) FROM job_application_count
+                                 WHERE job IN ({placeholders}))
+            WHERE name = 'application'
+        """, job_ids)
+        cursor.execute(f"""
+            UPDATE table_counter
+            SET value = value - (SELECT COUNT(*) FROM job WHERE id IN ({placeholders}))
+            WHERE name = 'job'
+        """, job_ids)
+        cursor.execute(f"DELETE FROM job_application_count WHERE job IN ({placeholders})", job_ids)
+
+    @staticmethod
+    def remove_user_applications(cursor, user_id):
+        """
+        삭제할 사용자의 지원 내역을 집계 테이블에서 제외 (User.delete_user, 사용자 삭제 전에 호출)
+        Args:
+            cursor: 사용자 삭제와 같은 트랜잭션의 커서
+            user_id (int): 사용자 ID
+        """
+        cursor.execute("""
+            UPDATE job_application_count counts
+            JOIN (SELECT job, COUNT(*) AS removed FROM application WHERE user = %s GROUP BY job) removed
+                ON removed.job = counts.job
+            SET counts.application_count = counts.application_count - removed.removed
+        """, (user_id,))
+        cursor.execute("""
+            UPDATE table_counter
+            SET value = value - (SELECT COUNT(*) FROM application WHERE user = %s)
+            WHERE name = 'application'
+        """, (user_id,))
+
+    @staticmethod
+    def adjust_company_jobs(cursor, company_id, delta):
+        """
+        회사 공고 수 증감 (행이 없으면 증가 시 생성)
+        """
+        if delta > 0:
+            cursor.execute("""
+                INSERT INTO company_job_count (company, job_count) VALUES (%s, %s)
+                ON DUPLICATE KEY UPDATE job_count = job_count + VALUES(job_count)
+            """, (company_id, delta))
+        elif delta < 0:
+            cursor.execute("UPDATE company_job_count SET job_count = job_count + %s WHERE company = %s",
+                           (delta, company_id))
+
+    @staticmethod
+    def adjust_tech_jobs(cursor, tech_ids, delta):
+        """
+        기술별 공고 수 증감 (행이 없으면 증가 시 생성)
+        """
+        if not tech_ids:
+            return
+        if delta > 0:
+            cursor.executemany("""
+                INSERT INTO tech_job_count (tech, job_count) VALUES (%s, %s)
+                ON DUPLICATE KEY UPDATE job_count = job_count + VALUES(job_count)
+            """, [(tech_id, delta) for tech_id in tech_ids])
+        elif delta < 0:
+            cursor.executemany("UPDATE tech_job_count SET job_count = job_count + %s WHERE tech = %s",
+                               [(delta, tech_id) for tech_id in tech_ids])
+
+    @staticmethod
+    def adjust_job_applications(cursor, job_id, delta):
+        """
+        공고 지원 수와 전체 지원 수 증감 (Application.add/delete)
+        """
+        cursor.execute("""
+            INSERT INTO job_application_count (job, application_count) VALUES (%s, GREATEST(%s, 0))
+            ON DUPLICATE KEY UPDATE application_count = application_count + %s
+        """, (job_id, delta, delta))
+        cursor.execute("UPDATE table_counter SET value = value + %s WHERE name = 'application'", (delta,))
+
+    @staticmethod
+    def reconcile_counts():
+        """
+        집계 테이블을 원본 테이블에서 다시 계산 (공고/회사/기술/지원 ID 기준 GROUP BY)
+        - 값만 덮어쓰고, 원본이 사라진 행은 삭제
+        - 값이 바뀐 테이블이 있으면 해당 통계 세대를 올려 ETag/캐시 무효화 (바뀐 값이 없으면 유지)
+        Returns:
+            dict: 테이블별 행 수
+        """
+        db = get_db()
+        cursor = db.cursor()
+        # (쿼리, 값이 바뀌면 올릴 세대) - 바뀐 행이 있으면 rowcount > 0
+        statements = [
+            ("""
+                INSERT INTO company_job_count (company, job_count)
+                SELECT company.id, COUNT(job.id) FROM company LEFT JOIN job ON job.company = company.id GROUP BY company.id
+                ON DUPLICATE KEY UPDATE job_count = VALUES(job_count)
+            """, 'company'),
+            ("""
+                INSERT INTO tech_job_count (tech, job_count)
+                SELECT tech.id, COUNT(job_tech.job) FROM tech LEFT JOIN job_tech ON job_tech.tech = tech.id GROUP BY tech.id
+                ON DUPLICATE KEY UPDATE job_count = VALUES(job_count)
+            """, 'job'),
+            ("""
+                INSERT INTO job_application_count (job, application_count)
+                SELECT job.id, COUNT(application.job) FROM job LEFT JOIN application ON application.job = job.id
+                GROUP BY job.id
+                ON DUPLICATE KEY UPDATE application_count = VALUES(application_count)
+            """, 'application'),
+            ("""
+                INSERT INTO table_counter (name, value)
+                SELECT 'application', COUNT(*) FROM application
+                ON DUPLICATE KEY UPDATE value = VALUES(value)
+            """, 'application'),
+            ("DELETE counts FROM company_job_count counts "
+             "LEFT JOIN company ON company.id = counts.company WHERE company.id IS NULL", 'company'),
+            ("DELETE counts FROM tech_job_count counts "
+             "LEFT JOIN tech ON tech.id = counts.tech WHERE tech.id IS NULL", 'job'),
+            ("DELETE counts FROM job_application_count counts "
+             "LEFT JOIN job ON job.id = counts.job WHERE job.id IS NULL", 'application'),
+        ]
+        changed = set()
+        try:
+            for query, generation in statements:
+                cursor.execute(query)
+                if cursor.rowcount > 0:
+                    changed.add(generation)
+            db.commit()
+            bump_generation(*sorted(changed))
+
+            result = {}
+            for table in ('company_job_count', 'tech_job_count', 'job_application_count'):
+                cursor.execute(f"SELECT COUNT(*) FROM {table}")
+                result[table] = cursor.fetchone()[0]
+            return result
+        finally:
+            cursor.close()
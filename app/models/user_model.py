@@ -1,6 +1,12 @@
 import base64
+from app.utils.conditional import bump_generation
 from app.utils.db import get_db
+from app.utils.db_pool import PoolTimeoutError
+from app.utils.fields import select_columns
 from app.models.application_model import Application
+from app.models.job_model import Job
+from app.models.stats_model import Stats
+from app.search.recommend import recommender
 import re
 import os
 
@@ -64,7 +70,6 @@ class User:
             return None
         finally:
             cursor.close()
-            db.close()
 
     @staticmethod
     def add_user(email, password, role, company=None):
@@ -113,11 +118,12 @@ class User:
 
             user_id = cursor.lastrowid
             return {"id": user_id, "message": f"User {email} added successfully"}
+        except PoolTimeoutError:
+            raise  # 전역 처리기에서 503 반환
         except Exception as e:
             return {"error": f"Failed to add user: {str(e)}"}
         finally:
             cursor.close()
-            db.close()
 
 
     @staticmethod
@@ -228,6 +234,8 @@ class User:
             cursor.execute(f"UPDATE user SET {set_clause} WHERE id = %s", values)
             db.commit()
             return {"message": "User updated successfully"}
+        except PoolTimeoutError:
+            raise  # 전역 처리기에서 503 반환
         except Exception as e:
             return {"error": f"Failed to update user: {str(e)}"}
         finally:
@@ -246,9 +254,14 @@ class User:
         db = get_db()
         cursor = db.cursor()
         try:
+            # 지원 내역은 ON DELETE CASCADE로 지워지므로 통계 집계 테이블에서 먼저 제외
+            Stats.remove_user_applications(cursor, user_id)
             cursor.execute("DELETE FROM user WHERE id = %s", (user_id,))
             db.commit()
+            bump_generation('application')  # 지원 수 통계 ETag/캐시 무효화
             return {"message": "User deleted successfully"}
+        except PoolTimeoutError:
+            raise  # 전역 처리기에서 503 반환
         except Exception as e:
             return {"error": f"Failed to delete user: {str(e)}"}
         finally:
@@ -273,31 +286,36 @@ class User:
                 # 북마크 제거
                 cursor.execute("DELETE FROM bookmark WHERE user = %s AND job = %s", (user_id, job_id))
                 db.commit()
+                recommender.refresh_user(user_id)
                 return {"message": "Bookmark removed"}
             else:
                 # 북마크 추가
                 cursor.execute("INSERT INTO bookmark (user, job) VALUES (%s, %s)", (user_id, job_id))
                 db.commit()
+                recommender.refresh_user(user_id)
                 return {"message": "Bookmark added"}
+        except PoolTimeoutError:
+            raise  # 전역 처리기에서 503 반환
         except Exception as e:
             return {"error": f"Failed to toggle bookmark: {str(e)}"}
         finally:
             cursor.close()
 
     @staticmethod
-    def get_bookmarks(user_id):
+    def get_bookmarks(user_id, fields=None):
         """
         사용자의 북마크 조회
         Args:
             user_id (int): 사용자 ID
+            fields (list, optional): 조회할 공고 필드 목록 (기본값: 전체)
         Returns:
             list: 북마크 목록
         """
-        db = get_db()
+        db = get_db(read_only=True)
         cursor = db.cursor(dictionary=True)
         try:
-            cursor.execute("""
-                SELECT job.* FROM job
+            cursor.execute(f"""
+                SELECT {select_columns(fields, 'job')} FROM job
                 JOIN bookmark ON job.id = bookmark.job
                 WHERE bookmark.user = %s
             """, (user_id,))
@@ -319,15 +337,16 @@ class User:
         return Application.add(user_id, job_id, content)
 
     @staticmethod
-    def get_applications(user_id):
+    def get_applications(user_id, fields=None):
         """
         사용자의 지원 내역 조회 (Application 모델 호출)
         Args:
             user_id (int): 사용자 ID
+            fields (list, optional): 조회할 필드 목록 (기본값: 전체)
         Returns:
             list: 지원 내역 목록
         """
-        return Application.get_by_user(user_id)
+        return Application.get_by_user(user_id, fields)
 
     @staticmethod
     def delete_application(user_id, job_id):
@@ -339,4 +358,21 @@ class User:
         Returns:
             dict: 성공 메시지 또는 에러 메시지
         """
-        return Application.delete(user_id, job_id)
\ No newline at end of file
+        return Application.delete(user_id, job_id)
+
+    @staticmethod
+    def get_recommendations(user_id, limit=20):
+        """
+        사용자 추천 공고 조회 (배치/증분 갱신된 Redis 목록, 없으면 인기 공고)
+        Args:
+            user_id (int): 사용자 ID
+            limit (int): 최대 개수
+        Returns:
+            dict: source('personalized' 또는 'popular')와 공고 목록 (각 공고에 score 포함)
+        """
+        source, pairs = recommender.get(user_id, limit)
+        scores = dict(pairs)
+        jobs = Job.get_by_ids([job_id for job_id, _ in pairs])
+        for job in jobs:
+            job['score'] = scores[job['id']]
+        return {"source": source, "data": jobs}
\ No newline at end of file
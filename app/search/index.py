@@ -0,0 +1,626 @@
+import bisect
+import heapq
+import re
+import threading
+import time
+from array import array
+from collections import Counter, namedtuple
+from flask import has_app_context
+from redis.exceptions import RedisError
+from app.utils.db import get_db
+from app.utils.redis_client import redis_client
+
+# 변경된 공고 ID를 다른 프로세스에 알리는 Redis 스트림
+CHANGE_STREAM = "search:job_changes"
+CHANGE_STREAM_MAXLEN = 100000
+SYNC_BATCH = 1000
+# 백그라운드 구성이 실패했을 때 다시 시도하기까지의 최소 간격 (초)
+BUILD_RETRY_INTERVAL = 5
+
+# 색인 문서 (공고 한 건)
+JobDoc = namedtuple('JobDoc', [
+    'id', 'company', 'title', 'company_name', 'career_condition', 'job_sector', 'deadline',
+    'min_career_years', 'deadline_date', 'techs', 'locations', 'sectors'
+])
+
+# 비트맵 디코딩용: 바이트 값 -> 켜진 비트 위치, 0이 아닌 바이트 구간
+_BYTE_BITS = [tuple(bit for bit in range(8) if value >> bit & 1) for value in range(256)]
+_NONZERO_BYTES = re.compile(rb'[^\x00]+')
+
+# sort_page에서 색인 문서 값으로 정렬할 수 있는 필드 (Job.SORT_FIELDS 중 id 제외)
+SORT_ATTRIBUTES = ('title', 'deadline', 'job_sector', 'deadline_date')
+
+
+def normalize(text):
+    """
+    색인/검색용 문자열 정규화 (대소문자 무시)
+    """
+    return (text or '').lower()
+
+
+def bigrams(text):
+    """
+    문자 2-gram 목록 (MySQL ngram 파서와 같은 방식으로 부분 문자열 검색에 사용)
+    """
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+def sectors(job_sector):
+    """
+    job_sector 문자열("백엔드, Python, Flask")을 분야 목록으로 분리
+    """
+    return tuple(sector.strip() for sector in (job_sector or '').split(',') if sector.strip())
+
+
+def intersect(a, b):
+    """
+    정렬된 정수 배열 두 개의 교집합 (정렬 유지)
+    - 크기 차이가 크면 작은 쪽 원소를 큰 쪽에서 이진 탐색
+    """
+    if len(a) > len(b):
+        a, b = b, a
+    if not a:
+        return array('I')
+    if len(a) * 16 < len(b):
+        result = array('I')
+        lo = 0
+        for value in a:
+            lo = bisect.bisect_left(b, value, lo)
+            if lo == len(b):
+                break
+            if b[lo] == value:
+                result.append(value)
+        return result
+    return array('I', sorted(set(a).intersection(b)))
+
+
+def to_bitmap(ids):
+    """
+    정렬된 공고 ID 배열을 비트맵(파이썬 정수, ID번째 비트)으로 변환
+    """
+    if not ids:
+        return 0
+    data = bytearray(ids[-1] // 8 + 1)
+    for job_id in ids:
+        data[job_id >> 3] |= 1 << (job_id & 7)
+    return int.from_bytes(data, 'little')
+
+
+def from_bitmap(bitmap):
+    """
+    비트맵을 정렬된 공고 ID 배열로 변환 (0인 바이트 구간은 건너뜀)
+    """
+    ids = array('I')
+    data = bitmap.to_bytes((bitmap.bit_length() + 7) // 8, 'little')
+    for match in _NONZERO_BYTES.finditer(data):
+        for position, byte in enumerate(match.group(), match.start()):
+            base = position << 3
+            ids.extend(base + bit for bit in _BYTE_BITS[byte])
+    return ids
+
+
+def union(a, b):
+    """
+    정렬된 정수 배열 두 개의 합집합 (정렬 유지)
+    """
+    if not a:
+        return b
+    if not b:
+        return a
+    return array('I', sorted(set(a).union(b)))
+
+
+class JobSearchIndex:
+    """
+    공고 검색용 메모리 역색인.
+    - 용어(제목/회사명/경력조건 2-gram, 분야, 회사) -> 정렬된 공고 ID 배열(array('I'))
+    - 기술/지역 -> 공고 ID 비트맵(파이썬 정수)으로 두고, 여러 값 필터를 비트 연산(OR/AND)으로 결합
+    - 검색 필터를 포스팅 리스트 교집합으로 계산하고, 키워드는 원문 부분 일치로 최종 확인 (LIKE와 같은 결과)
+    - Job.create/update/delete 시 notify_changed로 증분 갱신하고, Redis 스트림으로 다른 프로세스에 전파
+    - 시작 시 DB에서 전체를 구성하며 (index 백엔드가 아니면 백그라운드에서), rebuild_interval마다 백그라운드에서 다시 구성
+    """
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._postings = {}
+        self._bitmaps = {}
+        self._docs = {}
+        self._all_ids = array('I')
+        self._listeners = []
+        self._app = None
+        self.enabled = False
+        self._ready = False
+        self._building = False
+        self._syncing = False
+        self._rebuild_requested = False
+        self._stream_id = '0-0'
+        self._built_at = 0.0
+        self._synced_at = 0.0
+        self.sync_interval = 1.0
+        self.rebuild_interval = 3600
+
+    def init_app(self, app):
+        """
+        설정을 읽고 시작 시점에 DB에서 색인 구성
+        - 검색 엔진(index 백엔드)으로 사용하면 바로 구성하고, 그 외 백엔드에서는 자동완성/비슷한 공고용으로
+          백그라운드에서 구성 (요청이 구성을 기다리지 않음)
+        Args:
+            app (Flask): Flask 애플리케이션
+        """
+        self._app = app
+        self.enabled = app.config.get('SEARCH_BACKEND') == 'index'
+        self.sync_interval = app.config.get('SEARCH_INDEX_SYNC_INTERVAL', 1.0)
+        self.rebuild_interval = app.config.get('SEARCH_INDEX_REBUILD_INTERVAL', 3600)
+        if self.enabled:
+            try:
+                self.rebuild()
+            except Exception as e:
+                app.logger.warning(f"Search index build failed, will retry on first search: {e}")
+        else:
+            self._start_rebuild()
+
+    def add_listener(self, listener):
+        """
+        색인 문서 변경을 따라 갱신할 보조 색인 등록 (자동완성 등)
+        - listener는 reset(docs), on_add(doc), on_remove(doc)를 구현
+        - 이미 구성된 색인이 있으면 바로 현재 문서로 reset
+        Args:
+            listener: 보조 색인 객체
+        """
+        with self._lock:
+            self._listeners.append(listener)
+            if self._ready:
+                listener.reset(self._docs.values())
+
+    # --- 조회 ---
+
+    def search(self, filters):
+        """
+        검색 필터에 맞는 공고 ID 조회
+        Args:
+            filters (dict): keyword, location, tech, career_condition (Job.search_and_filter와 동일)
+                - tech/location은 ID 하나 또는 ID 목록, tech_mode/location_mode는 'any'(OR, 기본) 또는 'all'(AND)
+                - career_min/career_max(요구 최소 경력 연수), closing_before(마감일 date) 범위
+        Returns:
+            array: 정렬된 공고 ID 배열
+        """
+        self.ensure_ready()
+        with self._lock:
+            result = None
+
+            # 기술/지역 필터는 비트맵끼리 먼저 결합한 뒤 한 번만 ID 배열로 변환
+            bitmap = None
+            for term_filter, prefix in (('tech', 'tech'), ('location', 'loc')):
+                values = filters.get(term_filter)
+                if not values:
+                    continue
+                try:
+                    values = [int(value) for value in (values if isinstance(values, (list, tuple)) else [values])]
+                except (TypeError, ValueError):
+                    return array('I')
+                combined = self._combine_bitmaps([f"{prefix}:{value}" for value in values],
+                                                 filters.get(f"{term_filter}_mode") == 'all')
+                bitmap = combined if bitmap is None else bitmap & combined
+            if bitmap is not None:
+                result = from_bitmap(bitmap)
+
+            if filters.get('career_condition'):
+                ids = self._substring_ids('cc', filters['career_condition'], lambda doc: doc.career_condition)
+                result = self._narrow(result, ids)
+
+            # 경력 연수/마감일 범위는 후보 문서 값으로 확인
+            bounds = [filters.get(name) for name in ('career_min', 'career_max', 'closing_before')]
+            if any(bound is not None for bound in bounds):
+                candidates = self._all_ids if result is None else result
+                result = array('I', (job_id for job_id in candidates if self._in_range(self._docs[job_id], *bounds)))
+
+            if filters.get('keyword'):
+                title_ids = self._substring_ids('t', filters['keyword'], lambda doc: doc.title)
+                company_ids = self._substring_ids('c', filters['keyword'], lambda doc: doc.company_name)
+                result = self._narrow(result, union(title_ids, company_ids))
+
+            # 내부 포스팅 배열이 그대로 반환되지 않도록 복사
+            return array('I', self._all_ids if result is None else result)
+
+    def sort_page(self, job_ids, sort_by, order, offset=0, limit=20, after=None):
+        """
+        검색 결과 ID를 정렬하여 한 페이지 분량만 반환 (DB 없이 색인 문서 값으로 정렬)
+        - id 정렬은 이미 정렬된 배열을 그대로 자르고, 그 외 필드는 필요한 offset + limit개만 힙으로 선택
+        - NULL 값은 MySQL과 같이 오름차순에서 가장 앞에 옴
+        Args:
+            job_ids (array): search()가 반환한 정렬된 공고 ID 배열
+            sort_by (str): 정렬 기준 필드 (SORT_ATTRIBUTES가 아니면 id)
+            order (str): 정렬 순서 ('asc', 'desc')
+            offset (int): 건너뛸 개수
+            limit (int): 반환할 최대 개수
+            after (tuple): 커서 모드의 이전 페이지 마지막 (정렬 필드 값, id)
+        Returns:
+            list: 정렬된 공고 ID 목록
+        """
+        reverse = order == 'desc'
+        if sort_by not in SORT_ATTRIBUTES:
+            if after is not None:
+                if reverse:
+                    job_ids = job_ids[:bisect.bisect_left(job_ids, after[1])]
+                else:
+                    job_ids = job_ids[bisect.bisect_right(job_ids, after[1]):]
+            if reverse:
+                end = max(len(job_ids) - offset, 0)
+                return list(reversed(job_ids[max(end - limit, 0):end]))
+            return list(job_ids[offset:offset + limit])
+
+        with self._lock:
+            keyed = ((self._sort_value(getattr(self._docs[job_id], sort_by)), job_id)
+                     for job_id in job_ids if job_id in self._docs)
+            if after is not None:
+                bound = (self._sort_value(after[0]), after[1])
+                keyed = (item for item in keyed if (item < bound if reverse else item > bound))
+            select = heapq.nlargest if reverse else heapq.nsmallest
+            return [job_id for _, job_id in select(offset + limit, keyed)][offset:]
+
+    @staticmethod
+    def _sort_value(value):
+        # NULL을 가장 작은 값으로 취급하고, 날짜는 커서 값(문자열)과 비교할 수 있도록 ISO 문자열로 변환
+        return (value is not None, str(value) if value is not None else '')
+
+    def facet_counts(self, job_ids, facets):
+        """
+        검색 결과 공고 ID를 한 번만 순회하며 패싯별 값 개수 계산
+        - 기술/지역은 색인 문서에 미리 만들어 둔 공고별 ID 배열을 사용 (패싯마다 GROUP BY 하지 않음)
+        Args:
+            job_ids (array): search()가 반환한 공고 ID 배열
+            facets (list): 'tech', 'location', 'career', 'sector' 중 계산할 패싯
+        Returns:
+            dict: 패싯 이름 -> Counter (tech/location은 ID, career/sector는 문자열 값이 키)
+        """
+        counters = {facet: Counter() for facet in facets}
+        tech = counters.get('tech')
+        location = counters.get('location')
+        career = counters.get('career')
+        sector = counters.get('sector')
+
+        with self._lock:
+            docs = self._docs
+            for job_id in job_ids:
+                doc = docs.get(job_id)
+                if doc is None:
+                    continue
+                if tech is not None:
+                    tech.update(doc.techs)
+                if location is not None:
+                    location.update(doc.locations)
+                if career is not None and doc.career_condition:
+                    career[doc.career_condition] += 1
+                if sector is not None:
+                    sector.update(doc.sectors)
+        return counters
+
+    def get_doc(self, job_id):
+        """
+        색인된 공고 문서 조회
+        Returns:
+            JobDoc 또는 None
+        """
+        return self._docs.get(job_id)
+
+    @staticmethod
+    def _in_range(doc, career_min, career_max, closing_before):
+        # SQL 조건과 같이 NULL 값은 범위 조건을 만족하지 않음
+        if career_min is not None or career_max is not None:
+            if doc.min_career_years is None:
+                return False
+            if career_min is not None and doc.min_career_years < career_min:
+                return False
+            if career_max is not None and doc.min_career_years > career_max:
+                return False
+        if closing_before is not None and (doc.deadline_date is None or doc.deadline_date > closing_before):
+            return False
+        return True
+
+    def _combine_bitmaps(self, terms, match_all):
+        # match_all이면 AND(모든 값 포함), 아니면 OR(하나 이상 포함)
+        bitmaps = [self._bitmaps.get(term, 0) for term in terms]
+        combined = bitmaps[0]
+        for bitmap in bitmaps[1:]:
+            combined = combined & bitmap if match_all else combined | bitmap
+        return combined
+
+    def _narrow(self, result, ids):
+        return ids if result is None else intersect(result, ids)
+
+    def _substring_ids(self, field, keyword, text_of):
+        keyword = normalize(keyword)
+        grams = bigrams(keyword)
+        if grams:
+            candidates = None
+            for gram in sorted(grams, key=lambda g: len(self._postings.get(f"{field}:{g}", ()))):
+                candidates = self._narrow(candidates, self._postings.get(f"{field}:{gram}", array('I')))
+                if not candidates:
+                    return array('I')
+        else:
+            candidates = self._all_ids  # 한 글자 키워드는 전체 문서 확인
+
+        # 2-gram 교집합은 후보일 뿐이므로 원문 부분 일치로 확인
+        return array('I', (job_id for job_id in candidates if keyword in normalize(text_of(self._docs[job_id]))))
+
+    # --- 구성 및 갱신 ---
+
+    def ensure_ready(self):
+        """
+        색인이 없으면 구성하고, 다른 프로세스의 변경 사항과 주기적 재구성을 반영
+        - 검색 결과가 색인에 의존하는 호출(index 백엔드 검색/패싯)용으로, 필요하면 구성과 동기화를 기다림
+        """
+        if not self._ready:
+            with self._lock:
+                if not self._ready:
+                    self.rebuild()
+            return
+        self._maintain(background=False)
+
+    def ready(self):
+        """
+        기다리지 않고 색인 사용 가능 여부 확인 (자동완성/비슷한 공고용)
+        - 구성 전이면 백그라운드 구성을 시작하고 False 반환
+        - 다른 프로세스의 변경 반영과 주기적 재구성도 백그라운드에서 수행하여 요청 경로에서 DB/Redis에 접근하지 않음
+        Returns:
+            bool: 색인이 구성되어 있으면 True
+        """
+        if not self._ready:
+            if time.monotonic() - self._built_at >= BUILD_RETRY_INTERVAL:
+                self._start_rebuild()
+            return False
+        self._maintain(background=True)
+        return True
+
+    def _maintain(self, background):
+        # 동기화 주기가 지났으면 다른 프로세스의 변경 반영, 재구성 주기가 지났으면 백그라운드 재구성
+        now = time.monotonic()
+        if now - self._synced_at >= self.sync_interval:
+            self._synced_at = now
+            if not background:
+                self._sync()
+            elif not self._syncing:
+                self._syncing = True
+                threading.Thread(target=self._background_sync, daemon=True).start()
+        if self.rebuild_interval and now - self._built_at >= self.rebuild_interval:
+            self._start_rebuild()
+
+    def _start_rebuild(self, requested=False):
+        # requested=True(재구성 요청)이면 이미 구성 중이어도 끝난 뒤 한 번 더 구성 (구성 중 적재된 데이터 반영)
+        if not self._building:
+            self._building = True
+            threading.Thread(target=self._background_rebuild, daemon=True).start()
+        elif requested:
+            self._rebuild_requested = True
+
+    def rebuild(self):
+        """
+        DB에서 전체 색인을 다시 구성 (구성 중 들어온 변경은 스트림으로 재적용)
+        """
+        stream_id = self._stream_last_id()
+        docs = self._load_docs()
+        postings = {}
+        bitmap_ids = {}
+        for doc in docs.values():
+            for term in self._terms(doc):
+                postings.setdefault(term, []).append(doc.id)
+            for term in self._bitmap_terms(doc):
+                bitmap_ids.setdefault(term, []).append(doc.id)
+
+        # 문서를 id 순으로 넣었으므로 포스팅은 이미 정렬됨
+        postings = {term: array('I', ids) for term, ids in postings.items()}
+        bitmaps = {term: to_bitmap(ids) for term, ids in bitmap_ids.items()}
+        with self._lock:
+            self._docs = docs
+            self._postings = postings
+            self._bitmaps = bitmaps
+            for listener in self._listeners:
+                listener.reset(docs.values())
+            self._all_ids = array('I', sorted(docs))
+            self._stream_id = stream_id
+            self._built_at = self._synced_at = time.monotonic()
+            self._ready = True
+        self._sync()
+
+    def notify_changed(self, *job_ids):
+        """
+        공고 생성/수정/삭제 후 호출 (커밋 이후)
+        - 현재 프로세스 색인을 바로 갱신하고, Redis 스트림으로 다른 프로세스에 알림
+        Args:
+            job_ids (int): 변경된 공고 ID 목록
+        """
+        if not job_ids:
+            return
+        try:
+            redis_client.xadd(CHANGE_STREAM, {'ids': ",".join(map(str, job_ids))},
+                              maxlen=CHANGE_STREAM_MAXLEN, approximate=True)
+        except RedisError as e:
+            print(f"Search index change publish error: {e}")
+        if self._ready:
+            self.refresh(job_ids)
+
+    def request_rebuild(self):
+        """
+        모든 프로세스에 전체 재구성 요청 (대량 적재처럼 바뀐 공고가 많아 notify_changed가 맞지 않을 때)
+        - Redis 스트림으로 알리고, 각 프로세스는 백그라운드에서 DB로부터 다시 구성
+        """
+        try:
+            redis_client.xadd(CHANGE_STREAM, {'rebuild': '1'}, maxlen=CHANGE_STREAM_MAXLEN, approximate=True)
+        except RedisError as e:
+            print(f"Search index rebuild request error: {e}")
+        if self._ready:
+            self._start_rebuild(requested=True)
+
+    def refresh(self, job_ids):
+        """
+        지정한 공고를 DB에서 다시 읽어 색인 갱신 (삭제된 공고는 색인에서 제거)
+        Args:
+            job_ids (iterable): 공고 ID 목록
+        """
+        job_ids = sorted({int(job_id) for job_id in job_ids})
+        if not job_ids:
+            return
+        docs = self._load_docs(job_ids)
+        with self._lock:
+            for job_id in job_ids:
+                self._remove(job_id)
+                if job_id in docs:
+                    self._add(docs[job_id])
+
+    def _add(self, doc):
+        self._docs[doc.id] = doc
+        for listener in self._listeners:
+            listener.on_add(doc)
+        self._insert(self._all_ids, doc.id)
+        for term in self._terms(doc):
+            self._insert(self._postings.setdefault(term, array('I')), doc.id)
+        for term in self._bitmap_terms(doc):
+            self._bitmaps[term] = self._bitmaps.get(term, 0) | (1 << doc.id)
+
+    def _remove(self, job_id):
+        doc = self._docs.pop(job_id, None)
+        if doc is None:
+            return
+        for listener in self._listeners:
+            listener.on_remove(doc)
+        self._delete(self._all_ids, job_id)
+        for term in self._terms(doc):
+            ids = self._postings.get(term)
+            if ids is not None:
+                self._delete(ids, job_id)
+                if not ids:
+                    del self._postings[term]
+        for term in self._bitmap_terms(doc):
+            bitmap = self._bitmaps.get(term, 0) & ~(1 << job_id)
+            if bitmap:
+                self._bitmaps[term] = bitmap
+            else:
+                self._bitmaps.pop(term, None)
+
+    @staticmethod
+    def _insert(ids, job_id):
+        i = bisect.bisect_left(ids, job_id)
+        if i == len(ids) or ids[i] != job_id:
+            ids.insert(i, job_id)
+
+    @staticmethod
+    def _delete(ids, job_id):
+        i = bisect.bisect_left(ids, job_id)
+        if i < len(ids) and ids[i] == job_id:
+            del ids[i]
+
+    @staticmethod
+    def _terms(doc):
+        terms = {f"t:{gram}" for gram in bigrams(normalize(doc.title))}
+        terms.update(f"c:{gram}" for gram in bigrams(normalize(doc.company_name)))
+        terms.update(f"cc:{gram}" for gram in bigrams(normalize(doc.career_condition)))
+        terms.update(f"sector:{sector.lower()}" for sector in doc.sectors)
+        terms.add(f"company:{doc.company}")
+        return terms
+
+    @staticmethod
+    def _bitmap_terms(doc):
+        return [f"tech:{tech}" for tech in doc.techs] + [f"loc:{location}" for location in doc.locations]
+
+    def _load_docs(self, job_ids=None):
+        """
+        DB에서 색인 문서 조회 (job_ids가 없으면 전체)
+        Returns:
+            dict: 공고 ID -> JobDoc (ID 오름차순)
+        """
+        if self._app is not None and not has_app_context():
+            with self._app.app_context():
+                return self._load_docs(job_ids)
+
+        where, values = "", []
+        if job_ids:
+            placeholders = ", ".join(["%s"] * len(job_ids))
+            where, values = f"WHERE job.id IN ({placeholders})", list(job_ids)
+
+        db = get_db()  # 방금 커밋된 변경을 읽도록 주 DB 사용
+        cursor = db.cursor()
+        try:
+            cursor.execute(f"""
+                SELECT job.id, job.company, job.title, company.name, job.career_condition, job.job_sector, job.deadline,
+                       job.min_career_years, job.deadline_date
+                FROM job
+                JOIN company ON job.company = company.id
+                {where}
+                ORDER BY job.id
+            """, values)
+            rows = cursor.fetchall()
+
+            relations = {}
+            for table, column in (('job_tech', 'tech'), ('job_location', 'location')):
+                cursor.execute(
+                    f"SELECT job, {column} FROM {table} {where.replace('job.id', 'job')} ORDER BY job, {column}",
+                    values
+                )
+                grouped = {}
+                for job_id, value in cursor.fetchall():
+                    grouped.setdefault(job_id, []).append(value)
+                relations[column] = grouped
+        finally:
+            cursor.close()
+
+        return {
+            row[0]: JobDoc(*row, techs=tuple(relations['tech'].get(row[0], ())),
+                           locations=tuple(relations['location'].get(row[0], ())), sectors=sectors(row[5]))
+            for row in rows
+        }
+
+    def _sync(self):
+        # 다른 프로세스가 알린 변경 사항 반영
+        try:
+            entries = redis_client.xread({CHANGE_STREAM: self._stream_id}, count=SYNC_BATCH)
+        except RedisError as e:
+            print(f"Search index sync error: {e}")
+            return
+        if not entries:
+            return
+
+        messages = entries[0][1]
+        if len(messages) >= SYNC_BATCH:
+            self.rebuild()  # 밀린 변경이 너무 많으면 전체 재구성
+            return
+        if any('rebuild' in fields for _, fields in messages):
+            # 재구성 요청(request_rebuild): 구성하는 동안 기존 색인으로 응답
+            self._stream_id = messages[-1][0]
+            self._start_rebuild(requested=True)
+            return
+
+        job_ids = set()
+        for _, fields in messages:
+            job_ids.update(int(job_id) for job_id in fields['ids'].split(',') if job_id)
+        self.refresh(job_ids)
+        self._stream_id = messages[-1][0]
+
+    def _stream_last_id(self):
+        try:
+            last = redis_client.xrevrange(CHANGE_STREAM, count=1)
+        except RedisError:
+            return self._stream_id
+        return last[0][0] if last else '0-0'
+
+    def _background_sync(self):
+        try:
+            self._sync()
+        except Exception as e:
+            print(f"Search index sync error: {e}")
+        finally:
+            self._syncing = False
+
+    def _background_rebuild(self):
+        try:
+            self.rebuild()
+        except Exception as e:
+            print(f"Search index rebuild error: {e}")
+        finally:
+            self._built_at = time.monotonic()
+            self._building = False
+            if self._rebuild_requested:
+                self._rebuild_requested = False
+                self._start_rebuild()
+
+
+# 프로세스 단위 공고 검색 색인
+job_index = JobSearchIndex()
@@ -0,0 +1,159 @@
+import re
+from collections import Counter
+import numpy as np
+from app.search.index import job_index
+
+# BM25 파라미터
+K1 = 1.2
+B = 0.75
+
+# 필드 가중치 (제목 일치를 회사명/분야 일치보다 높게)
+FIELD_WEIGHTS = (('title', 2.0), ('company_name', 1.0), ('job_sector', 1.0))
+
+_WORD = re.compile(r'\w+')
+
+
+def tokenize(text):
+    """
+    BM25용 토큰: 단어별 문자 2-gram (한 글자 단어는 그대로)
+    - 띄어쓰기 없이 붙은 한글 복합어("백엔드개발자")도 부분 키워드("백엔드")와 토큰을 공유
+    """
+    tokens = []
+    for word in _WORD.findall((text or '').lower()):
+        if len(word) == 1:
+            tokens.append(word)
+        else:
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+    return tokens
+
+
+class BM25Ranker:
+    """
+    키워드 검색 결과의 BM25 관련도 정렬.
+    - 용어별 (공고 ID 배열, 가중 용어 빈도 배열)과 공고 길이 배열을 미리 계산해 두고,
+      질의마다 후보 전체를 NumPy 배열 연산으로 한 번에 점수 계산
+    - 공고 검색 색인의 리스너로 등록되어 공고/회사 변경을 증분 반영
+    """
+    def __init__(self):
+        self._postings = {}
+        self._doc_len = np.zeros(0, dtype=np.float32)
+        self._doc_count = 0
+        self._total_len = 0.0
+
+    # --- 색인 갱신 (JobSearchIndex 리스너) ---
+
+    def reset(self, docs):
+        postings = {}
+        lengths = {}
+        for doc in docs:
+            terms = self._doc_terms(doc)
+            lengths[doc.id] = sum(terms.values())
+            for term, tf in terms.items():
+                postings.setdefault(term, ([], []))
+                postings[term][0].append(doc.id)
+                postings[term][1].append(tf)
+
+        doc_len = np.zeros(max(lengths, default=0) + 1, dtype=np.float32)
+        if lengths:
+            doc_len[np.fromiter(lengths.keys(), dtype=np.int64)] = np.fromiter(lengths.values(), dtype=np.float32)
+
+        # 문서를 id 순으로 순회하므로 용어별 ID 배열은 정렬되어 있음
+        self._postings = {
+            term: (np.array(ids, dtype=np.uint32), np.array(tfs, dtype=np.float32))
+            for term, (ids, tfs) in postings.items()
+        }
+        self._doc_len = doc_len
+        self._doc_count = len(lengths)
+        self._total_len = float(sum(lengths.values()))
+
+    def on_add(self, doc):
+        terms = self._doc_terms(doc)
+        for term, tf in terms.items():
+            ids, tfs = self._postings.get(term, (np.zeros(0, dtype=np.uint32), np.zeros(0, dtype=np.float32)))
+            i = int(np.searchsorted(ids, doc.id))
+            self._postings[term] = (np.insert(ids, i, doc.id), np.insert(tfs, i, tf))
+
+        if doc.id >= len(self._doc_len):
+            doc_len = np.zeros(max(doc.id + 1, len(self._doc_len) * 2), dtype=np.float32)
+            doc_len[:len(self._doc_len)] = self._doc_len
+            self._doc_len = doc_len
+        length = sum(terms.values())
+        self._doc_len[doc.id] = length
+        self._doc_count += 1
+        self._total_len += length
+
+    def on_remove(self, doc):
+        terms = self._doc_terms(doc)
+        for term in terms:
+            ids, tfs = self._postings.get(term, (None, None))
+            if ids is None:
+                continue
+            i = int(np.searchsorted(ids, doc.id))
+            if i < len(ids) and ids[i] == doc.id:
+                if len(ids) == 1:
+                    del self._postings[term]
+                else:
+                    self._postings[term] = (np.delete(ids, i), np.delete(tfs, i))
+
+        if doc.id < len(self._doc_len):
+            self._doc_len[doc.id] = 0
+        self._doc_count -= 1
+        self._total_len -= sum(terms.values())
+
+    @staticmethod
+    def _doc_terms(doc):
+        terms = Counter()
+        for field, weight in FIELD_WEIGHTS:
+            for token in tokenize(getattr(doc, field)):
+                terms[token] += weight
+        return terms
+
+    # --- 점수 계산 ---
+
+    def scores(self, job_ids, query):
+        """
+        후보 공고의 BM25 점수
+        Args:
+            job_ids (array): 후보 공고 ID (정렬된 array('I') 또는 정수 배열)
+            query (str): 검색 키워드
+        Returns:
+            ndarray: job_ids 순서의 점수 (float32)
+        """
+        candidates = np.asarray(job_ids, dtype=np.uint32)
+        scores = np.zeros(len(candidates), dtype=np.float32)
+        if not len(candidates) or not self._doc_count:
+            return scores
+
+        doc_len = self._doc_len
+        lengths = doc_len[np.minimum(candidates, len(doc_len) - 1)]
+        norm = K1 * (1 - B + B * lengths / (self._total_len / self._doc_count))
+
+        for term in set(tokenize(query)):
+            ids, tfs = self._postings.get(term, (None, None))
+            if ids is None:
+                continue
+            idf = np.log(1 + (self._doc_count - len(ids) + 0.5) / (len(ids) + 0.5))
+
+            # 후보마다 용어 빈도 조회 (정렬된 ID 배열에서 이진 탐색)
+            positions = np.minimum(np.searchsorted(ids, candidates), len(ids) - 1)
+            tf = np.where(ids[positions] == candidates, tfs[positions], 0)
+            scores += idf * tf * (K1 + 1) / (tf + norm)
+        return scores
+
+    def rank(self, job_ids, query):
+        """
+        후보 공고를 BM25 점수 내림차순(같으면 id 오름차순)으로 정렬
+        Args:
+            job_ids (array): 후보 공고 ID
+            query (str): 검색 키워드
+        Returns:
+            list: 정렬된 공고 ID
+        """
+        candidates = np.asarray(job_ids, dtype=np.uint32)
+        order = np.lexsort((candidates, -self.scores(candidates, query)))
+        return candidates[order].tolist()
+
+
+# 공고 색인을 따라 갱신되는 키워드 관련도 정렬기
+job_ranker = BM25Ranker()
+job_index.add_listener(job_ranker)
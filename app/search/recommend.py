@@ -0,0 +1,239 @@
+import heapq
+from concurrent.futures import ProcessPoolExecutor
+import mysql.connector
+import numpy as np
+from flask import json
+from scipy import sparse
+from redis.exceptions import RedisError
+from app.config import RECOMMEND_TOP_N, RECOMMEND_TTL, RECOMMEND_WORKERS
+from app.utils.db import get_db
+from app.utils.redis_client import redis_client
+
+# 상호작용 가중치 (지원이 북마크보다 강한 신호, 둘 다 있으면 합산)
+WEIGHTS = (('bookmark', 1.0), ('application', 2.0))
+# 공고별로 저장하는 유사 공고 수 (사용자 추천 증분 갱신에 사용)
+ITEM_NEIGHBOURS = 50
+# 프로세스 하나가 한 번에 계산하는 행 수
+CHUNK_SIZE = 2000
+
+USER_KEY = "recommend:user:{}"
+ITEM_KEY = "recommend:item:{}"
+POPULAR_KEY = "recommend:popular"
+
+# 작업 프로세스 전역 행렬 (초기화 시 한 번만 전달)
+_worker = {}
+
+
+def item_similarity(interactions):
+    """
+    공고-공고 공동 출현 코사인 유사도
+    - 이진화한 사용자 x 공고 행렬 B에 대해 BᵀB를 공고별 사용자 수의 제곱근으로 정규화 (자기 자신은 0)
+    Args:
+        interactions (csr_matrix): 사용자 x 공고 가중치 행렬
+    Returns:
+        csr_matrix: 공고 x 공고 유사도
+    """
+    binary = interactions.copy()
+    binary.data[:] = 1
+    co_occurrence = (binary.T @ binary).tocsr()
+    co_occurrence.setdiag(0)
+    co_occurrence.eliminate_zeros()
+    norm = sparse.diags(1 / np.sqrt(np.maximum(np.asarray(binary.sum(axis=0)).ravel(), 1)))
+    return (norm @ co_occurrence @ norm).tocsr().astype(np.float32)
+
+
+def top_per_row(scores, limit, exclude=None):
+    """
+    희소 행렬 행마다 점수 상위 limit개 (점수 내림차순, 같으면 열 번호 오름차순)
+    Args:
+        scores (csr_matrix): 점수 행렬
+        limit (int): 행당 최대 개수
+        exclude (csr_matrix, optional): 같은 모양의 행렬, 값이 있는 칸은 결과에서 제외
+    Returns:
+        list: 행마다 (열 번호 배열, 점수 배열)
+    """
+    result = []
+    for row in range(scores.shape[0]):
+        start, end = scores.indptr[row], scores.indptr[row + 1]
+        columns, values = scores.indices[start:end], scores.data[start:end]
+        if exclude is not None:
+            keep = ~np.isin(columns, exclude.indices[exclude.indptr[row]:exclude.indptr[row + 1]])
+            columns, values = columns[keep], values[keep]
+        keep = values > 0
+        columns, values = columns[keep], values[keep]
+        if len(values) > limit:
+            bound = np.partition(values, len(values) - limit)[len(values) - limit]
+            keep = values >= bound
+            columns, values = columns[keep], values[keep]
+        order = np.lexsort((columns, -values))[:limit]
+        result.append((columns[order], values[order]))
+    return result
+
+
+def _init_worker(interactions, similarity):
+    _worker['interactions'] = interactions
+    _worker['similarity'] = similarity
+
+
+def _user_chunk(bounds):
+    # 사용자 행 구간의 추천: 상호작용 행 x 공고 유사도, 이미 상호작용한 공고 제외
+    start, end = bounds
+    interactions = _worker['interactions'][start:end]
+    scores = (interactions @ _worker['similarity']).tocsr()
+    return start, top_per_row(scores, RECOMMEND_TOP_N, exclude=interactions)
+
+
+def _item_chunk(bounds):
+    # 공고 행 구간의 유사 공고 목록
+    start, end = bounds
+    return start, top_per_row(_worker['similarity'][start:end], ITEM_NEIGHBOURS)
+
+
+def _chunks(count):
+    return [(start, min(start + CHUNK_SIZE, count)) for start in range(0, count, CHUNK_SIZE)]
+
+
+class Recommender:
+    """
+    북마크/지원 내역 기반 공고 추천 (item-item 협업 필터링).
+    - build(): 사용자 x 공고 상호작용 행렬로 공고 유사도를 계산하고, 프로세스 풀에서 구간별로
+      사용자 추천(상호작용 행 x 유사도)과 공고별 유사 공고 목록을 계산해 Redis에 저장 (주기적 배치)
+    - refresh_user(): 북마크/지원 변경 시 해당 사용자 목록만 저장된 유사 공고 목록으로 다시 계산
+    - get(): Redis 키 하나로 조회, 추천이 없으면 인기 공고 목록
+    """
+
+    def build(self, workers=None):
+        """
+        전체 사용자 추천 목록과 공고별 유사 공고 목록 다시 계산
+        Args:
+            workers (int, optional): 프로세스 수 (기본값: RECOMMEND_WORKERS)
+        Returns:
+            dict: 사용자 수, 공고 수, 상호작용 수
+        """
+        users, jobs, weights = self._load_interactions()
+        if not len(users):
+            return {"users": 0, "jobs": 0, "interactions": 0}
+
+        user_ids, user_rows = np.unique(users, return_inverse=True)
+        job_ids, job_columns = np.unique(jobs, return_inverse=True)
+        # 같은 (사용자, 공고)의 북마크와 지원은 가중치가 합산됨
+        interactions = sparse.csr_matrix((weights, (user_rows, job_columns)),
+                                         shape=(len(user_ids), len(job_ids)), dtype=np.float32)
+        similarity = item_similarity(interactions)
+
+        with ProcessPoolExecutor(max_workers=workers or RECOMMEND_WORKERS, initializer=_init_worker,
+                                 initargs=(interactions, similarity)) as pool:
+            item_results = pool.map(_item_chunk, _chunks(len(job_ids)))
+            self._store(ITEM_KEY, job_ids, job_ids, item_results)
+            user_results = pool.map(_user_chunk, _chunks(len(user_ids)))
+            self._store(USER_KEY, user_ids, job_ids, user_results)
+
+        popularity = np.asarray(interactions.sum(axis=0)).ravel()
+        (columns, scores), = top_per_row(sparse.csr_matrix(popularity), RECOMMEND_TOP_N)
+        redis_client.set(POPULAR_KEY, json.dumps(self._pairs(job_ids[columns], scores)), ex=RECOMMEND_TTL)
+        return {"users": len(user_ids), "jobs": len(job_ids), "interactions": interactions.nnz}
+
+    def refresh_user(self, user_id):
+        """
+        사용자 한 명의 추천 목록 다시 계산 (북마크 토글/지원 추가·삭제 후 호출)
+        - 상호작용한 공고의 저장된 유사 공고 목록을 가중 합산 (새 공고 간 유사도는 다음 배치에 반영)
+        - 실패해도 예외를 전파하지 않음 (이미 커밋된 쓰기를 실패로 응답하지 않도록, 다음 배치에서 다시 계산)
+        Args:
+            user_id (int): 사용자 ID
+        """
+        try:
+            items = self._load_user_interactions(user_id)
+            if not items:
+                redis_client.delete(USER_KEY.format(user_id))
+                return
+
+            scores = {}
+            neighbour_lists = redis_client.mget([ITEM_KEY.format(job_id) for job_id in items])
+            for weight, raw in zip(items.values(), neighbour_lists):
+                for job_id, similarity in json.loads(raw) if raw else ():
+                    if job_id not in items:
+                        scores[job_id] = scores.get(job_id, 0.0) + weight * similarity
+
+            top = heapq.nsmallest(RECOMMEND_TOP_N, scores.items(), key=lambda item: (-item[1], item[0]))
+            if top:
+                redis_client.set(USER_KEY.format(user_id), json.dumps([[job_id, round(score, 4)] for job_id, score in top]),
+                                 ex=RECOMMEND_TTL)
+            else:
+                redis_client.delete(USER_KEY.format(user_id))
+        except (RedisError, mysql.connector.Error) as e:
+            print(f"Recommendation refresh error (user {user_id}): {e}")
+
+    def get(self, user_id, limit):
+        """
+        사용자 추천 공고 조회
+        Args:
+            user_id (int): 사용자 ID
+            limit (int): 최대 개수
+        Returns:
+            tuple: ('personalized' 또는 'popular', [[공고 ID, 점수]])
+        """
+        raw = redis_client.get(USER_KEY.format(user_id))
+        if raw is not None:
+            return "personalized", json.loads(raw)[:limit]
+        raw = redis_client.get(POPULAR_KEY)
+        return "popular", (json.loads(raw)[:limit] if raw else [])
+
+    def _store(self, key_format, row_ids, column_ids, chunk_results):
+        # 계산이 끝난 구간부터 파이프라인으로 저장, 결과가 없는 행은 키 삭제
+        for start, rows in chunk_results:
+            pipe = redis_client.pipeline(transaction=False)
+            for offset, (columns, scores) in enumerate(rows):
+                key = key_format.format(row_ids[start + offset])
+                if len(columns):
+                    pipe.set(key, json.dumps(self._pairs(column_ids[columns], scores)), ex=RECOMMEND_TTL)
+                else:
+                    pipe.delete(key)
+            pipe.execute()
+
+    @staticmethod
+    def _pairs(ids, scores):
+        return [[int(job_id), round(float(score), 4)] for job_id, score in zip(ids, scores)]
+
+    @staticmethod
+    def _load_interactions():
+        """
+        전체 북마크/지원 내역
+        Returns:
+            tuple: (사용자 ID 배열, 공고 ID 배열, 가중치 배열)
+        """
+        users, jobs, weights = [], [], []
+        db = get_db(read_only=True)
+        cursor = db.cursor()
+        try:
+            for table, weight in WEIGHTS:
+                cursor.execute(f"SELECT user, job FROM {table}")
+                for user_id, job_id in cursor:
+                    users.append(user_id)
+                    jobs.append(job_id)
+                    weights.append(weight)
+        finally:
+            cursor.close()
+        return np.array(users, dtype=np.int64), np.array(jobs, dtype=np.int64), np.array(weights, dtype=np.float32)
+
+    @staticmethod
+    def _load_user_interactions(user_id):
+        """
+        사용자 한 명의 상호작용 공고와 가중치 (방금 커밋된 변경을 읽도록 주 DB 사용)
+        Returns:
+            dict: 공고 ID -> 가중치
+        """
+        items = {}
+        db = get_db()
+        cursor = db.cursor()
+        try:
+            for table, weight in WEIGHTS:
+                cursor.execute(f"SELECT job FROM {table} WHERE user = %s", (user_id,))
+                for (job_id,) in cursor.fetchall():
+                    items[job_id] = items.get(job_id, 0.0) + weight
+        finally:
+            cursor.close()
+        return items
+
+
+# 북마크/지원 내역 기반 공고 추천
+recommender = Recommender()
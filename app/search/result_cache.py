@@ -0,0 +1,95 @@
+import hashlib
+import threading
+from flask import json
+from redis.exceptions import RedisError
+from app.config import SEARCH_BACKEND, SEARCH_RESULT_CACHE_TTL
+from app.utils.cache import cache_get_json, cache_set_json
+from app.utils.conditional import get_generations
+
+# 프로세스 단위 캐시 적중/실패 카운터
+_stats_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0, "bypassed": 0}
+
+
+def active_filters(filters):
+    """
+    값이 지정된 검색 필터만 남김 (0은 유효한 값이므로 유지)
+    Args:
+        filters (dict): 검색 필터
+    Returns:
+        dict: None, 빈 문자열, 빈 목록을 제외한 필터
+    """
+    return {key: value for key, value in filters.items() if value is not None and value != '' and value != []}
+
+
+def filters_digest(*parts):
+    """
+    검색 필터(및 정렬 조건)를 정규화한 해시
+    - 빈 값은 제외하고 키 순서와 무관하게 같은 검색이면 같은 값
+    Args:
+        parts: 첫 번째는 검색 필터 dict, 나머지는 정렬 기준 등 추가 구분 값
+    Returns:
+        str: sha1 hex
+    """
+    filters, extra = parts[0], parts[1:]
+    normalized = {key: str(value) for key, value in active_filters(filters).items()}
+    raw = json.dumps([normalized, *extra], sort_keys=True)
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+
+def lookup(filters, sort_by, order):
+    """
+    검색 결과 캐시 조회
+    - 키에 job/company 세대 번호가 들어가므로 공고/회사가 바뀌면 이전 항목은 조회되지 않고 TTL로 만료됨
+    Args:
+        filters (dict): 검색 필터
+        sort_by (str): 정렬 기준
+        order (str): 정렬 순서
+    Returns:
+        tuple: (캐시 키, 항목 {"ids", "total", "complete"} 또는 None),
+               캐시를 사용할 수 없으면 (None, None)
+    """
+    if SEARCH_RESULT_CACHE_TTL <= 0:
+        return None, None
+    try:
+        (job_generation, _), (company_generation, _) = get_generations(['job', 'company'])
+    except RedisError as e:
+        print(f"Search cache generation error: {e}")
+        _count("bypassed")
+        return None, None
+
+    digest = filters_digest(filters, sort_by, order)
+    key = f"search:result:{SEARCH_BACKEND}:{digest}:{job_generation}:{company_generation}"
+    entry = cache_get_json(key)
+    _count("hits" if entry is not None else "misses")
+    return key, entry
+
+
+def store(key, ids, total, complete):
+    """
+    검색 결과 공고 ID 목록과 전체 수를 캐시에 저장
+    Args:
+        key (str): lookup이 반환한 캐시 키
+        ids (list): 정렬된 공고 ID (앞에서부터 최대 SEARCH_RESULT_CACHE_MAX_IDS개)
+        total (int): 전체 결과 수
+        complete (bool): ids가 전체 결과를 담고 있는지 여부
+    """
+    cache_set_json(key, {"ids": list(ids), "total": total, "complete": complete}, SEARCH_RESULT_CACHE_TTL)
+
+
+def stats():
+    """
+    현재 프로세스의 검색 결과 캐시 적중/실패 카운터
+    Returns:
+        dict: hits, misses, bypassed(Redis 오류로 캐시 미사용), hit_ratio
+    """
+    with _stats_lock:
+        result = dict(_stats)
+    lookups = result["hits"] + result["misses"]
+    result["hit_ratio"] = round(result["hits"] / lookups, 4) if lookups else None
+    return result
+
+
+def _count(name):
+    with _stats_lock:
+        _stats[name] += 1
@@ -0,0 +1,198 @@
+import threading
+from collections import OrderedDict
+import numpy as np
+from scipy import sparse
+from app.search.index import job_index
+
+# 공고마다 보관하는 최대 이웃 수 (요청 limit 상한)
+MAX_NEIGHBOURS = 50
+# 보관할 이웃 목록 수 (LRU)
+CACHE_SIZE = 20000
+# 기본 행렬과 따로 계산하는 변경 공고 수 상한 (넘으면 행렬 재구성)
+DELTA_LIMIT = 500
+
+
+def features(doc):
+    """
+    유사도 계산용 특성 토큰 (기술, 지역, 회사, 분야)
+    Args:
+        doc (JobDoc): 색인 문서
+    Returns:
+        set: 특성 토큰
+    """
+    tokens = {f"tech:{tech}" for tech in doc.techs}
+    tokens.update(f"loc:{location}" for location in doc.locations)
+    tokens.update(f"sector:{sector.lower()}" for sector in doc.sectors)
+    if doc.company is not None:
+        tokens.add(f"company:{doc.company}")
+    return tokens
+
+
+class SimilarJobs:
+    """
+    기술/지역/회사/분야가 겹치는 비슷한 공고 (Jaccard 유사도).
+    - 공고를 특성 토큰의 이진 벡터로 보고 (행 = 공고 ID) scipy 희소 행렬 곱 한 번으로 전체 공고와의 교집합 크기 계산
+    - 공고별 상위 MAX_NEIGHBOURS개 이웃 목록을 LRU 캐시에 보관
+    - 공고 색인의 리스너로 변경을 받아, 변경 공고는 행렬을 다시 만들지 않고 별도 계산(델타)하고
+      변경 공고와 유사도가 목록 하한 이상이었거나 이상이 된 공고의 캐시만 무효화
+    """
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._columns = {}
+        self._rows = {}
+        self._matrix = sparse.csr_matrix((0, 0), dtype=np.float32)
+        self._row_sizes = np.zeros(0, dtype=np.float32)
+        self._delta = set()
+        self._pending = []
+        self._cache = OrderedDict()
+
+    # --- 색인 갱신 (JobSearchIndex 리스너) ---
+
+    def reset(self, docs):
+        with self._lock:
+            self._columns = {}
+            self._rows = {doc.id: self._encode(doc) for doc in docs}
+            self._build_matrix()
+            self._cache.clear()
+            self._pending = []
+
+    def on_add(self, doc):
+        with self._lock:
+            columns = self._encode(doc)
+            self._rows[doc.id] = columns
+            self._changed(doc.id, columns)
+
+    def on_remove(self, doc):
+        with self._lock:
+            columns = self._rows.pop(doc.id, None)
+            if columns is not None:
+                self._changed(doc.id, columns)
+
+    def _changed(self, job_id, columns):
+        # 행렬 재구성과 캐시 무효화는 다음 조회 때 한 번에 처리
+        self._delta.add(job_id)
+        self._pending.append(columns)
+        self._cache.pop(job_id, None)
+
+    def _encode(self, doc):
+        columns = [self._columns.setdefault(token, len(self._columns)) for token in features(doc)]
+        return np.array(sorted(columns), dtype=np.int32)
+
+    def _build_matrix(self):
+        size = max(self._rows) + 1 if self._rows else 0
+        self._matrix = self._stack([self._rows.get(job_id) for job_id in range(size)])
+        self._row_sizes = np.diff(self._matrix.indptr).astype(np.float32)
+        self._delta = set()
+
+    def _stack(self, rows):
+        # 특성 열 배열 목록(None은 빈 행)을 이진 희소 행렬로
+        indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+        indptr[1:] = np.cumsum([0 if row is None else len(row) for row in rows], dtype=np.int64)
+        present = [row for row in rows if row is not None]
+        indices = np.concatenate(present) if present else np.zeros(0, dtype=np.int32)
+        return sparse.csr_matrix(
+            (np.ones(len(indices), dtype=np.float32), indices, indptr), shape=(len(rows), len(self._columns))
+        )
+
+    # --- 조회 ---
+
+    def neighbours(self, job_id, limit=10):
+        """
+        비슷한 공고 조회 (유사도 내림차순, 같으면 id 오름차순)
+        - 색인 구성 여부는 호출자가 job_index.ready()로 확인 (구성 전이면 모든 공고가 None)
+        Args:
+            job_id (int): 기준 공고 ID
+            limit (int): 최대 개수 (MAX_NEIGHBOURS 이하)
+        Returns:
+            list: [(공고 ID, 유사도)], 색인에 없는 공고면 None
+        """
+        with self._lock:
+            self._apply_pending()
+            columns = self._rows.get(job_id)
+            if columns is None:
+                return None
+
+            entry = self._cache.get(job_id)
+            if entry is None:
+                ids, scores = self._similarities(columns)
+                keep = ids != job_id
+                ids, scores = self._top(ids[keep], scores[keep], MAX_NEIGHBOURS)
+                entry = (ids, scores)
+                self._cache[job_id] = entry
+                if len(self._cache) > CACHE_SIZE:
+                    self._cache.popitem(last=False)
+            else:
+                self._cache.move_to_end(job_id)
+
+        ids, scores = entry
+        return [(int(i), round(float(s), 4)) for i, s in zip(ids[:limit], scores[:limit])]
+
+    def _similarities(self, columns):
+        """
+        특성 열 목록과 Jaccard 유사도가 0보다 큰 공고
+        Returns:
+            tuple: (공고 ID 배열(오름차순), 유사도 배열)
+        """
+        # 기본 행렬: 희소 행렬 x 질의 벡터로 공고별 교집합 크기
+        query = np.zeros(self._matrix.shape[1], dtype=np.float32)
+        query[columns[columns < self._matrix.shape[1]]] = 1
+        overlap = self._matrix @ query
+        sizes = self._row_sizes
+
+        # 행렬 구성 이후 바뀐 공고는 현재 특성으로 다시 계산
+        if self._delta:
+            size = max(len(overlap), max(self._delta) + 1)
+            overlap = np.pad(overlap, (0, size - len(overlap)))
+            sizes = np.pad(sizes, (0, size - len(sizes)))
+            for changed_id in self._delta:
+                current = self._rows.get(changed_id)
+                overlap[changed_id] = 0 if current is None else np.intersect1d(current, columns, assume_unique=True).size
+                sizes[changed_id] = 0 if current is None else len(current)
+
+        ids = np.flatnonzero(overlap)
+        shared = overlap[ids]
+        return ids, shared / (len(columns) + sizes[ids] - shared)
+
+    @staticmethod
+    def _top(ids, scores, limit):
+        # 경계 값과 같은 유사도는 모두 포함해 정렬한 뒤 자름 (동점 순서를 id로 고정)
+        if len(scores) > limit:
+            bound = np.partition(scores, len(scores) - limit)[len(scores) - limit]
+            keep = scores >= bound
+            ids, scores = ids[keep], scores[keep]
+        order = np.lexsort((ids, -scores))[:limit]
+        return ids[order], scores[order]
+
+    def _apply_pending(self):
+        """
+        쌓인 변경을 캐시와 행렬에 반영
+        - 변경 전/후 특성과의 유사도가 캐시된 목록의 하한 이상인 공고만 무효화
+          (목록에 있었거나 새로 들어갈 수 있는 공고)
+        """
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+
+        if self._cache:
+            # 캐시된 공고 x 변경 공고의 교집합 크기를 희소 행렬 곱 한 번으로 계산
+            cached = list(self._cache.keys())
+            bounds = np.fromiter(
+                (scores[-1] if len(scores) >= MAX_NEIGHBOURS else 0.0 for _, scores in self._cache.values()),
+                dtype=np.float32, count=len(cached)
+            )
+            rows = self._stack([self._rows[job_id] for job_id in cached])
+            changes = self._stack(pending)
+            overlap = (rows @ changes.T).tocoo()
+            row_sizes = np.diff(rows.indptr).astype(np.float32)
+            change_sizes = np.diff(changes.indptr).astype(np.float32)
+            similarity = overlap.data / (change_sizes[overlap.col] + row_sizes[overlap.row] - overlap.data)
+            for position in np.unique(overlap.row[similarity >= bounds[overlap.row]]):
+                self._cache.pop(cached[position], None)
+
+        if len(self._delta) > DELTA_LIMIT:
+            self._build_matrix()
+
+
+# 공고 색인을 따라 갱신되는 비슷한 공고 계산기
+job_similar = SimilarJobs()
+job_index.add_listener(job_similar)
@@ -0,0 +1,200 @@
+import bisect
+import heapq
+from collections import Counter
+import numpy as np
+from app.search.index import job_index
+
+# 정렬 배열과 따로 보관하는 추가 항목 수 상한 (넘으면 다시 구성, 조회 시 추가 항목 확인 시간의 상한)
+DELTA_LIMIT = 2000
+# 인기도 점수: 공고 수를 상위 비트에, 짧은 표시 문자열 우선을 하위 비트에 둠
+LENGTH_BITS = 16
+
+
+def normalize(text):
+    """
+    자동완성용 문자열 정규화 (소문자, 연속 공백 하나로)
+    """
+    return " ".join((text or '').lower().split())
+
+
+def word_suffixes(text):
+    """
+    단어 시작 위치마다의 접미 문자열 ("python 백엔드 개발자" -> 전체, "백엔드 개발자", "개발자")
+    - 제목 중간 단어로 입력해도 접두사 검색으로 찾을 수 있게 함
+    """
+    words = text.split(' ')
+    return [" ".join(words[i:]) for i in range(len(words)) if words[i]]
+
+
+def score(count, display):
+    """
+    정렬용 인기도 점수 (공고 수 내림차순, 같으면 짧은 문자열 우선), 공고가 없으면 0
+    """
+    if count <= 0:
+        return 0
+    return count << LENGTH_BITS | ((1 << LENGTH_BITS) - 1 - min(len(display), (1 << LENGTH_BITS) - 1))
+
+
+class PrefixIndex:
+    """
+    공고 제목/회사명 자동완성용 접두사 색인.
+    - 정렬된 (정규화 키, 종류, 표시 문자열) 배열에서 bisect로 접두사 범위를 찾음
+    - 배열 위의 최댓값 세그먼트 트리(인기도 점수)를 힙으로 탐색하여, 범위 크기와 관계없이
+      접두사 범위 안의 인기 상위 항목만 O(limit · log n)에 찾음 (짧은 접두사도 정확한 인기순)
+    - 인기도는 같은 제목/회사의 공고 수이며, 공고 색인(JobSearchIndex)의 증분 갱신을 그대로 따라감:
+      기존 항목은 트리 값만 갱신하고, 새 항목은 DELTA_LIMIT개까지 별도 정렬 목록에 두었다가 넘으면 다시 구성
+    """
+    def __init__(self):
+        self._counts = Counter()
+        self._keys = []
+        self._tree = np.zeros(2, dtype=np.int64)
+        self._size = 1
+        self._extra = []
+
+    def reset(self, docs):
+        """
+        색인 문서 전체로 다시 구성
+        Args:
+            docs (iterable): JobDoc 목록
+        """
+        counts = Counter()
+        for doc in docs:
+            counts.update(self._phrases(doc))
+        self._counts = counts
+        self._build()
+
+    def on_add(self, doc):
+        for phrase in self._phrases(doc):
+            self._counts[phrase] += 1
+            self._changed(phrase)
+
+    def on_remove(self, doc):
+        for phrase in self._phrases(doc):
+            self._counts[phrase] -= 1
+            if self._counts[phrase] <= 0:
+                del self._counts[phrase]
+            self._changed(phrase)
+
+    def _build(self):
+        # 정렬 배열과 세그먼트 트리(잎 = 배열 위치, 내부 노드 = 자식 최댓값) 구성
+        keys = sorted(
+            (key, kind, display) for kind, display in self._counts for key in word_suffixes(normalize(display))
+        )
+        size = 1
+        while size < len(keys):
+            size *= 2
+        scores = {phrase: score(count, phrase[1]) for phrase, count in self._counts.items()}
+        tree = np.zeros(2 * size, dtype=np.int64)
+        tree[size:size + len(keys)] = [scores[kind, display] for _, kind, display in keys]
+        level = size
+        while level > 1:
+            tree[level // 2:level] = np.maximum(tree[level:2 * level:2], tree[level + 1:2 * level:2])
+            level //= 2
+        self._keys, self._tree, self._size, self._extra = keys, tree, size, []
+
+    def _changed(self, phrase):
+        """
+        표시 문자열의 공고 수 변경 반영
+        - 정렬 배열에 있는 항목은 트리 값을 갱신 (공고가 없어지면 0으로 두어 결과에서 제외)
+        - 배열에 없는 새 항목은 추가 목록에 넣고, 추가 목록이 DELTA_LIMIT를 넘으면 다시 구성
+        """
+        kind, display = phrase
+        count = self._counts.get(phrase, 0)
+        for key in word_suffixes(normalize(display)):
+            entry = (key, kind, display)
+            i = bisect.bisect_left(self._keys, entry)
+            if i < len(self._keys) and self._keys[i] == entry:
+                self._update(i, score(count, display))
+                continue
+            j = bisect.bisect_left(self._extra, entry)
+            present = j < len(self._extra) and self._extra[j] == entry
+            if count > 0 and not present:
+                self._extra.insert(j, entry)
+            elif count <= 0 and present:
+                del self._extra[j]
+
+        if len(self._extra) > DELTA_LIMIT:
+            self._build()
+
+    def _update(self, position, value):
+        tree = self._tree
+        node = self._size + position
+        tree[node] = value
+        node //= 2
+        while node:
+            tree[node] = max(tree[2 * node], tree[2 * node + 1])
+            node //= 2
+
+    def suggest(self, query, limit=10):
+        """
+        접두사로 시작하는 제목/회사명을 인기도(공고 수) 순으로 조회
+        Args:
+            query (str): 입력 중인 검색어
+            limit (int): 최대 개수
+        Returns:
+            list: [{"text", "type", "count"}]
+        """
+        prefix = normalize(query)
+        if not prefix:
+            return []
+
+        matches = self._top_in_range(prefix, limit)
+        extra = self._extra
+        for key, kind, display in extra[bisect.bisect_left(extra, (prefix,)):]:
+            if not key.startswith(prefix):
+                break
+            matches[(kind, display)] = self._counts.get((kind, display), 0)
+
+        top = heapq.nlargest(limit, matches.items(), key=lambda item: score(item[1], item[0][1]))
+        return [{"text": display, "type": kind, "count": count} for (kind, display), count in top]
+
+    def _top_in_range(self, prefix, limit):
+        """
+        정렬 배열의 접두사 범위에서 인기 상위 limit개 (같은 표시 문자열의 여러 접미 항목은 하나로)
+        Returns:
+            dict: (종류, 표시 문자열) -> 공고 수
+        """
+        keys, tree, size = self._keys, self._tree, self._size
+        lo = bisect.bisect_left(keys, (prefix,))
+        hi = bisect.bisect_left(keys, (prefix + '\U0010ffff',))
+
+        # 범위를 덮는 트리 노드에서 시작해 점수가 큰 노드부터 펼침
+        heap = []
+        left, right = lo + size, hi + size
+        while left < right:
+            if left & 1:
+                heap.append((-int(tree[left]), left))
+                left += 1
+            if right & 1:
+                right -= 1
+                heap.append((-int(tree[right]), right))
+            left //= 2
+            right //= 2
+        heapq.heapify(heap)
+
+        matches = {}
+        while heap and len(matches) < limit:
+            value, node = heapq.heappop(heap)
+            if value == 0:
+                break
+            if node >= size:
+                _, kind, display = keys[node - size]
+                matches[(kind, display)] = self._counts.get((kind, display), 0)
+            else:
+                heapq.heappush(heap, (-int(tree[2 * node]), 2 * node))
+                heapq.heappush(heap, (-int(tree[2 * node + 1]), 2 * node + 1))
+        return matches
+
+    @staticmethod
+    def _phrases(doc):
+        phrases = []
+        if doc.title:
+            phrases.append(('title', doc.title.strip()))
+        if doc.company_name:
+            phrases.append(('company', doc.company_name.strip()))
+        return phrases
+
+
+# 공고 색인을 따라 갱신되는 제목/회사명 자동완성 색인
+job_suggest = PrefixIndex()
+job_index.add_listener(job_suggest)
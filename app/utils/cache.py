@@ -0,0 +1,45 @@
+from flask import json
+from redis.exceptions import RedisError
+from app.utils.redis_client import redis_client
+
+def cache_get_json(key):
+    """
+    캐시에서 JSON 값 조회
+    Args:
+        key (str): 캐시 키
+    Returns:
+        캐시된 값, 없거나 Redis 오류 시 None
+    """
+    try:
+        raw = redis_client.get(key)
+    except RedisError as e:
+        print(f"Cache get error ({key}): {e}")
+        return None
+    return json.loads(raw) if raw is not None else None
+
+def cache_set_json(key, value, ttl):
+    """
+    값을 JSON으로 직렬화하여 캐시에 저장
+    - 앱의 JSON provider로 직렬화하므로 캐시 적중 시 응답과 같은 형태(날짜 형식 등)를 유지
+    Args:
+        key (str): 캐시 키
+        value: 저장할 값
+        ttl (int): 만료 시간(초)
+    """
+    try:
+        redis_client.set(key, json.dumps(value), ex=ttl)
+    except RedisError as e:
+        print(f"Cache set error ({key}): {e}")
+
+def cache_delete(*keys):
+    """
+    캐시 키 삭제 (명시적 무효화)
+    Args:
+        keys (str): 삭제할 캐시 키 목록
+    """
+    if not keys:
+        return
+    try:
+        redis_client.delete(*keys)
+    except RedisError as e:
+        print(f"Cache delete error ({', '.join(keys)}): {e}")
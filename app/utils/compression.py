@@ -0,0 +1,103 @@
+import gzip
+import hashlib
+import threading
+from collections import OrderedDict
+from flask import request
+
+# 선택 의존성: 설치되어 있으면 brotli/zstd도 협상
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# 협상 가능한 인코딩 (서버 선호 순서)
+ENCODINGS = ('zstd', 'br', 'gzip')
+
+# 압축 대상 MIME 타입
+COMPRESSIBLE_TYPES = ('application/json', 'text/', 'application/x-ndjson')
+
+
+def _compressors(level):
+    compressors = OrderedDict()  # 서버 선호 순서
+    if zstandard is not None:
+        compressors['zstd'] = zstandard.ZstdCompressor(level=3).compress
+    if brotli is not None:
+        compressors['br'] = lambda data: brotli.compress(data, quality=4)
+    compressors['gzip'] = lambda data: gzip.compress(data, compresslevel=level)
+    return compressors
+
+
+class CompressedCache:
+    """
+    압축 결과 LRU 캐시 (프로세스 내)
+    - 같은 본문(본문 해시)과 인코딩이면 다시 압축하지 않음
+    """
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            value = self._items.get(key)
+            if value is not None:
+                self._items.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_entries:
+                self._items.popitem(last=False)
+
+
+def init_app(app):
+    """
+    Accept-Encoding 협상 기반 응답 압축 단계 등록
+    - COMPRESS_MIN_SIZE보다 작은 본문, 스트리밍 응답, 이미 인코딩된 응답은 건너뜀
+    Args:
+        app (Flask): Flask 애플리케이션
+    """
+    min_size = app.config.get('COMPRESS_MIN_SIZE', 1024)
+    compressors = _compressors(app.config.get('COMPRESS_LEVEL', 6))
+    cache = CompressedCache(app.config.get('COMPRESS_CACHE_SIZE', 256))
+
+    @app.after_request
+    def compress_response(response):
+        response.vary.add('Accept-Encoding')
+
+        if (response.status_code != 200
+                or response.direct_passthrough
+                or response.is_streamed
+                or 'Content-Encoding' in response.headers
+                or not (response.mimetype or '').startswith(COMPRESSIBLE_TYPES)):
+            return response
+
+        encoding = request.accept_encodings.best_match(list(compressors))
+        if not encoding:
+            return response
+
+        body = response.get_data()
+        if len(body) < min_size:
+            return response
+
+        # 본문 해시를 캐시 키로 사용 (세대 기반 ETag는 뷰 실행 전에 정해지므로, 복제 지연이나
+        # 프로세스별 색인 동기화 지연 동안 같은 ETag에 다른 본문이 올 수 있음)
+        etag, _ = response.get_etag()
+        key = (hashlib.sha1(body).hexdigest(), encoding)
+        compressed = cache.get(key)
+        if compressed is None:
+            compressed = compressors[encoding](body)
+            cache.set(key, compressed)
+
+        response.set_data(compressed)
+        response.headers['Content-Encoding'] = encoding
+        if etag:
+            response.set_etag(f"{etag}-{encoding}")  # 표현(인코딩)별로 다른 강한 ETag
+        return response
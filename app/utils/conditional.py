@@ -0,0 +1,120 @@
+import hashlib
+import time
+from datetime import datetime, timezone
+from functools import wraps
+from flask import g, request, make_response
+from redis.exceptions import RedisError
+from app.config import READ_YOUR_WRITES_WINDOW
+from app.utils.db import read_from_primary
+from app.utils.redis_client import redis_client
+from app.utils.compression import ENCODINGS
+
+def bump_generation(*names):
+    """
+    데이터 변경 후 세대(generation) 번호와 변경 시각 갱신
+    - 커밋 이후에 호출하며, 해당 세대에 의존하는 ETag가 모두 바뀜
+    Args:
+        names (str): 세대 이름 목록 (예: 'job', 'job:12', 'company')
+    """
+    if not names:
+        return
+    now = int(time.time())
+    try:
+        pipe = redis_client.pipeline()
+        for name in names:
+            pipe.hincrby(f"generation:{name}", "v", 1)
+            pipe.hset(f"generation:{name}", "ts", now)
+        pipe.execute()
+    except RedisError as e:
+        print(f"Generation bump error ({', '.join(names)}): {e}")
+
+def get_generations(names):
+    """
+    세대 번호와 마지막 변경 시각 조회
+    - 키가 없으면(Redis 초기화 등) 현재 시각(ms)을 시작 번호로 설정하여 이전 ETag와 겹치지 않게 함
+    Args:
+        names (list): 세대 이름 목록
+    Returns:
+        list: (세대 번호, 마지막 변경 시각) 목록
+    """
+    pipe = redis_client.pipeline()
+    for name in names:
+        pipe.hmget(f"generation:{name}", "v", "ts")
+    rows = pipe.execute()
+
+    missing = [name for name, (version, _) in zip(names, rows) if version is None]
+    if missing:
+        now = time.time()
+        pipe = redis_client.pipeline()
+        for name in missing:
+            pipe.hsetnx(f"generation:{name}", "v", int(now * 1000))
+            pipe.hsetnx(f"generation:{name}", "ts", int(now))
+        pipe.execute()
+        return get_generations(names)
+
+    return [(int(version), int(ts)) for version, ts in rows]
+
+def recently_changed(generations):
+    """
+    세대 중 하나라도 복제 지연 기간(READ_YOUR_WRITES_WINDOW) 안에 바뀌었는지 확인
+    Args:
+        generations (list): get_generations가 반환한 (세대 번호, 마지막 변경 시각) 목록
+    Returns:
+        bool: 최근에 바뀐 세대가 있으면 True
+    """
+    # 변경 시각은 초 단위로 내림되어 저장되므로 1초 여유를 둠
+    return time.time() - max((ts for _, ts in generations), default=0) <= READ_YOUR_WRITES_WINDOW + 1
+
+def conditional(dependencies):
+    """
+    조건부 GET(ETag / Last-Modified) 데코레이터
+    - 의존하는 세대 번호와 요청 경로(쿼리 포함)로 강한 ETag를 만들고,
+      If-None-Match/If-Modified-Since가 일치하면 뷰 함수(본 쿼리)를 실행하지 않고 304 반환
+    - 세대가 복제 지연 기간 안에 바뀌었으면 뷰 함수의 읽기를 주 DB에서 처리
+      (ETag는 뷰 실행 전의 세대로 정해지므로, 복제본의 이전 데이터에 새 ETag가 붙으면 다음 변경 전까지 304로 유지됨)
+    - Redis를 사용할 수 없으면 조건부 처리 없이 뷰 함수 실행
+    Args:
+        dependencies (list 또는 callable): 세대 이름 목록, 또는 뷰 인자(kwargs)를 받아 목록을 반환하는 함수
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            names = dependencies(**kwargs) if callable(dependencies) else dependencies
+            try:
+                generations = get_generations(names)
+            except RedisError as e:
+                print(f"Conditional GET skipped: {e}")
+                return func(*args, **kwargs)
+
+            state = ",".join(f"{name}={version}" for name, (version, _) in zip(names, generations))
+            etag = hashlib.sha1(f"{request.full_path}|{state}".encode('utf-8')).hexdigest()
+            last_modified = datetime.fromtimestamp(max(ts for _, ts in generations), tz=timezone.utc)
+
+            if request.if_none_match:
+                # 압축 응답은 "<etag>-<인코딩>" 형태의 ETag를 가짐 (compression 참고)
+                matched = [tag for tag in [etag] + [f"{etag}-{encoding}" for encoding in ENCODINGS]
+                           if request.if_none_match.contains(tag)]
+                not_modified = bool(matched)
+                if matched:
+                    etag = matched[0]
+            else:
+                not_modified = bool(request.if_modified_since) and last_modified <= request.if_modified_since
+            if not_modified:
+                response = make_response("", 304)
+            else:
+                if recently_changed(generations):
+                    read_from_primary()
+                response = make_response(func(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+                if g.pop('serving_stale', False):
+                    # 이전 세대로 계산된 값(swr_cache)에 현재 세대 ETag를 붙이면 갱신 후에도 304가 됨
+                    response.headers['Cache-Control'] = 'no-cache'
+                    return response
+
+            response.set_etag(etag)
+            response.last_modified = last_modified
+            response.headers['Cache-Control'] = 'no-cache'  # 매번 재검증
+            return response
+        return wrapper
+    return decorator
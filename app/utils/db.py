@@ -1,21 +1,154 @@
 import mysql.connector
-from mysql.connector import pooling
-from app.config import DATABASE_CONFIG
-
-# 데이터베이스 연결 풀 생성
-db_pool = pooling.MySQLConnectionPool(
-    pool_name="mypool",
-    pool_size=30,  # 풀 크기
-    **DATABASE_CONFIG
+from redis.exceptions import RedisError
+from flask import g, has_app_context, has_request_context, request
+from app.config import (
+    DATABASE_CONFIG, DB_POOL_CONFIG, DB_REPLICA_HOSTS, DB_REPLICA_RETRY_INTERVAL, READ_YOUR_WRITES_WINDOW
 )
+from app.utils.db_pool import ConnectionPool, PoolTimeoutError, ReplicaRouter
+from app.utils.redis_client import mark_recent_write, has_recent_write
 
-def get_db():
+# 데이터베이스 연결 풀 생성 (크기/대기 시간 등은 config의 DB_POOL_CONFIG)
+db_pool = ConnectionPool(**DB_POOL_CONFIG, **DATABASE_CONFIG)
+
+def _replica_config(host):
+    name, _, port = host.partition(':')
+    return dict(DATABASE_CONFIG, host=name, port=port or DATABASE_CONFIG['port'])
+
+# 읽기 전용 복제본 풀 (DB_REPLICA_HOSTS가 비어 있으면 None)
+replica_router = ReplicaRouter(
+    {host: ConnectionPool(**DB_POOL_CONFIG, **_replica_config(host)) for host in DB_REPLICA_HOSTS},
+    retry_interval=DB_REPLICA_RETRY_INTERVAL
+) if DB_REPLICA_HOSTS else None
+
+# 응답 전에 read-your-writes 기간을 기록할 쓰기 메서드
+WRITE_METHODS = {'POST', 'PUT', 'PATCH', 'DELETE'}
+
+def get_db(read_only=False):
     """
     데이터베이스 연결 객체를 반환.
-    - 연결 풀에서 가져와 재사용.
+    - 요청(앱 컨텍스트) 안에서는 연결을 g에 보관하여 같은 요청의 모델 호출이 하나의 연결을 공유.
+    - read_only=True이면 복제본 연결을 반환. 단, 이미 주 DB 연결을 쓰는 요청이거나
+      사용자가 최근에 쓰기를 했다면(read-your-writes) 주 DB 연결을 반환.
+    - 연결은 teardown 시 close_db에서 풀로 반환.
+    - 앱 컨텍스트 밖(스크립트 등)에서는 풀에서 새 연결을 반환하며, 호출자가 직접 close 해야 함.
+    Args:
+        read_only (bool): SELECT만 수행하는 호출인지 여부
+    """
+    if not has_app_context():
+        return _checkout()
+
+    if read_only and 'db' not in g and _can_use_replica():
+        if 'db_read' not in g:
+            g.db_read = replica_router.get_connection()
+        if g.db_read is not None:
+            return g.db_read
+
+    if 'db' not in g:
+        g.db = _checkout()
+    return g.db
+
+def read_from_primary():
     """
+    현재 요청(앱 컨텍스트)의 이후 읽기를 복제본 대신 주 DB에서 처리
+    - 데이터가 방금 바뀌어 복제본이 아직 따라오지 못했을 수 있는 경우에 사용 (conditional, swr_cache 참고)
+    """
+    if has_app_context():
+        g.read_primary = True
+
+def close_db(error=None):
+    """
+    요청에 바인딩된 연결을 풀로 반환.
+    - 에러로 끝난 요청은 커밋되지 않은 변경을 롤백한 뒤 반환.
+    Args:
+        error (Exception, optional): teardown 시 전달되는 예외
+    """
+    replica = g.pop('db_read', None)
+    if replica is not None:
+        replica.close()
+
+    db = g.pop('db', None)
+    if db is None:
+        return
+
+    try:
+        if error is not None:
+            db.rollback()
+    except mysql.connector.Error as err:
+        print(f"Database rollback error: {err}")
+    finally:
+        db.close()  # 풀 연결의 close()는 연결을 풀로 되돌림
+
+def record_write(response):
+    """
+    주 DB를 사용한 쓰기 요청이 성공하면 사용자의 read-your-writes 기간을 기록.
+    - 응답이 나가기 전(after_request)에 기록하여, 바로 이어지는 조회도 주 DB에서 읽도록 함
+      (teardown에서 기록하면 클라이언트의 다음 요청이 먼저 복제본에 도달할 수 있음)
+    Args:
+        response (Response): 응답 객체
+    Returns:
+        Response: 전달받은 응답
+    """
+    if replica_router and 'db' in g and request.method in WRITE_METHODS and response.status_code < 400:
+        user_id = _current_user_id()
+        if user_id is not None:
+            try:
+                mark_recent_write(user_id, READ_YOUR_WRITES_WINDOW)
+            except RedisError as err:
+                print(f"Failed to record recent write: {err}")
+    return response
+
+def init_app(app):
+    """
+    Flask 앱에 read-your-writes 기록(after_request)과 연결 반환(teardown) 핸들러 등록
+    Args:
+        app (Flask): Flask 애플리케이션
+    """
+    app.after_request(record_write)
+    app.teardown_appcontext(close_db)
+
+    # 시작 시 연결 미리 생성
+    warmup = app.config.get('DB_POOL_WARMUP', 0)
+    if warmup:
+        try:
+            db_pool.warm_up(warmup)
+        except mysql.connector.Error as err:
+            app.logger.warning(f"Database pool warm-up failed: {err}")
+
+def pool_stats():
+    """
+    연결 풀 상태 카운터 조회
+    Returns:
+        dict: 사용 중/유휴 연결 수, 대여/타임아웃 횟수, 대기 시간 히스토그램 (복제본 포함)
+    """
+    stats = db_pool.stats()
+    if replica_router:
+        stats['replicas'] = replica_router.stats()
+    return stats
+
+def _can_use_replica():
+    if replica_router is None or g.get('read_primary'):
+        return False
+
+    # 최근에 쓰기를 한 사용자는 복제 지연 동안 주 DB에서 읽음
+    if 'recent_write' not in g:
+        user_id = _current_user_id()
+        try:
+            g.recent_write = user_id is not None and has_recent_write(user_id)
+        except RedisError:
+            g.recent_write = True  # 확인할 수 없으면 주 DB 사용
+    return not g.recent_write
+
+def _current_user_id():
+    if not has_request_context():
+        return None
+    user = getattr(request, 'user', None)
+    return user.get('id') if user else None
+
+def _checkout():
     try:
         return db_pool.get_connection()
+    except PoolTimeoutError:
+        raise
     except mysql.connector.Error as err:
         print(f"Database connection error: {err}")
         raise
@@ -0,0 +1,271 @@
+import bisect
+import threading
+import time
+from collections import deque
+import mysql.connector
+
+# 대기 시간 히스토그램 버킷 경계 (초)
+WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+
+class PoolTimeoutError(mysql.connector.Error):
+    """
+    풀의 모든 연결이 사용 중이고 대기 시간 안에 반환되지 않은 경우 발생
+    """
+
+
+class PooledConnection:
+    """
+    풀에서 빌려준 연결의 프록시.
+    - close() 호출 시 실제로 닫지 않고 풀로 반환.
+    - 그 외 속성/메서드는 실제 연결 객체에 위임.
+    """
+    def __init__(self, pool, conn):
+        self._pool = pool
+        self._conn = conn
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+    def close(self):
+        if self._conn is None:
+            return
+        conn, self._conn = self._conn, None
+        self._pool.release(conn)
+
+
+class ConnectionPool:
+    """
+    대기열이 있는 MySQL 연결 풀.
+    - pool_size 개의 연결을 유지하고, 부족하면 max_overflow 개까지 임시 연결을 추가 생성.
+    - 한도에 도달하면 timeout 초 동안 반환을 기다린 뒤 PoolTimeoutError 발생.
+    - pre_ping이 켜져 있으면 대여 전에 연결 상태를 확인하고 끊긴 연결은 재연결.
+    """
+    def __init__(self, pool_size, max_overflow, timeout, pre_ping=True, recycle=None, **db_config):
+        self.pool_size = pool_size
+        self.max_overflow = max_overflow
+        self.timeout = timeout
+        self.pre_ping = pre_ping
+        self.recycle = recycle
+        self._db_config = db_config
+
+        self._idle = deque()  # 유휴 연결 (LIFO)
+        self._created_at = {}
+        self._total = 0  # 생성된 연결 수 (사용 중 + 유휴)
+        self._cond = threading.Condition()
+
+        # 텔레메트리
+        self._checkouts = 0
+        self._timeouts = 0
+        self._reconnects = 0
+        self._waiting = 0
+        self._wait_histogram = [0] * (len(WAIT_BUCKETS) + 1)
+
+    def warm_up(self, count=None):
+        """
+        시작 시 연결을 미리 생성하여 유휴 목록에 채움
+        Args:
+            count (int, optional): 생성할 연결 수 (기본값: pool_size)
+        Returns:
+            int: 새로 생성된 연결 수
+        """
+        count = self.pool_size if count is None else min(count, self.pool_size)
+        created = 0
+        while True:
+            with self._cond:
+                if self._total >= count:
+                    break
+                self._total += 1
+            try:
+                conn = self._connect()
+            except mysql.connector.Error:
+                with self._cond:
+                    self._total -= 1
+                raise
+            with self._cond:
+                self._idle.append(conn)
+                self._cond.notify()
+            created += 1
+        return created
+
+    def get_connection(self):
+        """
+        풀에서 연결을 대여
+        Returns:
+            PooledConnection: close() 시 풀로 반환되는 연결
+        Raises:
+            PoolTimeoutError: 대기 시간 초과
+        """
+        start = time.monotonic()
+        deadline = start + self.timeout
+        conn = None
+        with self._cond:
+            while True:
+                if self._idle:
+                    conn = self._idle.pop()  # LIFO: 최근에 쓴 연결 우선
+                    break
+                if self._total < self.pool_size + self.max_overflow:
+                    self._total += 1
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._timeouts += 1
+                    raise PoolTimeoutError(
+                        f"Connection pool exhausted: no connection available within {self.timeout}s"
+                    )
+                self._waiting += 1
+                try:
+                    self._cond.wait(remaining)
+                finally:
+                    self._waiting -= 1
+
+        try:
+            conn = self._prepare(conn)
+        except mysql.connector.Error:
+            with self._cond:
+                self._total -= 1
+                self._cond.notify()
+            raise
+
+        with self._cond:
+            self._checkouts += 1
+            self._record_wait(time.monotonic() - start)
+        return PooledConnection(self, conn)
+
+    def release(self, conn):
+        """
+        대여한 연결을 반환. 열린 트랜잭션은 롤백하고,
+        유휴 연결이 pool_size를 넘으면(overflow) 실제로 닫음.
+        Args:
+            conn: 실제 MySQL 연결 객체
+        """
+        healthy = True
+        try:
+            conn.rollback()
+        except mysql.connector.Error:
+            healthy = False
+
+        with self._cond:
+            if healthy and len(self._idle) < self.pool_size:
+                self._idle.append(conn)
+                conn = None
+            else:
+                self._total -= 1
+                self._created_at.pop(id(conn), None)
+            self._cond.notify()
+
+        if conn is not None:
+            self._discard(conn)
+
+    def stats(self):
+        """
+        풀 상태 카운터 조회
+        Returns:
+            dict: 사용 중/유휴 연결 수, 대여 횟수, 타임아웃 횟수, 대기 시간 히스토그램 등
+        """
+        with self._cond:
+            idle = len(self._idle)
+            labels = [f"le_{bound}" for bound in WAIT_BUCKETS] + ["le_inf"]
+            return {
+                "pool_size": self.pool_size,
+                "max_overflow": self.max_overflow,
+                "in_use": self._total - idle,
+                "idle": idle,
+                "waiting": self._waiting,
+                "checkouts": self._checkouts,
+                "timeouts": self._timeouts,
+                "reconnects": self._reconnects,
+                "wait_histogram": dict(zip(labels, self._wait_histogram)),
+            }
+
+    def _prepare(self, conn):
+        # 새 슬롯이면 연결 생성
+        if conn is None:
+            return self._connect()
+
+        # 수명이 지난 연결은 교체
+        if self.recycle and time.monotonic() - self._created_at.get(id(conn), 0) > self.recycle:
+            self._discard(conn)
+            return self._reconnect()
+
+        # 대여 전 연결 상태 확인
+        if self.pre_ping:
+            try:
+                conn.ping(reconnect=False)
+            except mysql.connector.Error:
+                self._discard(conn)
+                return self._reconnect()
+        return conn
+
+    def _connect(self):
+        conn = mysql.connector.connect(**self._db_config)
+        self._created_at[id(conn)] = time.monotonic()
+        return conn
+
+    def _reconnect(self):
+        with self._cond:
+            self._reconnects += 1
+        return self._connect()
+
+    def _discard(self, conn):
+        self._created_at.pop(id(conn), None)
+        try:
+            conn.close()
+        except mysql.connector.Error:
+            pass
+
+    def _record_wait(self, seconds):
+        self._wait_histogram[bisect.bisect_left(WAIT_BUCKETS, seconds)] += 1
+
+
+class ReplicaRouter:
+    """
+    읽기 전용 복제본 풀 묶음.
+    - 정상 상태인 복제본을 라운드 로빈으로 선택.
+    - 연결 실패한 복제본은 retry_interval 초 동안 제외한 뒤 다시 시도.
+    """
+    def __init__(self, pools, retry_interval=30):
+        self.pools = pools  # {"host:port": ConnectionPool}
+        self.retry_interval = retry_interval
+        self._names = list(pools)
+        self._next = 0
+        self._down_until = {}
+        self._lock = threading.Lock()
+
+    def get_connection(self):
+        """
+        정상 복제본에서 연결 대여
+        Returns:
+            PooledConnection 또는 None: 사용할 수 있는 복제본이 없으면 None
+        """
+        for name in self._candidates():
+            try:
+                return self.pools[name].get_connection()
+            except PoolTimeoutError:
+                continue  # 바쁜 복제본은 건너뛰되 장애로 보지 않음
+            except mysql.connector.Error as err:
+                print(f"Replica {name} unavailable: {err}")
+                with self._lock:
+                    self._down_until[name] = time.monotonic() + self.retry_interval
+        return None
+
+    def stats(self):
+        """
+        복제본별 풀 상태와 장애 여부 조회
+        Returns:
+            dict: 복제본 이름 -> 풀 상태 카운터
+        """
+        now = time.monotonic()
+        result = {}
+        for name, pool in self.pools.items():
+            result[name] = dict(pool.stats(), healthy=self._down_until.get(name, 0) <= now)
+        return result
+
+    def _candidates(self):
+        now = time.monotonic()
+        with self._lock:
+            count = len(self._names)
+            start = self._next
+            self._next = (self._next + 1) % count if count else 0
+        ordered = [self._names[(start + i) % count] for i in range(count)]
+        return [name for name in ordered if self._down_until.get(name, 0) <= now]
@@ -0,0 +1,56 @@
+class InvalidFieldsError(ValueError):
+    """
+    허용 목록에 없는 필드를 요청한 경우 발생
+    """
+
+def parse_fields(raw, allowed, label='field'):
+    """
+    fields/include 등 쉼표 구분 쿼리 파라미터를 허용 목록으로 검증
+    Args:
+        raw (str): 요청된 필드 문자열 (예: "id,title,deadline"), 없으면 None
+        allowed (tuple): 리소스별 허용 필드 목록
+        label (str): 에러 메시지에 쓸 항목 이름
+    Returns:
+        list: 요청 순서를 유지한 필드 목록, 지정하지 않았으면 None (전체 필드)
+    Raises:
+        InvalidFieldsError: 허용되지 않은 필드가 포함된 경우
+    """
+    if raw is None or not raw.strip():
+        return None
+
+    fields = []
+    for name in raw.split(','):
+        name = name.strip()
+        if not name:
+            continue
+        if name not in allowed:
+            raise InvalidFieldsError(f"Invalid {label}: {name} (allowed: {', '.join(allowed)})")
+        if name not in fields:
+            fields.append(name)
+    return fields or None
+
+def select_columns(fields, table):
+    """
+    필드 목록을 SELECT 절 컬럼 목록으로 변환
+    Args:
+        fields (list): parse_fields 결과 (None이면 전체)
+        table (str): 테이블 이름 또는 별칭
+    Returns:
+        str: SELECT 절에 넣을 컬럼 문자열
+    """
+    if not fields:
+        return f"{table}.*"
+    return ", ".join(f"{table}.{field}" for field in fields)
+
+def project(rows, fields):
+    """
+    조회 행에서 요청한 필드만 남김 (정렬/커서 계산용으로 추가 조회한 컬럼 제거)
+    Args:
+        rows (list): 딕셔너리 행 목록
+        fields (list): 남길 필드 목록 (None이면 그대로 반환)
+    Returns:
+        list: 필드가 제한된 행 목록
+    """
+    if not fields:
+        return rows
+    return [{field: row[field] for field in fields} for row in rows]
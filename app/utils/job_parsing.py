@@ -0,0 +1,102 @@
+import re
+from datetime import date, timedelta
+
+_YEAR_RANGE = re.compile(r'(\d+)\s*[~\-]\s*(\d+)\s*년')
+_YEARS = re.compile(r'(\d+)\s*년\s*(↑|이상|↓|이하)?')
+_MONTH_DAY = re.compile(r'(\d{1,2})\s*/\s*(\d{1,2})')
+_FULL_DATE = re.compile(r'(\d{4})\s*[-./]\s*(\d{1,2})\s*[-./]\s*(\d{1,2})')
+
+
+def parse_career(text):
+    """
+    경력 조건 문자열을 최소/최대 경력 연수로 변환
+    - "신입" -> (0, 0), "경력 3년↑" -> (3, None), "경력 2~5년" -> (2, 5), "경력 5년↓" -> (1, 5)
+    - "경력무관", "신입·경력" -> (0, None), 연수 없는 "경력" -> (1, None)
+    Args:
+        text (str): 크롤링한 경력 조건 (고용 형태가 함께 들어 있어도 됨)
+    Returns:
+        tuple: (최소 경력 연수, 최대 경력 연수), 알 수 없는 값은 None
+    """
+    if not text:
+        return None, None
+    text = text.replace(' ', '')
+
+    if '무관' in text:
+        return 0, None
+
+    newcomer = '신입' in text
+    match = _YEAR_RANGE.search(text)
+    if match:
+        low, high = sorted((int(match.group(1)), int(match.group(2))))
+        return (0 if newcomer else low), high
+
+    match = _YEARS.search(text)
+    if match:
+        years = int(match.group(1))
+        if match.group(2) in ('↓', '이하'):
+            return (0 if newcomer else 1), years
+        return (0 if newcomer else years), None
+
+    if '경력' in text:
+        return (0 if newcomer else 1), None
+    if newcomer:
+        return 0, 0
+    return None, None
+
+
+def parse_deadline(text, today=None):
+    """
+    마감일 문자열을 날짜로 변환
+    - "~ 12/31(화)"처럼 연도가 없으면 기준일과 가장 가까운 연도로 추정 (연말에 수집한 "~ 01/05"는 다음 해)
+    - "오늘마감"/"내일마감"은 기준일 기준, "상시채용"/"채용시" 등 날짜가 없으면 None
+    Args:
+        text (str): 크롤링한 마감일
+        today (date, optional): 기준일 (기본값: 오늘)
+    Returns:
+        date 또는 None
+    """
+    if not text:
+        return None
+    today = today or date.today()
+
+    if '오늘' in text:
+        return today
+    if '내일' in text:
+        return today + timedelta(days=1)
+
+    match = _FULL_DATE.search(text)
+    if match:
+        try:
+            return date(*(int(part) for part in match.groups()))
+        except ValueError:
+            return None
+
+    match = _MONTH_DAY.search(text)
+    if not match:
+        return None
+    month, day = int(match.group(1)), int(match.group(2))
+    candidates = []
+    for year in (today.year - 1, today.year, today.year + 1):
+        try:
+            candidates.append(date(year, month, day))
+        except ValueError:
+            continue  # 잘못된 날짜 또는 평년의 2/29
+    return min(candidates, key=lambda candidate: abs(candidate - today)) if candidates else None
+
+
+def structured_fields(career_condition=None, deadline=None, today=None):
+    """
+    공고 저장 시 함께 채울 구조화 컬럼 값
+    Args:
+        career_condition (str, optional): 경력 조건 (None이면 결과에서 제외)
+        deadline (str, optional): 마감일 (None이면 결과에서 제외)
+        today (date, optional): 마감일 연도 추정 기준일
+    Returns:
+        dict: min_career_years, max_career_years, deadline_date 중 입력에 해당하는 값
+    """
+    fields = {}
+    if career_condition is not None:
+        fields['min_career_years'], fields['max_career_years'] = parse_career(career_condition)
+    if deadline is not None:
+        fields['deadline_date'] = parse_deadline(deadline, today)
+    return fields
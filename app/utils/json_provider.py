@@ -0,0 +1,81 @@
+from datetime import date, datetime, timezone
+from flask.json.provider import DefaultJSONProvider
+
+# 선택 의존성: orjson이 없으면 Flask 기본 JSON provider 사용
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_WEEKDAYS = ('Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun')
+_MONTHS = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+
+
+def _http_date(value):
+    # werkzeug http_date와 같은 결과를 내는 빠른 버전 (naive datetime은 UTC로 간주)
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc)
+        hour, minute, second = value.hour, value.minute, value.second
+    else:
+        hour = minute = second = 0
+    return (f"{_WEEKDAYS[value.weekday()]}, {value.day:02d} {_MONTHS[value.month - 1]} {value.year:04d} "
+            f"{hour:02d}:{minute:02d}:{second:02d} GMT")
+
+
+def _default(value):
+    if isinstance(value, date):
+        return _http_date(value)
+    return DefaultJSONProvider.default(value)
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    orjson 기반 JSON provider
+    - 딕셔너리 커서 행을 str을 거치지 않고 바로 bytes로 직렬화
+    - date/datetime은 기본적으로 Flask 기본값과 같은 HTTP 날짜 형식으로 출력하고,
+      JSON_DATETIME_FORMAT=iso이면 orjson이 ISO 8601로 직접 직렬화
+    - Decimal(통계 비율 등)은 Flask 기본값과 같이 문자열로 출력
+    """
+    def __init__(self, app):
+        super().__init__(app)
+        self.iso_datetime = app.config.get('JSON_DATETIME_FORMAT', 'http') == 'iso'
+
+    def _options(self, indent=False):
+        option = orjson.OPT_NON_STR_KEYS
+        if not self.iso_datetime:
+            option |= orjson.OPT_PASSTHROUGH_DATETIME  # date/datetime을 default로 넘겨 HTTP 날짜로 변환
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return option
+
+    def dumps_bytes(self, obj, indent=False):
+        return orjson.dumps(obj, default=_default, option=self._options(indent))
+
+    def dumps(self, obj, **kwargs):
+        # indent 외의 세부 옵션(cls 등)은 기본 provider로 처리
+        if set(kwargs) - {'indent', 'separators'}:
+            return super().dumps(obj, **kwargs)
+        return self.dumps_bytes(obj, indent=bool(kwargs.get('indent'))).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        return self._app.response_class(self.dumps_bytes(obj, indent) + b"\n", mimetype=self.mimetype)
+
+
+def init_app(app):
+    """
+    orjson이 설치되어 있으면 앱의 JSON provider를 OrjsonProvider로 교체
+    Args:
+        app (Flask): Flask 애플리케이션
+    """
+    if orjson is not None:
+        app.json = OrjsonProvider(app)
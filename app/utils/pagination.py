@@ -0,0 +1,44 @@
+import base64
+import json
+
+class InvalidCursorError(ValueError):
+    """
+    디코딩할 수 없거나 요청 조건과 맞지 않는 커서
+    """
+
+def encode_cursor(sort_by, order, last_row):
+    """
+    마지막 행의 (정렬 필드 값, id)를 불투명한 커서 문자열로 인코딩
+    Args:
+        sort_by (str): 정렬 기준 필드
+        order (str): 정렬 순서 ('asc', 'desc')
+        last_row (dict): 현재 페이지의 마지막 행
+    Returns:
+        str: URL-safe base64 커서
+    """
+    payload = {"s": sort_by, "o": order, "v": last_row[sort_by], "id": last_row['id']}
+    raw = json.dumps(payload, default=str, separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+def decode_cursor(cursor, sort_by, order):
+    """
+    커서를 디코딩하여 (정렬 필드 값, id) 반환
+    Args:
+        cursor (str): encode_cursor로 만든 커서
+        sort_by (str): 현재 요청의 정렬 기준 필드
+        order (str): 현재 요청의 정렬 순서
+    Returns:
+        tuple: (정렬 필드 값, id)
+    Raises:
+        InvalidCursorError: 형식이 잘못되었거나 정렬 조건이 다른 커서
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        value, last_id = payload['v'], int(payload['id'])
+    except (ValueError, TypeError, KeyError):
+        raise InvalidCursorError("Malformed cursor")
+
+    if payload.get('s') != sort_by or payload.get('o') != order:
+        raise InvalidCursorError("Cursor does not match sort_by/order")
+    return value, last_id
@@ -20,3 +20,22 @@ def is_token_blacklisted(token):
         bool: 블랙리스트에 있으면 True, 없으면 False
     """
     return redis_client.get(token) is not None
+
+def mark_recent_write(user_id, window):
+    """
+    사용자의 최근 쓰기 기록 (read-your-writes 보장용)
+    Args:
+        user_id (int): 사용자 ID
+        window (int): 주 DB에서 읽도록 유지할 시간(초)
+    """
+    redis_client.set(f"recent_write:{user_id}", 1, ex=window)
+
+def has_recent_write(user_id):
+    """
+    사용자가 최근 쓰기 기간 안에 있는지 확인
+    Args:
+        user_id (int): 사용자 ID
+    Returns:
+        bool: 최근에 쓰기를 했으면 True
+    """
+    return redis_client.exists(f"recent_write:{user_id}") > 0
@@ -0,0 +1,170 @@
+import threading
+import time
+from flask import g, has_request_context
+from redis.exceptions import LockError, RedisError
+from app.config import STATS_CACHE_TTL, STATS_CACHE_STALE_TTL, STATS_CACHE_REFRESH_INTERVAL, STATS_CACHE_LOCK_TIMEOUT
+from app.utils.cache import cache_get_json, cache_set_json
+from app.utils.conditional import get_generations, recently_changed
+from app.utils.db import read_from_primary
+from app.utils.redis_client import redis_client
+
+# 최근 이 시간(초) 안에 조회된 키만 백그라운드에서 미리 갱신
+HOT_WINDOW = 300
+# 다른 워커가 계산 중인 값을 기다릴 때 캐시를 다시 확인하는 간격 (초)
+POLL_INTERVAL = 0.05
+
+# 프로세스 단위 갱신 대상 키: 키 -> {"compute", "dependencies", "accessed_at"}
+_registry = {}
+_registry_lock = threading.Lock()
+_app = None
+_refresher = None
+
+
+def init_app(app):
+    """
+    백그라운드 갱신 스레드가 사용할 애플리케이션 등록 (스레드는 첫 조회 시 시작)
+    Args:
+        app (Flask): Flask 애플리케이션
+    """
+    global _app
+    _app = app
+
+
+def get_or_compute(key, compute, dependencies=()):
+    """
+    stale-while-revalidate 캐시 조회
+    - 신선한 값(STATS_CACHE_TTL 이내이며 의존 세대가 같음)은 그대로 반환
+    - 오래된 값은 바로 반환하고, Redis 잠금을 얻은 워커 하나만 백그라운드에서 다시 계산
+    - 값이 없으면 잠금을 얻은 워커 하나만 계산하고 나머지는 그 결과를 기다림 (동시 요청이 같은 집계를 반복하지 않음)
+    - Redis를 사용할 수 없으면 직접 계산
+    Args:
+        key (str): 캐시 키
+        compute (callable): 인자 없이 값을 계산하는 함수 (JSON 직렬화 가능한 값 반환)
+        dependencies (list): 값이 의존하는 세대 이름 (예: ['job', 'company'])
+    Returns:
+        캐시된 값 또는 새로 계산한 값
+    """
+    _track(key, compute, dependencies)
+    try:
+        state = _state(dependencies)
+    except RedisError as e:
+        print(f"Stats cache skipped ({key}): {e}")
+        return compute()
+
+    entry = cache_get_json(key)
+    if entry is not None:
+        if entry['state'] != state or entry['fresh_until'] <= time.time():
+            lock = _acquire(key)
+            if lock is not None and _app is not None:
+                threading.Thread(target=_refresh, args=(key, compute, dependencies, lock), daemon=True).start()
+            elif lock is not None:
+                _store(key, compute, state, lock, dependencies)
+            if entry['state'] != state and has_request_context():
+                g.serving_stale = True  # conditional이 현재 세대 ETag를 붙이지 않도록
+        return entry['value']
+
+    # 값이 없음: 잠금을 얻은 워커 하나만 계산하고 나머지는 저장되기를 기다림
+    deadline = time.monotonic() + STATS_CACHE_LOCK_TIMEOUT
+    while time.monotonic() < deadline:
+        lock = _acquire(key)
+        if lock is not None:
+            return _store(key, compute, state, lock, dependencies)
+        time.sleep(POLL_INTERVAL)
+        entry = cache_get_json(key)
+        if entry is not None:
+            return entry['value']
+    return compute()
+
+
+def _acquire(key):
+    """
+    키 재계산 잠금 (SET NX, STATS_CACHE_LOCK_TIMEOUT 후 자동 만료)
+    - 백그라운드 스레드에서 해제할 수 있도록 thread_local=False
+    Returns:
+        Lock 또는 None (다른 워커가 계산 중이거나 Redis 오류)
+    """
+    try:
+        lock = redis_client.lock(f"lock:{key}", timeout=STATS_CACHE_LOCK_TIMEOUT, blocking=False, thread_local=False)
+        return lock if lock.acquire() else None
+    except RedisError as e:
+        print(f"Stats cache lock error ({key}): {e}")
+        return None
+
+
+def _store(key, compute, state, lock, dependencies):
+    # 잠금을 가진 상태에서 값을 계산해 저장하고 잠금 해제
+    # 의존 세대가 방금 바뀌었으면 주 DB에서 계산 (복제본의 이전 데이터가 새 세대 값으로 저장되지 않도록)
+    try:
+        if _recently_changed(dependencies):
+            read_from_primary()
+        value = compute()
+        cache_set_json(key, {"value": value, "state": state, "fresh_until": time.time() + STATS_CACHE_TTL},
+                       STATS_CACHE_TTL + STATS_CACHE_STALE_TTL)
+        return value
+    finally:
+        try:
+            lock.release()
+        except (LockError, RedisError):
+            pass  # 계산이 잠금 시간보다 오래 걸려 이미 만료됨
+
+
+def _refresh(key, compute, dependencies, lock=None):
+    # 백그라운드 재계산 (잠금이 없으면 얻어서, 다른 워커가 계산 중이면 건너뜀)
+    try:
+        with _app.app_context():
+            lock = lock or _acquire(key)
+            if lock is not None:
+                _store(key, compute, _state(dependencies), lock, dependencies)
+    except Exception as e:
+        print(f"Stats cache refresh error ({key}): {e}")
+
+
+def _state(dependencies):
+    # 의존 세대 번호 문자열 (값이 계산된 시점의 데이터 버전)
+    if not dependencies:
+        return ""
+    return ",".join(f"{name}={version}" for name, (version, _) in zip(dependencies, get_generations(dependencies)))
+
+
+def _recently_changed(dependencies):
+    if not dependencies:
+        return False
+    try:
+        return recently_changed(get_generations(dependencies))
+    except RedisError:
+        return True  # 확인할 수 없으면 주 DB 사용
+
+
+def _track(key, compute, dependencies):
+    # 조회된 키를 갱신 대상으로 등록하고, 처음 조회 시 백그라운드 갱신 스레드 시작
+    global _refresher
+    with _registry_lock:
+        _registry[key] = {"compute": compute, "dependencies": list(dependencies), "accessed_at": time.monotonic()}
+        if _refresher is None and _app is not None and STATS_CACHE_REFRESH_INTERVAL > 0:
+            _refresher = threading.Thread(target=_refresh_loop, daemon=True)
+            _refresher.start()
+
+
+def _refresh_loop():
+    """
+    자주 조회되는 키를 만료 전에 미리 다시 계산
+    - STATS_CACHE_REFRESH_INTERVAL마다 최근 HOT_WINDOW초 안에 조회된 키를 확인하여,
+      다음 확인 전에 신선 기간이 끝나거나 의존 세대가 바뀐 키를 갱신
+    """
+    while True:
+        time.sleep(STATS_CACHE_REFRESH_INTERVAL)
+        now = time.monotonic()
+        with _registry_lock:
+            for key in [key for key, spec in _registry.items() if now - spec['accessed_at'] > HOT_WINDOW]:
+                del _registry[key]
+            hot = list(_registry.items())
+
+        for key, spec in hot:
+            try:
+                with _app.app_context():
+                    entry = cache_get_json(key)
+                    expiring = entry is None or entry['fresh_until'] - time.time() <= STATS_CACHE_REFRESH_INTERVAL
+                    if expiring or entry['state'] != _state(spec['dependencies']):
+                        _refresh(key, spec['compute'], spec['dependencies'])
+            except Exception as e:
+                print(f"Stats cache refresher error ({key}): {e}")
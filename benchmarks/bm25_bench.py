@@ -0,0 +1,66 @@
+import argparse
+import random
+import statistics
+import time
+import numpy as np
+from app.search.index import JobDoc
+from app.search.ranking import BM25Ranker
+
+TITLE_WORDS = ['백엔드', '프론트엔드', '개발자', '서버', '데이터', '엔지니어', 'Python', 'Java', 'Spring',
+               'Flask', '신입', '경력', '플랫폼', '모바일', '앱', '인프라', 'DevOps', '머신러닝', '채용', '웹']
+SECTOR_WORDS = ['백엔드/서버개발', '프론트엔드', '웹개발', '데이터엔지니어', 'AI/ML', '앱개발', '클라우드', 'DBA']
+
+
+def make_docs(count, seed=42):
+    """
+    무작위 공고 문서 생성 (제목 3~6단어, 회사 2000개, 분야 1~3개)
+
+    Args:
+        count (int): 생성할 문서 수
+        seed (int): 난수 시드
+
+    Returns:
+        list: JobDoc 목록 (id 오름차순)
+    """
+    rng = random.Random(seed)
+    return [
+        JobDoc(
+            i, i % 2000, " ".join(rng.sample(TITLE_WORDS, rng.randint(3, 6))), f'회사{i % 2000}', '',
+            ", ".join(rng.sample(SECTOR_WORDS, rng.randint(1, 3))), '', None, None, (), (), (),
+        )
+        for i in range(1, count + 1)
+    ]
+
+
+def bench(ranker, candidates, query, repeat):
+    """
+    후보 전체 점수 계산 + 정렬 시간의 중앙값 (ms)
+    """
+    elapsed = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        ranker.rank(candidates, query)
+        elapsed.append((time.perf_counter() - start) * 1000)
+    return statistics.median(elapsed)
+
+
+# 실행: 프로젝트 루트에서 python -m benchmarks.bm25_bench
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="BM25 관련도 정렬 벤치마크")
+    parser.add_argument('--docs', type=int, default=200000, help="색인 문서 수")
+    parser.add_argument('--candidates', type=int, nargs='+', default=[1000, 10000, 50000], help="후보 수")
+    parser.add_argument('--repeat', type=int, default=50)
+    args = parser.parse_args()
+
+    docs = make_docs(args.docs)
+    ranker = BM25Ranker()
+    start = time.perf_counter()
+    ranker.reset(docs)
+    print(f"docs={args.docs} build={time.perf_counter() - start:.2f}s terms={len(ranker._postings)}")
+
+    rng = np.random.default_rng(0)
+    for count in args.candidates:
+        candidates = np.sort(rng.choice(np.arange(1, args.docs + 1, dtype=np.uint32), min(count, args.docs), replace=False))
+        print(f"candidates={len(candidates)}")
+        for query in ('백엔드', 'python 백엔드 개발자', '데이터 엔지니어 신입'):
+            print(f"  {query:22s}: {bench(ranker, candidates, query, args.repeat):7.2f} ms")
@@ -0,0 +1,60 @@
+import timeit
+from datetime import datetime, date
+from decimal import Decimal
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+from app.utils.json_provider import OrjsonProvider, orjson
+
+def make_rows(count):
+    """
+    /api/jobs/search 응답과 비슷한 딕셔너리 행 생성 (한글 문자열, datetime, Decimal 포함)
+
+    Args:
+        count (int): 생성할 행 수
+
+    Returns:
+        list: 공고 행 목록
+    """
+    return [
+        {
+            'id': i,
+            'company': i % 500,
+            'creator': 7,
+            'title': f'[서울] 백엔드 개발자 (Flask/Python) 채용 {i}',
+            'link': f'https://www.saramin.co.kr/zf_user/jobs/relay/view?rec_idx={40000000 + i}',
+            'career_condition': '경력 3년↑ 정규직',
+            'education': '대학교(4년)↑',
+            'deadline': '~ 12/31(화)',
+            'job_sector': '백엔드/서버개발, Python, Flask, MySQL',
+            'company_name': f'회사 {i % 500}',
+            'created_at': datetime(2024, 12, 1, 9, 30, i % 60),
+            'deadline_date': date(2024, 12, 31),
+            'percentage': Decimal('12.34'),
+        }
+        for i in range(count)
+    ]
+
+def bench(provider, rows, number):
+    with provider._app.app_context():
+        return min(timeit.repeat(lambda: provider.response(rows).get_data(), number=number, repeat=5)) / number
+
+# 실행: 프로젝트 루트에서 python -m benchmarks.json_provider_bench
+if __name__ == "__main__":
+    if orjson is None:
+        raise SystemExit("orjson이 설치되어 있지 않습니다.")
+
+    app = Flask(__name__)
+    default_provider = DefaultJSONProvider(app)
+    orjson_provider = OrjsonProvider(app)
+    app.config['JSON_DATETIME_FORMAT'] = 'iso'
+    orjson_iso_provider = OrjsonProvider(app)
+
+    for count in (100, 1000, 10000):
+        rows = make_rows(count)
+        number = max(1, 20000 // count)
+        base = bench(default_provider, rows, number)
+        print(f"rows={count}")
+        print(f"  default       : {base * 1000:8.2f} ms")
+        for name, provider in (('orjson (http)', orjson_provider), ('orjson (iso)', orjson_iso_provider)):
+            elapsed = bench(provider, rows, number)
+            print(f"  {name:14s}: {elapsed * 1000:8.2f} ms  (x{base / elapsed:.1f})")
@@ -0,0 +1,202 @@
+import argparse
+import os
+import random
+import statistics
+import time
+import mysql.connector
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# 벤치마크 전용 데이터베이스 (운영 DB와 분리)
+BENCH_DB_NAME = os.getenv('BENCH_DB_NAME', f"{os.getenv('DB_NAME')}_bench")
+os.environ['DB_NAME'] = BENCH_DB_NAME
+os.environ['DB_REPLICA_HOSTS'] = ''
+os.environ['DB_POOL_WARMUP'] = '0'
+
+from app import create_app  # noqa: E402  (DB_NAME 교체 후 import)
+from app.models import job_model  # noqa: E402
+from app.models.job_model import Job  # noqa: E402
+from app.search.index import job_index  # noqa: E402
+
+TITLE_WORDS = ['백엔드', '프론트엔드', '서버', '개발자', '엔지니어', '데이터', '임베디드', '안드로이드', '플랫폼',
+               '신입', '경력', '채용', '모집', 'Python', 'Flask', 'Java', 'Spring', '리눅스', '펌웨어', '클라우드']
+COMPANY_WORDS = ['테크', '소프트', '시스템즈', '네트웍스', '랩스', '솔루션', '정보통신', '전자', '데이터', '모빌리티']
+KEYWORDS = ['백엔드', '임베디드 리눅스', '안드로이드', 'Flask', '솔루션', '펌웨어 개발자']
+TECH_COUNT = 40
+LOCATION_COUNT = 20
+
+def connect(database=None):
+    return mysql.connector.connect(
+        host=os.getenv("DB_HOST"),
+        port=os.getenv("DB_PORT"),
+        user=os.getenv("DB_USER"),
+        password=os.getenv("DB_PASSWORD"),
+        database=database
+    )
+
+def seed(job_count, batch_size=5000):
+    """
+    벤치마크 DB의 테이블을 다시 만들고 가짜 회사/공고 데이터를 채우는 함수.
+
+    Args:
+        job_count (int): 생성할 공고 수
+        batch_size (int): 한 번에 삽입할 행 수
+    """
+    db = connect()
+    cursor = db.cursor()
+    cursor.execute(f"CREATE DATABASE IF NOT EXISTS {BENCH_DB_NAME} DEFAULT CHARACTER SET utf8mb4")
+    cursor.execute(f"USE {BENCH_DB_NAME}")
+    cursor.execute("DROP TABLE IF EXISTS job_location, job_tech, job, company")
+    cursor.execute("""
+        CREATE TABLE company (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            name VARCHAR(255) NOT NULL,
+            link VARCHAR(512) NOT NULL
+        )
+    """)
+    cursor.execute("""
+        CREATE TABLE job (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            company INT NOT NULL,
+            creator INT NOT NULL,
+            title VARCHAR(255) NOT NULL,
+            link VARCHAR(512) NOT NULL,
+            career_condition VARCHAR(255),
+            education VARCHAR(255),
+            deadline VARCHAR(255),
+            job_sector VARCHAR(512),
+            min_career_years TINYINT UNSIGNED NULL,
+            max_career_years TINYINT UNSIGNED NULL,
+            deadline_date DATE NULL,
+            INDEX idx_job_company (company)
+        )
+    """)
+    cursor.execute("CREATE TABLE job_tech (job INT NOT NULL, tech INT NOT NULL, PRIMARY KEY (job, tech))")
+    cursor.execute("CREATE TABLE job_location (job INT NOT NULL, location INT NOT NULL, PRIMARY KEY (job, location))")
+
+    rng = random.Random(42)
+    company_count = max(1, job_count // 20)
+    companies = [(f"{rng.choice(COMPANY_WORDS)}{rng.choice(COMPANY_WORDS)} {i}", f"https://example.com/c/{i}")
+                 for i in range(company_count)]
+    for start in range(0, company_count, batch_size):
+        cursor.executemany("INSERT INTO company (name, link) VALUES (%s, %s)", companies[start:start + batch_size])
+
+    for start in range(0, job_count, batch_size):
+        rows = []
+        for i in range(start, min(start + batch_size, job_count)):
+            title = " ".join(rng.sample(TITLE_WORDS, 4))
+            rows.append((rng.randint(1, company_count), 1, title, f"https://example.com/j/{i}",
+                         '경력 3년↑', '대학교(4년)↑', '~ 12/31(화)', 'IT개발'))
+        cursor.executemany(
+            "INSERT INTO job (company, creator, title, link, career_condition, education, deadline, job_sector) "
+            "VALUES (%s, %s, %s, %s, %s, %s, %s, %s)", rows
+        )
+        job_ids = range(start + 1, min(start + batch_size, job_count) + 1)
+        cursor.executemany("INSERT INTO job_tech (job, tech) VALUES (%s, %s)", [
+            (job_id, tech) for job_id in job_ids for tech in rng.sample(range(1, TECH_COUNT + 1), rng.randint(0, 5))
+        ])
+        cursor.executemany("INSERT INTO job_location (job, location) VALUES (%s, %s)", [
+            (job_id, location) for job_id in job_ids
+            for location in rng.sample(range(1, LOCATION_COUNT + 1), rng.randint(1, 2))
+        ])
+        db.commit()
+
+    # migrations/003과 같은 인덱스
+    cursor.execute("ALTER TABLE job ADD FULLTEXT INDEX ft_job_title (title) WITH PARSER ngram")
+    cursor.execute("ALTER TABLE company ADD FULLTEXT INDEX ft_company_name (name) WITH PARSER ngram")
+    db.commit()
+    cursor.close()
+    db.close()
+
+def measure(backend, filters, repeat):
+    """
+    Job.search_and_filter 실행 시간 측정 (중앙값, ms)
+
+    Args:
+        backend (str): 'like', 'fulltext' 또는 'index'
+        filters (dict): 검색 필터
+        repeat (int): 반복 횟수
+
+    Returns:
+        tuple: (중앙값 ms, 결과 행 수)
+    """
+    job_model.SEARCH_BACKEND = backend
+    timings = []
+    rows = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        rows = Job.search_and_filter(filters)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings), len(rows)
+
+def random_filters(rng):
+    """
+    기술/지역 여러 값(any/all)과 키워드를 섞은 임의 검색 필터 생성
+    """
+    filters = {}
+    for name, count in (('tech', TECH_COUNT), ('location', LOCATION_COUNT)):
+        if rng.random() < 0.7:
+            filters[name] = sorted(rng.sample(range(1, count + 1), rng.randint(1, 3)))
+            filters[f"{name}_mode"] = rng.choice(['any', 'all'])
+    if rng.random() < 0.4:
+        filters['keyword'] = rng.choice(KEYWORDS)
+    return filters
+
+def check(samples):
+    """
+    메모리 색인 검색 결과를 DB(LIKE) 검색 결과와 비교
+
+    Args:
+        samples (int): 비교할 임의 필터 수
+
+    Returns:
+        int: 결과가 다른 필터 수
+    """
+    rng = random.Random(7)
+    mismatches = 0
+    for _ in range(samples):
+        filters = random_filters(rng)
+        job_model.SEARCH_BACKEND = 'like'
+        expected = sorted(row['id'] for row in Job.search_and_filter(filters))
+        job_model.SEARCH_BACKEND = 'index'
+        actual = [row['id'] for row in Job.search_and_filter(filters)]
+        if actual != expected:
+            mismatches += 1
+            print(f"불일치: {filters} (db {len(expected)}건, index {len(actual)}건)")
+    return mismatches
+
+# 실행: 프로젝트 루트에서 python -m benchmarks.search_bench --sizes 100000 1000000
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="LIKE vs ngram FULLTEXT vs 메모리 색인 검색 벤치마크")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100000, 1000000])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--check', type=int, default=200, help="색인과 DB 결과를 비교할 임의 필터 수")
+    args = parser.parse_args()
+
+    app = create_app()
+    for size in args.sizes:
+        print(f"시드 생성 중: 공고 {size}건 ({BENCH_DB_NAME})")
+        seed(size)
+        with app.app_context():
+            job_index.rebuild()
+            print(f"{'keyword':20s} {'like (ms)':>12s} {'fulltext (ms)':>14s} {'rows':>8s}")
+            for keyword in KEYWORDS:
+                like_ms, like_rows = measure('like', {"keyword": keyword}, args.repeat)
+                fulltext_ms, fulltext_rows = measure('fulltext', {"keyword": keyword}, args.repeat)
+                print(f"{keyword:20s} {like_ms:12.1f} {fulltext_ms:14.1f} {like_rows:>8d}/{fulltext_rows}")
+
+            print(f"{'tech/location':32s} {'db (ms)':>10s} {'index (ms)':>11s} {'rows':>8s}")
+            for filters in ({"tech": [3, 7], "tech_mode": "any", "location": [1, 2], "location_mode": "any"},
+                            {"tech": [3, 7], "tech_mode": "all"},
+                            {"tech": [1, 2, 3], "tech_mode": "any", "keyword": "백엔드"}):
+                label = ",".join(f"{key}={value}" for key, value in filters.items() if not key.endswith('_mode'))
+                db_ms, db_rows = measure('like', filters, args.repeat)
+                index_ms, index_rows = measure('index', filters, args.repeat)
+                print(f"{label:32s} {db_ms:10.1f} {index_ms:11.1f} {db_rows:>8d}/{index_rows}")
+
+            if args.check:
+                mismatches = check(args.check)
+                print(f"색인/DB 결과 비교: {args.check}건 중 불일치 {mismatches}건")
+                if mismatches:
+                    raise SystemExit(1)
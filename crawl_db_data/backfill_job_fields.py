@@ -0,0 +1,16 @@
+from app import create_app
+from app.models.job_model import Job
+
+def backfill():
+    """
+    기존 공고의 경력/마감일 구조화 컬럼을 채우는 함수.
+    - migrations/004 적용 후 한 번 실행
+    """
+    updated = Job.backfill_structured_fields()
+    print(f"경력/마감일 구조화 컬럼 갱신 완료: {updated}건")
+
+
+# 실행: 프로젝트 루트에서 python -m crawl_db_data.backfill_job_fields
+if __name__ == "__main__":
+    with create_app().app_context():
+        backfill()
@@ -0,0 +1,16 @@
+from app import create_app
+from app.search.recommend import recommender
+
+def build():
+    """
+    북마크/지원 내역으로 사용자별 추천 목록과 공고별 유사 공고 목록을 다시 계산하는 함수.
+    - cron 등으로 주기적으로 실행 (예: 매일 새벽, RECOMMEND_TTL보다 짧은 주기)
+    """
+    result = recommender.build()
+    print(f"추천 목록 갱신 완료: 사용자 {result['users']}명, 공고 {result['jobs']}건, 상호작용 {result['interactions']}건")
+
+
+# 실행: 프로젝트 루트에서 python -m crawl_db_data.build_recommendations
+if __name__ == "__main__":
+    with create_app().app_context():
+        build()
@@ -2,6 +2,10 @@ import pandas as pd
 import mysql.connector
 import os
 from dotenv import load_dotenv
+from app.utils.job_parsing import structured_fields
+from app.utils.conditional import bump_generation
+from app.search.index import job_index
+from app.models.job_model import Job
 
 load_dotenv()
 
@@ -42,9 +46,13 @@ def get_or_create_job(row, company_id):
     if existing_job:
         return existing_job[0]
 
+    # 경력 연수/마감일 구조화 컬럼 (migrations/004)
+    parsed = structured_fields(row['경력및고용형태'], row['마감일'])
+
     cursor.execute("""
-        INSERT INTO job (company, creator, title, link, career_condition, education, deadline, job_sector)
-        VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+        INSERT INTO job (company, creator, title, link, career_condition, education, deadline, job_sector,
+                         min_career_years, max_career_years, deadline_date)
+        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
     """, (
         company_id,
         admin_id,
@@ -53,7 +61,10 @@ def get_or_create_job(row, company_id):
         row['경력및고용형태'],
         row['학력'],
         row['마감일'],
-        row['직무분야']
+        row['직무분야'],
+        parsed['min_career_years'],
+        parsed['max_career_years'],
+        parsed['deadline_date']
     ))
     db.commit()
 
@@ -99,6 +110,7 @@ def process_csv(file_path):
         file_path (str): CSV 파일 경로
     """
     df = pd.read_csv(file_path)
+    job_ids = set()
 
     for _, row in df.iterrows():
         if not is_valid_row(row):
@@ -113,6 +125,7 @@ def process_csv(file_path):
 
         # 공고 ID 조회 또는 생성
         job_id = get_or_create_job(row, company_id)
+        job_ids.add(job_id)
 
         # job_location에 데이터 추가
         add_job_location(job_id, int(row['location']))
@@ -120,6 +133,35 @@ def process_csv(file_path):
         # job_tech에 데이터 추가
         add_job_tech(job_id, int(row['tech']))
 
+    # 공고 수 카운터 보정 (table_counter)
+    cursor.execute("""
+        INSERT INTO table_counter (name, value)
+        SELECT 'job', COUNT(*) FROM job
+        ON DUPLICATE KEY UPDATE value = VALUES(value)
+    """)
+
+    # 통계 집계 테이블 보정 (migrations/005, 적재한 회사/기술 공고 수 반영)
+    cursor.execute("""
+        INSERT INTO company_job_count (company, job_count)
+        SELECT company.id, COUNT(job.id) FROM company LEFT JOIN job ON job.company = company.id GROUP BY company.id
+        ON DUPLICATE KEY UPDATE job_count = VALUES(job_count)
+    """)
+    cursor.execute("""
+        INSERT INTO tech_job_count (tech, job_count)
+        SELECT tech.id, COUNT(job_tech.job) FROM tech LEFT JOIN job_tech ON job_tech.tech = tech.id GROUP BY tech.id
+        ON DUPLICATE KEY UPDATE job_count = VALUES(job_count)
+    """)
+    cursor.execute("""
+        INSERT IGNORE INTO job_application_count (job, application_count)
+        SELECT id, 0 FROM job
+    """)
+    db.commit()
+
+    # 적재한 데이터 반영: 공고 상세 캐시 삭제, 목록/검색/통계 ETag·캐시 무효화, 각 서버의 검색 색인 재구성
+    Job.invalidate_details(*job_ids)
+    bump_generation('job', 'company', 'application', *(f"job:{job_id}" for job_id in job_ids))
+    job_index.request_rebuild()
+
     print("CSV 데이터가 성공적으로 처리되었습니다.")
 
 # 실행
@@ -0,0 +1,20 @@
+from app import create_app
+from app.models.job_model import Job
+from app.models.stats_model import Stats
+
+def reconcile():
+    """
+    유지 중인 카운터와 통계 집계 테이블을 실제 테이블 값으로 보정하는 함수.
+    - cron 등으로 주기적으로 실행 (예: 10분마다)
+    """
+    total = Job.reconcile_total_count()
+    print(f"job 카운터 보정 완료: {total}")
+
+    counts = Stats.reconcile_counts()
+    print(f"통계 집계 테이블 재계산 완료: {counts}")
+
+
+# 실행: 프로젝트 루트에서 python -m crawl_db_data.reconcile_counts
+if __name__ == "__main__":
+    with create_app().app_context():
+        reconcile()
@@ -0,0 +1,6 @@
+-- 공고 목록 키셋(커서) 페이지네이션용 정렬 인덱스
+-- InnoDB 보조 인덱스는 기본 키(id)를 포함하므로 (필드, id) 순서로 범위 탐색이 가능
+ALTER TABLE job
+    ADD INDEX idx_job_title (title),
+    ADD INDEX idx_job_deadline (deadline),
+    ADD INDEX idx_job_job_sector (job_sector);
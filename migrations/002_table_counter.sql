@@ -0,0 +1,10 @@
+-- 테이블 행 수 카운터 (목록 API의 COUNT(*) 대체)
+-- Job.create/Job.delete가 같은 트랜잭션에서 갱신하고, reconcile_counts 스크립트가 주기적으로 보정
+CREATE TABLE IF NOT EXISTS table_counter (
+    name VARCHAR(64) NOT NULL PRIMARY KEY,
+    value BIGINT NOT NULL DEFAULT 0
+);
+
+INSERT INTO table_counter (name, value)
+SELECT 'job', COUNT(*) FROM job
+ON DUPLICATE KEY UPDATE value = VALUES(value);
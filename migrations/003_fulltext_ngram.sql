@@ -0,0 +1,5 @@
+-- 공고 제목/회사명 키워드 검색용 ngram FULLTEXT 인덱스 (한글 부분 일치 지원)
+-- ngram_token_size(기본값 2)는 서버 설정이며, 앱의 NGRAM_TOKEN_SIZE와 같아야 함
+-- 적용 후 .env에 SEARCH_BACKEND=fulltext 설정
+ALTER TABLE job ADD FULLTEXT INDEX ft_job_title (title) WITH PARSER ngram;
+ALTER TABLE company ADD FULLTEXT INDEX ft_company_name (name) WITH PARSER ngram;
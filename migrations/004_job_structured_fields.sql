@@ -0,0 +1,8 @@
+-- 경력/마감일 구조화 컬럼 (크롤링 원문 career_condition, deadline은 그대로 유지)
+-- 적용 후 기존 행 채우기: python -m crawl_db_data.backfill_job_fields
+ALTER TABLE job
+    ADD COLUMN min_career_years TINYINT UNSIGNED NULL,
+    ADD COLUMN max_career_years TINYINT UNSIGNED NULL,
+    ADD COLUMN deadline_date DATE NULL,
+    ADD INDEX idx_job_min_career_years (min_career_years),
+    ADD INDEX idx_job_deadline_date (deadline_date);
@@ -0,0 +1,38 @@
+-- 통계 API용 집계 테이블 (요청마다 job/job_tech/application 전체를 GROUP BY 하지 않도록)
+-- Job.create/update/delete, Application.add/delete 등이 같은 트랜잭션에서 갱신하고, reconcile_counts 스크립트가 주기적으로 다시 계산
+CREATE TABLE IF NOT EXISTS company_job_count (
+    company INT NOT NULL PRIMARY KEY,
+    job_count INT NOT NULL DEFAULT 0,
+    INDEX idx_company_job_count (job_count),
+    FOREIGN KEY (company) REFERENCES company (id) ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS tech_job_count (
+    tech INT NOT NULL PRIMARY KEY,
+    job_count INT NOT NULL DEFAULT 0,
+    INDEX idx_tech_job_count (job_count),
+    FOREIGN KEY (tech) REFERENCES tech (id) ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS job_application_count (
+    job INT NOT NULL PRIMARY KEY,
+    application_count INT NOT NULL DEFAULT 0,
+    INDEX idx_job_application_count (application_count),
+    FOREIGN KEY (job) REFERENCES job (id) ON DELETE CASCADE
+);
+
+INSERT INTO company_job_count (company, job_count)
+SELECT company.id, COUNT(job.id) FROM company LEFT JOIN job ON job.company = company.id GROUP BY company.id
+ON DUPLICATE KEY UPDATE job_count = VALUES(job_count);
+
+INSERT INTO tech_job_count (tech, job_count)
+SELECT tech.id, COUNT(job_tech.job) FROM tech LEFT JOIN job_tech ON job_tech.tech = tech.id GROUP BY tech.id
+ON DUPLICATE KEY UPDATE job_count = VALUES(job_count);
+
+INSERT INTO job_application_count (job, application_count)
+SELECT job.id, COUNT(application.job) FROM job LEFT JOIN application ON application.job = job.id GROUP BY job.id
+ON DUPLICATE KEY UPDATE application_count = VALUES(application_count);
+
+INSERT INTO table_counter (name, value)
+SELECT 'application', COUNT(*) FROM application
+ON DUPLICATE KEY UPDATE value = VALUES(value);
@@ -0,0 +1,192 @@
+import os
+import threading
+import pytest
+from dotenv import load_dotenv
+from redis.exceptions import ConnectionError as RedisConnectionError, LockError
+
+# app.config는 import 시 필수 환경 변수를 검사하므로 .env를 먼저 읽고, 없는 값만 테스트용으로 채움
+load_dotenv()
+for name, value in {
+    'SECRET_KEY': 'test-secret',
+    'REFRESH_SECRET_KEY': 'test-refresh-secret',
+    'JWT_ACCESS_TOKEN_EXPIRES': '1',
+    'JWT_REFRESH_TOKEN_EXPIRES': '1',
+    'DB_HOST': '127.0.0.1',
+    'DB_PORT': '3306',
+    'DB_USER': 'test',
+    'DB_PASSWORD': 'test',
+    'DB_NAME': 'test',
+    'DB_POOL_WARMUP': '0',
+}.items():
+    os.environ.setdefault(name, value)
+
+from app.search.index import JobDoc, JobSearchIndex  # noqa: E402
+
+
+class FakeRedis:
+    """
+    테스트용 메모리 Redis (앱이 사용하는 명령만 구현, decode_responses=True와 같이 문자열 반환)
+    - fail = True이면 모든 명령이 ConnectionError 발생
+    """
+    def __init__(self):
+        self.fail = False
+        self._data = {}
+        self._hashes = {}
+        self._mutex = threading.RLock()
+
+    def _check(self):
+        if self.fail:
+            raise RedisConnectionError("fake redis unavailable")
+
+    # --- 문자열 ---
+
+    def get(self, key):
+        self._check()
+        return self._data.get(key)
+
+    def set(self, key, value, ex=None, nx=False):
+        self._check()
+        with self._mutex:
+            if nx and key in self._data:
+                return None
+            self._data[key] = str(value)
+            return True
+
+    def mget(self, keys):
+        self._check()
+        return [self._data.get(key) for key in keys]
+
+    def delete(self, *keys):
+        self._check()
+        with self._mutex:
+            return sum(1 for key in keys if self._data.pop(key, None) is not None or self._hashes.pop(key, None))
+
+    def exists(self, *keys):
+        self._check()
+        return sum(1 for key in keys if key in self._data or key in self._hashes)
+
+    # --- 해시 (세대 번호) ---
+
+    def hincrby(self, key, field, amount=1):
+        self._check()
+        with self._mutex:
+            fields = self._hashes.setdefault(key, {})
+            fields[field] = str(int(fields.get(field, 0)) + amount)
+            return int(fields[field])
+
+    def hset(self, key, field, value):
+        self._check()
+        with self._mutex:
+            self._hashes.setdefault(key, {})[field] = str(value)
+            return 1
+
+    def hsetnx(self, key, field, value):
+        self._check()
+        with self._mutex:
+            fields = self._hashes.setdefault(key, {})
+            if field in fields:
+                return 0
+            fields[field] = str(value)
+            return 1
+
+    def hmget(self, key, *fields):
+        self._check()
+        values = self._hashes.get(key, {})
+        return [values.get(field) for field in fields]
+
+    def pipeline(self, transaction=True):
+        self._check()
+        return FakePipeline(self)
+
+    # --- 잠금/스트림 ---
+
+    def lock(self, name, timeout=None, blocking=True, thread_local=True):
+        self._check()
+        return FakeLock(self, name)
+
+    def xadd(self, name, fields, maxlen=None, approximate=True):
+        self._check()
+        return '0-1'
+
+    def xread(self, streams, count=None):
+        self._check()
+        return []
+
+    def xrevrange(self, name, count=None):
+        self._check()
+        return []
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self._redis = redis
+        self._calls = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self._calls.append((name, args, kwargs))
+            return self
+        return queue
+
+    def execute(self):
+        calls, self._calls = self._calls, []
+        return [getattr(self._redis, name)(*args, **kwargs) for name, args, kwargs in calls]
+
+
+class FakeLock:
+    def __init__(self, redis, name):
+        self._redis = redis
+        self.name = name
+        self.owned = False
+
+    def acquire(self):
+        self._redis._check()
+        self.owned = bool(self._redis.set(self.name, 'locked', nx=True))
+        return self.owned
+
+    def release(self):
+        if not self.owned:
+            raise LockError("not owned")
+        self._redis.delete(self.name)
+        self.owned = False
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    """
+    Redis 클라이언트를 사용하는 모듈의 redis_client를 메모리 구현으로 교체
+    """
+    from app.utils import redis_client, cache, conditional, swr_cache
+    from app.search import index, recommend
+
+    fake = FakeRedis()
+    for module in (redis_client, cache, conditional, swr_cache, index, recommend):
+        monkeypatch.setattr(module, 'redis_client', fake)
+    return fake
+
+
+def make_doc(job_id, title='', company=1, company_name='', career_condition='', job_sector='', deadline='',
+             min_career_years=None, deadline_date=None, techs=(), locations=()):
+    """
+    테스트용 색인 문서 (분야 목록은 job_sector에서 계산)
+    """
+    from app.search.index import sectors
+    return JobDoc(job_id, company, title, company_name, career_condition, job_sector, deadline,
+                  min_career_years, deadline_date, tuple(techs), tuple(locations), sectors(job_sector))
+
+
+def build_index(monkeypatch, docs):
+    """
+    DB 대신 주어진 문서로 구성한 JobSearchIndex (fake_redis 픽스처와 함께 사용)
+    """
+    search_index = JobSearchIndex()
+    store = {doc.id: doc for doc in sorted(docs, key=lambda doc: doc.id)}
+
+    def load_docs(job_ids=None):
+        ids = sorted(store) if job_ids is None else [job_id for job_id in job_ids if job_id in store]
+        return {job_id: store[job_id] for job_id in ids}
+
+    monkeypatch.setattr(search_index, '_load_docs', load_docs)
+    search_index.store = store  # 테스트에서 문서를 바꾼 뒤 refresh()로 반영
+    search_index.rebuild()
+    return search_index
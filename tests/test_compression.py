@@ -0,0 +1,42 @@
+import gzip
+from flask import Flask, Response
+from app.utils import compression
+
+
+def make_app(bodies):
+    """
+    같은 ETag로 매번 다른 본문을 반환하는 앱 (세대 ETag가 바뀌기 전 복제 지연 상황)
+    """
+    app = Flask(__name__)
+    app.config.update(COMPRESS_MIN_SIZE=10)
+    compression.init_app(app)
+
+    @app.route('/data')
+    def data():
+        response = Response(bodies.pop(0), mimetype='application/json')
+        response.set_etag('generation-1')
+        return response
+
+    return app
+
+
+def test_compressed_body_matches_rendered_body_with_same_etag():
+    old, new = '{"value": "%s"}' % ('old' * 20), '{"value": "%s"}' % ('new' * 20)
+    client = make_app([old, new, new]).test_client()
+
+    first = client.get('/data', headers={'Accept-Encoding': 'gzip'})
+    assert gzip.decompress(first.data).decode() == old
+
+    second = client.get('/data', headers={'Accept-Encoding': 'gzip'})
+    assert second.headers['Content-Encoding'] == 'gzip'
+    assert gzip.decompress(second.data).decode() == new
+    assert second.headers['ETag'] == '"generation-1-gzip"'
+
+    identity = client.get('/data', headers={'Accept-Encoding': 'identity'})
+    assert identity.data.decode() == new
+
+
+def test_small_or_unaccepted_bodies_are_not_compressed():
+    client = make_app(['{}', '{"value": "%s"}' % ('x' * 50)]).test_client()
+    assert 'Content-Encoding' not in client.get('/data', headers={'Accept-Encoding': 'gzip'}).headers
+    assert 'Content-Encoding' not in client.get('/data').headers
@@ -0,0 +1,214 @@
+import threading
+import time
+import mysql.connector
+import pytest
+from app.utils import db_pool
+from app.utils.db_pool import ConnectionPool, PoolTimeoutError, ReplicaRouter
+
+
+class FakeConnection:
+    def __init__(self, host=None, fail_ping=False, fail_rollback=False):
+        self.host = host
+        self.fail_ping = fail_ping
+        self.fail_rollback = fail_rollback
+        self.closed = False
+        self.rollbacks = 0
+
+    def ping(self, reconnect=False):
+        if self.fail_ping:
+            raise mysql.connector.errors.OperationalError("gone away")
+
+    def rollback(self):
+        self.rollbacks += 1
+        if self.fail_rollback:
+            raise mysql.connector.errors.OperationalError("lost connection")
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def connections(monkeypatch):
+    """
+    mysql.connector.connect를 가짜 연결 생성으로 교체하고 생성된 연결 목록 반환
+    - host가 'down'이면 연결 실패
+    """
+    created = []
+
+    def connect(**config):
+        if config.get('host') == 'down':
+            raise mysql.connector.errors.InterfaceError("can't connect")
+        conn = FakeConnection(config.get('host'))
+        created.append(conn)
+        return conn
+
+    monkeypatch.setattr(db_pool.mysql.connector, 'connect', connect)
+    return created
+
+
+def make_pool(pool_size=2, max_overflow=1, timeout=0.05, **kwargs):
+    return ConnectionPool(pool_size, max_overflow, timeout, host='primary', **kwargs)
+
+
+def test_pool_timeout_error_is_a_mysql_error():
+    assert issubclass(PoolTimeoutError, mysql.connector.Error)
+
+
+def test_released_connection_is_reused_and_rolled_back(connections):
+    pool = make_pool()
+    first = pool.get_connection()
+    raw = first._conn
+    first.close()
+    first.close()  # 두 번 닫아도 한 번만 반환
+
+    second = pool.get_connection()
+    assert second._conn is raw
+    assert raw.rollbacks == 1
+    assert len(connections) == 1
+    assert pool.stats()['checkouts'] == 2
+
+
+def test_overflow_then_timeout(connections):
+    pool = make_pool(pool_size=1, max_overflow=1)
+    held = [pool.get_connection(), pool.get_connection()]
+
+    start = time.monotonic()
+    with pytest.raises(PoolTimeoutError):
+        pool.get_connection()
+    assert time.monotonic() - start >= 0.05
+
+    stats = pool.stats()
+    assert stats['in_use'] == 2
+    assert stats['timeouts'] == 1
+
+    # overflow 연결은 유휴 연결이 pool_size를 넘으므로 반환 시 실제로 닫힘
+    for conn in held:
+        conn.close()
+    assert sum(conn.closed for conn in connections) == 1
+    assert pool.stats()['idle'] == 1
+
+
+def test_waiter_receives_released_connection(connections):
+    pool = make_pool(pool_size=1, max_overflow=0, timeout=2)
+    held = pool.get_connection()
+    result = {}
+
+    def wait():
+        result['conn'] = pool.get_connection()
+
+    waiter = threading.Thread(target=wait)
+    waiter.start()
+    time.sleep(0.05)
+    assert pool.stats()['waiting'] == 1
+    held.close()
+    waiter.join(1)
+
+    assert result['conn']._conn is connections[0]
+    assert sum(pool.stats()['wait_histogram'].values()) == 2
+
+
+def test_failed_ping_reconnects(connections):
+    pool = make_pool(pre_ping=True)
+    conn = pool.get_connection()
+    conn._conn.fail_ping = True
+    conn.close()
+
+    fresh = pool.get_connection()
+    assert fresh._conn is connections[1]
+    assert connections[0].closed
+    assert pool.stats()['reconnects'] == 1
+
+
+def test_failed_rollback_discards_connection(connections):
+    pool = make_pool()
+    conn = pool.get_connection()
+    conn._conn.fail_rollback = True
+    conn.close()
+
+    assert connections[0].closed
+    assert pool.stats()['in_use'] == 0 and pool.stats()['idle'] == 0
+
+
+def test_failed_connect_frees_the_slot(connections):
+    pool = ConnectionPool(1, 0, 0.05, host='down')
+    for _ in range(2):
+        with pytest.raises(mysql.connector.errors.InterfaceError):
+            pool.get_connection()
+    assert pool.stats()['in_use'] == 0
+
+
+def test_warm_up(connections):
+    pool = make_pool(pool_size=3)
+    assert pool.warm_up(2) == 2
+    assert pool.warm_up(10) == 1  # pool_size까지만
+    assert pool.stats()['idle'] == 3
+
+
+def test_replica_router_round_robin_and_failover(connections):
+    pools = {name: ConnectionPool(1, 1, 0.05, host=name) for name in ('replica-a', 'down', 'replica-b')}
+    router = ReplicaRouter(pools, retry_interval=60)
+
+    hosts = []
+    for _ in range(4):
+        conn = router.get_connection()
+        hosts.append(conn._conn.host)
+        conn.close()
+
+    assert 'down' not in hosts
+    assert set(hosts) == {'replica-a', 'replica-b'}
+    stats = router.stats()
+    assert stats['down']['healthy'] is False
+    assert stats['replica-a']['healthy'] is True
+
+
+def test_replica_router_skips_busy_replica_without_marking_it_down(connections):
+    busy = ConnectionPool(1, 0, 0.01, host='busy')
+    held = busy.get_connection()
+    router = ReplicaRouter({'busy': busy})
+
+    assert router.get_connection() is None  # 사용할 수 있는 복제본 없음 -> 호출자가 주 DB 사용
+    assert router.stats()['busy']['healthy'] is True
+    held.close()
+    assert router.get_connection() is not None
+
+
+def _timeout(*args, **kwargs):
+    raise PoolTimeoutError("Connection pool exhausted")
+
+
+@pytest.fixture
+def client(monkeypatch, tmp_path, fake_redis):
+    monkeypatch.chdir(tmp_path)  # create_app이 작업 디렉터리에 app.log를 만듦
+    from app import create_app
+    app = create_app()
+    return app.test_client()
+
+
+def test_pool_timeout_in_controller_returns_503(monkeypatch, client):
+    from app.models import company_model
+    monkeypatch.setattr(company_model, 'get_db', _timeout)
+
+    response = client.get('/api/companies/')
+    assert response.status_code == 503
+    assert response.get_json()['error'] == "Service Unavailable"
+
+
+def test_models_reraise_pool_timeout(monkeypatch):
+    from app.models import company_model
+    from app.models.company_model import Company
+
+    class Cursor:
+        def execute(self, *args):
+            _timeout()
+
+        def close(self):
+            pass
+
+    class Connection:
+        def cursor(self, **kwargs):
+            return Cursor()
+
+    # 일반 예외로 감싸지 않아야 전역 처리기에서 503으로 변환됨
+    monkeypatch.setattr(company_model, 'get_db', lambda *args, **kwargs: Connection())
+    with pytest.raises(PoolTimeoutError):
+        Company.get_or_create("회사", "https://example.com")
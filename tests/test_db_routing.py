@@ -0,0 +1,178 @@
+import time
+import pytest
+from flask import Flask, jsonify, request
+from app.config import READ_YOUR_WRITES_WINDOW
+from app.utils import db
+from app.utils.conditional import bump_generation, conditional
+from app.utils.db import get_db
+
+
+class FakeConnection:
+    def __init__(self, name):
+        self.name = name
+        self.closed = False
+        self.rollbacks = 0
+
+    def rollback(self):
+        self.rollbacks += 1
+
+    def close(self):
+        self.closed = True
+
+
+class FakeRouter:
+    def __init__(self, available=True):
+        self.available = available
+        self.checkouts = []
+
+    def get_connection(self):
+        if not self.available:
+            return None
+        conn = FakeConnection('replica')
+        self.checkouts.append(conn)
+        return conn
+
+
+@pytest.fixture
+def primaries(monkeypatch):
+    created = []
+
+    def checkout():
+        conn = FakeConnection('primary')
+        created.append(conn)
+        return conn
+
+    monkeypatch.setattr(db, '_checkout', checkout)
+    return created
+
+
+@pytest.fixture
+def router(monkeypatch):
+    router = FakeRouter()
+    monkeypatch.setattr(db, 'replica_router', router)
+    return router
+
+
+@pytest.fixture
+def app(fake_redis, primaries, router):
+    """
+    요청마다 X-User 헤더의 사용자로 인증된 것처럼 동작하는 최소 앱
+    - GET /read: 읽기 전용 조회 후 사용한 연결 이름 반환
+    - POST /write: 주 DB에 쓰기 (?fail=1이면 400 응답)
+    """
+    app = Flask(__name__)
+    db.init_app(app)
+
+    @app.before_request
+    def authenticate():
+        user = request.headers.get('X-User')
+        request.user = {'id': int(user)} if user else None
+
+    @app.route('/read')
+    def read():
+        return jsonify(get_db(read_only=True).name)
+
+    @app.route('/write', methods=['POST'])
+    def write():
+        get_db()
+        if request.args.get('fail'):
+            return jsonify({"error": "invalid"}), 400
+        return jsonify("ok"), 201
+
+    @app.route('/read-after-write', methods=['POST'])
+    def read_after_write():
+        get_db()
+        return jsonify(get_db(read_only=True).name)
+
+    return app
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+def test_read_only_uses_replica_and_returns_it(client, router, primaries):
+    assert client.get('/read', headers={'X-User': '1'}).get_json() == 'replica'
+    assert primaries == []
+    assert router.checkouts[0].closed  # teardown에서 반환
+
+
+def test_request_with_primary_connection_reads_from_primary(client, router):
+    assert client.post('/read-after-write').get_json() == 'primary'
+    assert router.checkouts == []
+
+
+def test_no_replica_available_falls_back_to_primary(client, router, primaries):
+    router.available = False
+    assert client.get('/read').get_json() == 'primary'
+    assert primaries[0].closed
+
+
+def test_without_router_reads_from_primary(client, monkeypatch):
+    monkeypatch.setattr(db, 'replica_router', None)
+    assert client.get('/read').get_json() == 'primary'
+
+
+def test_successful_write_marks_user_for_primary_reads(client, fake_redis):
+    assert client.post('/write', headers={'X-User': '7'}).status_code == 201
+    assert fake_redis.exists('recent_write:7')
+
+    # 같은 사용자의 다음 조회는 주 DB, 다른 사용자는 복제본
+    assert client.get('/read', headers={'X-User': '7'}).get_json() == 'primary'
+    assert client.get('/read', headers={'X-User': '8'}).get_json() == 'replica'
+
+
+def test_write_is_recorded_before_teardown(app, fake_redis, monkeypatch):
+    events = []
+    monkeypatch.setattr(db, 'mark_recent_write', lambda *args: events.append('mark'))
+    app.teardown_appcontext(lambda error: events.append('teardown'))
+
+    app.test_client().post('/write', headers={'X-User': '7'})
+    assert events == ['mark', 'teardown']
+
+
+def test_failed_or_anonymous_writes_are_not_recorded(client, fake_redis):
+    client.post('/write?fail=1', headers={'X-User': '7'})
+    client.post('/write')
+    assert not fake_redis.exists('recent_write:7')
+
+
+def test_write_record_failure_does_not_break_response(client, fake_redis):
+    fake_redis.fail = True
+    assert client.post('/write', headers={'X-User': '7'}).status_code == 201
+
+
+def test_redis_failure_reads_from_primary(client, fake_redis):
+    fake_redis.fail = True
+    assert client.get('/read', headers={'X-User': '1'}).get_json() == 'primary'
+
+
+def test_close_db_rolls_back_on_error(app, primaries):
+    with app.app_context():
+        get_db()
+        db.close_db(RuntimeError("boom"))
+        assert primaries[0].rollbacks == 1 and primaries[0].closed
+        db.close_db()  # 반환할 연결이 없어도 안전
+
+
+@pytest.fixture
+def conditional_client(app):
+    @app.route('/list')
+    @conditional(['job'])
+    def list_jobs():
+        return jsonify(get_db(read_only=True).name)
+
+    return app.test_client()
+
+
+def test_conditional_reads_primary_right_after_a_change(conditional_client, fake_redis):
+    # 세대가 방금 바뀌었으면 복제본이 뒤처졌을 수 있으므로 새 ETag와 함께 주 DB에서 읽음
+    bump_generation('job')
+    assert conditional_client.get('/list').get_json() == 'primary'
+
+
+def test_conditional_reads_replica_after_lag_window(conditional_client, fake_redis):
+    fake_redis.hset('generation:job', 'v', 3)
+    fake_redis.hset('generation:job', 'ts', int(time.time()) - READ_YOUR_WRITES_WINDOW - 10)
+    assert conditional_client.get('/list').get_json() == 'replica'
@@ -0,0 +1,40 @@
+import pytest
+from flask import Flask
+from app.controllers import job_controller
+from app.models.job_model import Job
+
+
+@pytest.fixture
+def cursor_calls(monkeypatch):
+    calls = []
+
+    def get_all_by_cursor(after, size, sort_by, order, fields):
+        calls.append(size)
+        return [{'id': job_id} for job_id in range(size + 1, 0, -1)]
+
+    monkeypatch.setattr(Job, 'get_all_by_cursor', staticmethod(get_all_by_cursor))
+    monkeypatch.setattr(Job, 'attach_relations', staticmethod(lambda jobs, include: jobs))
+    return calls
+
+
+@pytest.fixture
+def client(fake_redis):
+    app = Flask(__name__)
+    app.config['SEARCH_MAX_PAGE_SIZE'] = 50
+    app.register_blueprint(job_controller.job_bp)
+    return app.test_client()
+
+
+@pytest.mark.parametrize('query', ['size=0', 'size=-5', 'size=abc', 'page=0', 'cursor=&size=0', 'cursor=&size=-1'])
+def test_invalid_page_size_is_rejected(client, cursor_calls, query):
+    assert client.get(f'/api/jobs/?{query}').status_code == 400
+    assert cursor_calls == []
+
+
+def test_cursor_page_size_is_capped(client, cursor_calls):
+    response = client.get('/api/jobs/?cursor=&size=1000')
+    assert response.status_code == 200
+    assert cursor_calls == [50]
+    body = response.get_json()
+    assert len(body['data']) == 50 and body['pagination']['page_size'] == 50
+    assert body['pagination']['next_cursor']
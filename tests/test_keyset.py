@@ -0,0 +1,48 @@
+import random
+import sqlite3
+import pytest
+from app.models.job_model import Job
+
+
+@pytest.fixture
+def db():
+    """
+    마감일 일부가 NULL이고 같은 마감일이 많은 공고 테이블 (SQLite도 MySQL처럼 오름차순에서 NULL이 가장 앞)
+    """
+    rng = random.Random(1)
+    db = sqlite3.connect(':memory:')
+    db.execute("CREATE TABLE job (id INTEGER PRIMARY KEY, deadline_date TEXT)")
+    db.executemany("INSERT INTO job VALUES (?, ?)", [
+        (job_id, None if rng.random() < 0.3 else f"2026-{rng.randint(10, 12)}-{rng.randint(10, 28)}")
+        for job_id in range(1, 201)
+    ])
+    return db
+
+
+def paginate(db, column, order, size):
+    # 이전 페이지 마지막 행을 커서로 끝까지 조회
+    ids, after = [], None
+    while True:
+        where, values = "", []
+        if after is not None:
+            condition, values = Job._keyset_condition(column, 'id', order, after)
+            where = "WHERE " + condition.replace('%s', '?')
+        page = db.execute(
+            f"SELECT id, {column} FROM job {where} ORDER BY {column} {order}, id {order} LIMIT ?", values + [size]
+        ).fetchall()
+        if not page:
+            return ids
+        ids += [row[0] for row in page]
+        after = (page[-1][1], page[-1][0])
+
+
+@pytest.mark.parametrize('column', ['deadline_date', 'id'])
+@pytest.mark.parametrize('order', ['asc', 'desc'])
+@pytest.mark.parametrize('size', [1, 7, 50])
+def test_keyset_pagination_visits_every_row_once(db, column, order, size):
+    expected = [row[0] for row in db.execute(f"SELECT id FROM job ORDER BY {column} {order}, id {order}")]
+    assert paginate(db, column, order, size) == expected
+
+
+def test_keyset_condition_for_id_column():
+    assert Job._keyset_condition('id', 'id', 'desc', (None, 10)) == ("id < %s", [10])
@@ -0,0 +1,113 @@
+import math
+import random
+from collections import Counter
+import numpy as np
+import pytest
+from app.models import job_model
+from app.models.job_model import Job
+from app.search.ranking import B, FIELD_WEIGHTS, K1, BM25Ranker, tokenize
+from conftest import make_doc
+
+TITLES = ['Python 백엔드 개발자', '백엔드개발자 채용', '프론트엔드 개발자', '데이터 엔지니어', 'AI 연구원', '백엔드']
+COMPANIES = ['네이버', '카카오', '백엔드랩']
+
+
+def reference_scores(docs, job_ids, query):
+    """
+    BM25 정의를 그대로 옮긴 기준 구현
+    """
+    terms = {}
+    for doc in docs:
+        counter = Counter()
+        for field, weight in FIELD_WEIGHTS:
+            for token in tokenize(getattr(doc, field)):
+                counter[token] += weight
+        terms[doc.id] = counter
+    average = sum(sum(counter.values()) for counter in terms.values()) / len(terms)
+
+    result = []
+    for job_id in job_ids:
+        counter = terms.get(job_id, Counter())
+        length = sum(counter.values())
+        total = 0.0
+        for term in set(tokenize(query)):
+            df = sum(term in other for other in terms.values())
+            tf = counter.get(term, 0)
+            if not df or not tf:
+                continue
+            idf = math.log(1 + (len(terms) - df + 0.5) / (df + 0.5))
+            total += idf * tf * (K1 + 1) / (tf + K1 * (1 - B + B * length / average))
+        result.append(total)
+    return result
+
+
+def random_docs(seed=11, count=60):
+    rng = random.Random(seed)
+    return [make_doc(job_id, title=rng.choice(TITLES), company_name=rng.choice(COMPANIES),
+                     job_sector=rng.choice(['', '백엔드, 서버', '데이터']))
+            for job_id in range(1, count * 2, 2)]
+
+
+def test_tokenize_uses_character_bigrams_per_word():
+    assert tokenize("Python 백엔드") == ['py', 'yt', 'th', 'ho', 'on', '백엔', '엔드']
+    assert tokenize("AI 및 C") == ['ai', '및', 'c']
+    assert tokenize(None) == []
+    # 붙여 쓴 복합어도 부분 키워드와 토큰을 공유
+    assert set(tokenize("백엔드")) <= set(tokenize("백엔드개발자"))
+
+
+@pytest.mark.parametrize('query', ['백엔드', '개발자', 'python 백엔드', '네이버', '없는말'])
+def test_scores_match_reference(query):
+    docs = random_docs()
+    ranker = BM25Ranker()
+    ranker.reset(docs)
+    job_ids = [doc.id for doc in docs]
+    np.testing.assert_allclose(ranker.scores(job_ids, query), reference_scores(docs, job_ids, query), rtol=1e-5)
+
+
+def test_rank_orders_by_score_then_id():
+    docs = [make_doc(1, title='데이터 엔지니어'), make_doc(2, title='백엔드 개발자'),
+            make_doc(3, title='백엔드 백엔드'), make_doc(4, title='백엔드 개발자')]
+    ranker = BM25Ranker()
+    ranker.reset(docs)
+    assert ranker.rank([1, 2, 3, 4], '백엔드') == [3, 2, 4, 1]
+
+
+def test_empty_candidates_and_empty_index():
+    ranker = BM25Ranker()
+    assert ranker.rank([1, 2], '백엔드') == [1, 2]
+    ranker.reset(random_docs())
+    assert ranker.rank([], '백엔드') == []
+    assert len(ranker.scores([], '백엔드')) == 0
+
+
+def test_incremental_updates_match_reset():
+    docs = {doc.id: doc for doc in random_docs()}
+    ranker = BM25Ranker()
+    ranker.reset(docs.values())
+
+    rng = random.Random(3)
+    for job_id in rng.sample(sorted(docs), 10):
+        ranker.on_remove(docs.pop(job_id))
+    for job_id in range(500, 520):
+        docs[job_id] = make_doc(job_id, title=rng.choice(TITLES), company_name=rng.choice(COMPANIES))
+        ranker.on_add(docs[job_id])
+
+    fresh = BM25Ranker()
+    fresh.reset(sorted(docs.values()))
+    job_ids = sorted(docs)
+    for query in ['백엔드', '개발자 네이버', 'ai']:
+        np.testing.assert_allclose(ranker.scores(job_ids, query), fresh.scores(job_ids, query), rtol=1e-5)
+        assert ranker.rank(job_ids, query) == fresh.rank(job_ids, query)
+
+
+@pytest.mark.parametrize('backend, filters, sort_by, expected', [
+    ('index', {'keyword': '백엔드'}, 'relevance', True),
+    ('index', {'keyword': '백엔드'}, 'id', False),
+    ('index', {}, 'relevance', False),
+    ('fulltext', {'keyword': '백엔드'}, 'relevance', False),
+    ('like', {'keyword': '백엔드'}, 'relevance', False),
+])
+def test_bm25_is_used_only_with_index_backend(monkeypatch, backend, filters, sort_by, expected):
+    monkeypatch.setattr(job_model, 'SEARCH_BACKEND', backend)
+    assert Job._uses_bm25(filters, sort_by) is expected
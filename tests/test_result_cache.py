@@ -0,0 +1,120 @@
+import pytest
+from app.models import job_model
+from app.models.job_model import Job
+from app.search import result_cache
+from app.search.result_cache import active_filters, filters_digest
+from app.utils.conditional import bump_generation
+
+
+def test_active_filters_keeps_zero_and_drops_empty_values():
+    filters = {'keyword': '', 'tech': [], 'location': None, 'career_min': 0, 'company': 3}
+    assert active_filters(filters) == {'career_min': 0, 'company': 3}
+
+
+def test_filters_digest_ignores_empty_values_and_key_order():
+    a = filters_digest({'keyword': 'python', 'tech': [1, 2], 'location': None}, 'id', 'asc')
+    b = filters_digest({'tech': [1, 2], 'keyword': 'python'}, 'id', 'asc')
+    assert a == b
+    assert a != filters_digest({'keyword': 'python', 'tech': [1, 2]}, 'id', 'desc')
+    assert a != filters_digest({'keyword': 'python', 'tech': [2, 1]}, 'id', 'asc')
+
+
+def test_lookup_miss_then_hit(fake_redis):
+    filters = {'keyword': 'python'}
+    key, entry = result_cache.lookup(filters, 'id', 'asc')
+    assert key is not None and entry is None
+
+    result_cache.store(key, [3, 1, 2], 3, True)
+    assert result_cache.lookup(filters, 'id', 'asc') == (key, {"ids": [3, 1, 2], "total": 3, "complete": True})
+
+
+@pytest.mark.parametrize('generation', ['job', 'company'])
+def test_generation_bump_invalidates_entry(fake_redis, generation):
+    key, _ = result_cache.lookup({}, 'id', 'asc')
+    result_cache.store(key, [1], 1, True)
+
+    bump_generation(generation)
+    new_key, entry = result_cache.lookup({}, 'id', 'asc')
+    assert new_key != key and entry is None
+
+
+def test_redis_failure_bypasses_cache(fake_redis):
+    fake_redis.fail = True
+    before = result_cache.stats()['bypassed']
+    assert result_cache.lookup({}, 'id', 'asc') == (None, None)
+    assert result_cache.stats()['bypassed'] == before + 1
+
+
+def test_non_positive_ttl_disables_cache(fake_redis, monkeypatch):
+    monkeypatch.setattr(result_cache, 'SEARCH_RESULT_CACHE_TTL', 0)
+    assert result_cache.lookup({}, 'id', 'asc') == (None, None)
+
+
+class FakeSearch:
+    """
+    Job의 DB 조회를 대신하는 가짜 (ids는 정렬된 전체 검색 결과)
+    """
+    def __init__(self, ids):
+        self.ids = ids
+        self.calls = []
+
+    def search_ids(self, filters, sort_by, order, limit):
+        self.calls.append('ids')
+        return self.ids[:limit]
+
+    def count_search(self, filters):
+        self.calls.append('count')
+        return len(self.ids)
+
+    def rows_in_order(self, job_ids):
+        return [{'id': job_id} for job_id in job_ids]
+
+    def search_page(self, filters, offset, size, sort_by, order):
+        self.calls.append('page')
+        return [{'id': job_id} for job_id in self.ids[offset:offset + size]]
+
+
+@pytest.fixture
+def search(monkeypatch, fake_redis):
+    search = FakeSearch(list(range(100, 120)))
+    monkeypatch.setattr(job_model, 'SEARCH_RESULT_CACHE_MAX_IDS', 8)
+    monkeypatch.setattr(Job, '_search_ids', staticmethod(search.search_ids))
+    monkeypatch.setattr(Job, 'count_search', staticmethod(search.count_search))
+    monkeypatch.setattr(Job, '_rows_in_order', staticmethod(search.rows_in_order))
+    monkeypatch.setattr(Job, '_search_page', staticmethod(search.search_page))
+    return search
+
+
+def page_ids(rows):
+    return [row['id'] for row in rows]
+
+
+def test_search_sorted_serves_cached_pages(search):
+    rows, total = Job.search_sorted({'keyword': 'x'}, 1, 4, 'id', 'asc')
+    assert (page_ids(rows), total) == ([100, 101, 102, 103], 20)
+    assert search.calls == ['ids', 'count']  # 결과가 한도를 넘으므로 전체 수는 따로 셈
+
+    rows, total = Job.search_sorted({'keyword': 'x'}, 2, 4, 'id', 'asc')
+    assert (page_ids(rows), total) == ([104, 105, 106, 107], 20)
+    assert search.calls == ['ids', 'count']  # 두 번째 페이지는 캐시에서
+
+
+def test_search_sorted_falls_back_outside_cached_range(search):
+    Job.search_sorted({}, 1, 4, 'id', 'asc')
+    rows, total = Job.search_sorted({}, 3, 4, 'id', 'asc')
+    assert (page_ids(rows), total) == ([108, 109, 110, 111], 20)
+    assert search.calls == ['ids', 'count', 'page']
+
+
+def test_search_sorted_complete_result_needs_no_count(search):
+    search.ids = [5, 3, 9]
+    rows, total = Job.search_sorted({}, 2, 2, 'id', 'asc')
+    assert (page_ids(rows), total) == ([9], 3)
+    assert search.calls == ['ids']
+
+
+def test_search_sorted_without_redis(search, fake_redis):
+    fake_redis.fail = True
+    rows, total = Job.search_sorted({}, 1, 4, 'id', 'asc')
+    assert (page_ids(rows), total) == ([100, 101, 102, 103], 20)
+    assert search.calls == ['count', 'page']
@@ -0,0 +1,170 @@
+import sqlite3
+import pytest
+from app.models import job_model
+from app.models.job_model import Job
+from conftest import build_index
+from test_search_index import FILTERS, expected_ids, synthetic_docs
+
+
+@pytest.fixture
+def like_backend(monkeypatch):
+    monkeypatch.setattr(job_model, 'SEARCH_BACKEND', 'like')
+
+
+def test_tech_any_uses_single_in_subquery(like_backend):
+    conditions, values = Job._build_search_conditions({'tech': [1, 2]})
+    assert conditions == ["job.id IN (SELECT job FROM job_tech WHERE tech IN (%s, %s))"]
+    assert values == [1, 2]
+
+
+def test_tech_all_requires_every_value(like_backend):
+    conditions, values = Job._build_search_conditions({'tech': [1, 2, 2], 'tech_mode': 'all'})
+    assert conditions == [
+        "job.id IN (SELECT job FROM job_tech WHERE tech IN (%s, %s) GROUP BY job HAVING COUNT(*) = %s)"
+    ]
+    assert values == [1, 2, 2]  # 중복 값은 한 번만 세어 HAVING 개수와 맞춤
+
+
+def test_all_with_single_value_is_plain_membership(like_backend):
+    conditions, values = Job._build_search_conditions({'location': [4], 'location_mode': 'all'})
+    assert conditions == ["job.id IN (SELECT job FROM job_location WHERE location IN (%s))"]
+    assert values == [4]
+
+
+def test_scalar_value_is_accepted(like_backend):
+    conditions, values = Job._build_search_conditions({'tech': 7})
+    assert conditions == ["job.id IN (SELECT job FROM job_tech WHERE tech IN (%s))"]
+    assert values == [7]
+
+
+def test_location_and_tech_modes_are_independent(like_backend):
+    conditions, values = Job._build_search_conditions(
+        {'location': [1, 2], 'location_mode': 'all', 'tech': [3, 4], 'tech_mode': 'any'}
+    )
+    assert conditions == [
+        "job.id IN (SELECT job FROM job_location WHERE location IN (%s, %s) GROUP BY job HAVING COUNT(*) = %s)",
+        "job.id IN (SELECT job FROM job_tech WHERE tech IN (%s, %s))",
+    ]
+    assert values == [1, 2, 2, 3, 4]
+
+
+def test_keyword_uses_like_on_title_and_company(like_backend):
+    conditions, values = Job._build_search_conditions({'keyword': '백엔드'})
+    assert conditions == ["(job.title LIKE %s OR company.name LIKE %s)"]
+    assert values == ['%백엔드%', '%백엔드%']
+
+
+def test_empty_filters_have_no_conditions(like_backend):
+    assert Job._build_search_conditions({}) == ([], [])
+
+
+def sqlite_catalogue(docs):
+    """
+    synthetic 문서를 job/company/job_tech/job_location 테이블로 옮긴 SQLite DB
+    """
+    db = sqlite3.connect(':memory:')
+    db.executescript("""
+        CREATE TABLE company (id INTEGER PRIMARY KEY, name TEXT);
+        CREATE TABLE job (id INTEGER PRIMARY KEY, company INTEGER, title TEXT, career_condition TEXT,
+                          job_sector TEXT, min_career_years INTEGER, deadline_date TEXT);
+        CREATE TABLE job_tech (job INTEGER, tech INTEGER);
+        CREATE TABLE job_location (job INTEGER, location INTEGER);
+        CREATE TABLE tech (id INTEGER PRIMARY KEY, name TEXT);
+        CREATE TABLE location (id INTEGER PRIMARY KEY, name TEXT);
+    """)
+    db.executemany("INSERT INTO tech VALUES (?, ?)", [(tech, f"tech-{tech}") for tech in range(1, 9)])
+    db.executemany("INSERT INTO location VALUES (?, ?)", [(location, f"loc-{location}") for location in range(1, 6)])
+    db.executemany("INSERT OR IGNORE INTO company VALUES (?, ?)", [(doc.company, doc.company_name) for doc in docs])
+    db.executemany("INSERT INTO job VALUES (?, ?, ?, ?, ?, ?, ?)", [
+        (doc.id, doc.company, doc.title, doc.career_condition, doc.job_sector, doc.min_career_years,
+         doc.deadline_date.isoformat() if doc.deadline_date else None)
+        for doc in docs
+    ])
+    db.executemany("INSERT INTO job_tech VALUES (?, ?)", [(doc.id, tech) for doc in docs for tech in doc.techs])
+    db.executemany("INSERT INTO job_location VALUES (?, ?)",
+                   [(doc.id, location) for doc in docs for location in doc.locations])
+    return db
+
+
+def sqlite_values(values):
+    return [value.isoformat() if hasattr(value, 'isoformat') else value for value in values]
+
+
+def sql_ids(db, filters):
+    conditions, values = Job._build_search_conditions(filters)
+    query = f"""
+        SELECT job.id FROM job JOIN company ON job.company = company.id
+        {"WHERE " + " AND ".join(conditions) if conditions else ""}
+        ORDER BY job.id
+    """
+    return [row[0] for row in db.execute(query.replace('%s', '?'), sqlite_values(values))]
+
+
+@pytest.mark.parametrize('filters', FILTERS)
+def test_sql_conditions_match_index_search(monkeypatch, fake_redis, like_backend, filters):
+    # 같은 데이터에서 SQL 조건(SQLite로 실행), 기준 구현, 메모리 색인 결과가 모두 같아야 함
+    docs = synthetic_docs()
+    search_index = build_index(monkeypatch, docs)
+    db = sqlite_catalogue(docs)
+    assert sql_ids(db, filters) == expected_ids(docs, filters) == list(search_index.search(filters))
+
+
+class SqliteConnection:
+    """
+    get_db() 대신 사용하는 SQLite 연결 (MySQL 자리표시자와 dictionary 커서 흉내, 실행한 쿼리 기록)
+    """
+    def __init__(self, db):
+        self.db = db
+        self.queries = []
+
+    def cursor(self, dictionary=False):
+        return SqliteCursor(self)
+
+
+class SqliteCursor:
+    def __init__(self, conn):
+        self.conn = conn
+        self.rows = []
+
+    def execute(self, query, values=()):
+        self.conn.queries.append(query)
+        cursor = self.conn.db.execute(query.replace('%s', '?'), sqlite_values(values))
+        columns = [column[0] for column in cursor.description]
+        self.rows = [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+    def fetchall(self):
+        return self.rows
+
+    def close(self):
+        pass
+
+
+@pytest.mark.parametrize('filters', FILTERS)
+def test_sql_facets_match_index_in_one_query(monkeypatch, fake_redis, like_backend, filters):
+    docs = synthetic_docs()
+    search_index = build_index(monkeypatch, docs)
+    conn = SqliteConnection(sqlite_catalogue(docs))
+    monkeypatch.setattr(job_model, 'get_db', lambda *args, **kwargs: conn)
+
+    facets = list(Job.FACETS)
+    result = Job.search_facets(filters, facets, limit=3)
+    assert len(conn.queries) == 1
+
+    counters = search_index.facet_counts(search_index.search(filters), facets)
+    for facet in ('tech', 'location'):
+        expected = sorted(counters[facet].items(), key=lambda item: (-item[1], item[0]))[:3]
+        assert [(item['id'], item['count']) for item in result[facet]] == expected, facet
+        assert all(item['name'] for item in result[facet])
+    assert {item['value']: item['count'] for item in result['career']} == \
+        dict(sorted(counters['career'].items(), key=lambda item: (-item[1], item[0]))[:3])
+    assert [item['count'] for item in result['sector']] == [count for _, count in counters['sector'].most_common(3)]
+
+
+def test_sql_facets_only_query_requested_facets(monkeypatch, fake_redis, like_backend):
+    conn = SqliteConnection(sqlite_catalogue(synthetic_docs()))
+    monkeypatch.setattr(job_model, 'get_db', lambda *args, **kwargs: conn)
+
+    result = Job.search_facets({'tech': [1]}, ['career'], limit=5)
+    assert list(result) == ['career']
+    assert 'job_tech facet_link' not in conn.queries[0]
+    assert Job.search_facets({}, [], limit=5) == {}
@@ -0,0 +1,274 @@
+import random
+import threading
+import time
+from array import array
+from datetime import date
+import pytest
+from app.search import index as index_module
+from app.search.index import JobSearchIndex, from_bitmap, intersect, to_bitmap, union
+from conftest import build_index, make_doc
+
+TITLES = ['Python 백엔드 개발자', '프론트엔드 개발자 (React)', '데이터 엔지니어', 'Java Spring 서버 개발',
+          'AI 연구원', 'DevOps 엔지니어', '신입 백엔드 개발자', 'iOS 앱 개발자']
+COMPANIES = ['네이버', '카카오', '라인플러스', '토스', 'Coupang']
+CAREERS = ['신입', '경력 3년 이상', '경력무관', '신입·경력', '']
+
+
+def synthetic_docs(count=300, seed=7):
+    """
+    무작위 공고 문서 (ID는 중간중간 비어 있음, 경력/마감일은 일부 NULL)
+    """
+    rng = random.Random(seed)
+    docs = []
+    job_id = 0
+    for _ in range(count):
+        job_id += rng.randint(1, 3)
+        company = rng.randrange(len(COMPANIES))
+        docs.append(make_doc(
+            job_id,
+            title=rng.choice(TITLES),
+            company=company + 1,
+            company_name=COMPANIES[company],
+            career_condition=rng.choice(CAREERS),
+            job_sector=", ".join(rng.sample(['백엔드', 'Python', '웹개발', '데이터'], rng.randint(0, 2))),
+            min_career_years=rng.choice([None, 0, 1, 3, 5]),
+            deadline_date=rng.choice([None, date(2026, 11, 1), date(2026, 12, 15), date(2027, 1, 31)]),
+            techs=sorted(rng.sample(range(1, 9), rng.randint(0, 3))),
+            locations=sorted(rng.sample(range(1, 6), rng.randint(0, 2))),
+        ))
+    return docs
+
+
+def expected_ids(docs, filters):
+    """
+    Job._build_search_conditions의 SQL 의미를 그대로 옮긴 기준 구현 (LIKE는 대소문자 무시 부분 일치)
+    """
+    def values(name):
+        value = filters.get(name)
+        if not value:
+            return None
+        return list(value) if isinstance(value, (list, tuple)) else [value]
+
+    result = []
+    for doc in docs:
+        keyword = (filters.get('keyword') or '').lower()
+        if keyword and keyword not in doc.title.lower() and keyword not in doc.company_name.lower():
+            continue
+        matched = True
+        for name, have in (('tech', doc.techs), ('location', doc.locations)):
+            wanted = values(name)
+            if wanted is None:
+                continue
+            check = all if filters.get(f"{name}_mode") == 'all' else any
+            if not check(value in have for value in wanted):
+                matched = False
+        if not matched:
+            continue
+        career = (filters.get('career_condition') or '').lower()
+        if career and career not in doc.career_condition.lower():
+            continue
+        years = doc.min_career_years
+        if filters.get('career_min') is not None and (years is None or years < filters['career_min']):
+            continue
+        if filters.get('career_max') is not None and (years is None or years > filters['career_max']):
+            continue
+        if filters.get('closing_before') is not None and (
+                doc.deadline_date is None or doc.deadline_date > filters['closing_before']):
+            continue
+        result.append(doc.id)
+    return result
+
+
+FILTERS = [
+    {},
+    {'keyword': '개발자'},
+    {'keyword': 'python'},
+    {'keyword': '카카오'},
+    {'keyword': '개'},
+    {'keyword': '없는키워드'},
+    {'tech': 3},
+    {'tech': [1, 2]},
+    {'tech': [1, 2], 'tech_mode': 'all'},
+    {'tech': [2, 2, 5], 'tech_mode': 'all'},
+    {'location': [1, 4], 'location_mode': 'all', 'tech': [3, 6]},
+    {'location': [2], 'location_mode': 'all'},
+    {'career_condition': '신입'},
+    {'career_min': 1, 'career_max': 3},
+    {'closing_before': date(2026, 12, 31)},
+    {'keyword': '엔지니어', 'tech': [1, 4], 'closing_before': date(2027, 1, 31)},
+]
+
+
+@pytest.fixture
+def docs():
+    return synthetic_docs()
+
+
+@pytest.fixture
+def search_index(monkeypatch, fake_redis, docs):
+    return build_index(monkeypatch, docs)
+
+
+@pytest.mark.parametrize('ids', [
+    [],
+    [0],
+    [1, 7, 8, 9, 63, 64],
+    [5, 100000, 100001, 2 ** 20],
+])
+def test_bitmap_round_trip(ids):
+    bitmap = to_bitmap(array('I', ids))
+    assert list(from_bitmap(bitmap)) == ids
+    assert all(bitmap >> job_id & 1 for job_id in ids)
+    assert bin(bitmap).count('1') == len(ids)
+
+
+def test_bitmap_round_trip_random():
+    rng = random.Random(1)
+    for _ in range(50):
+        ids = sorted(rng.sample(range(200000), rng.randint(1, 500)))
+        assert list(from_bitmap(to_bitmap(array('I', ids)))) == ids
+
+
+def test_bitmap_operations_match_set_operations():
+    rng = random.Random(2)
+    a = sorted(rng.sample(range(5000), 300))
+    b = sorted(rng.sample(range(5000), 300))
+    assert list(from_bitmap(to_bitmap(a) & to_bitmap(b))) == sorted(set(a) & set(b))
+    assert list(from_bitmap(to_bitmap(a) | to_bitmap(b))) == sorted(set(a) | set(b))
+
+
+def test_intersect_and_union():
+    rng = random.Random(3)
+    for small, large in ((5, 5000), (200, 300), (0, 10)):
+        a = array('I', sorted(rng.sample(range(20000), small)))
+        b = array('I', sorted(rng.sample(range(20000), large)))
+        assert list(intersect(a, b)) == sorted(set(a) & set(b))
+        assert list(union(a, b)) == sorted(set(a) | set(b))
+
+
+@pytest.mark.parametrize('filters', FILTERS)
+def test_search_matches_sql_semantics(search_index, docs, filters):
+    assert list(search_index.search(filters)) == expected_ids(docs, filters)
+
+
+def test_search_with_invalid_term_value_returns_nothing(search_index):
+    assert list(search_index.search({'tech': ['abc']})) == []
+
+
+def test_search_result_is_a_copy(search_index, docs):
+    result = search_index.search({})
+    result.append(10 ** 6)
+    assert list(search_index.search({})) == [doc.id for doc in docs]
+
+
+def test_refresh_applies_changes_and_deletions(search_index, docs):
+    first, second = docs[0], docs[1]
+    search_index.store[first.id] = first._replace(title='Rust 시스템 엔지니어', techs=(42,))
+    del search_index.store[second.id]
+    search_index.refresh([first.id, second.id])
+
+    assert list(search_index.search({'keyword': 'rust'})) == [first.id]
+    assert list(search_index.search({'tech': 42})) == [first.id]
+    assert second.id not in search_index.search({})
+    assert second.id not in search_index.search({'keyword': second.title})
+
+
+def test_facet_counts_over_result_ids(search_index, docs):
+    filters = {'tech': [1, 2]}
+    counters = search_index.facet_counts(search_index.search(filters), ['tech', 'sector'])
+    matched = [doc for doc in docs if doc.id in set(expected_ids(docs, filters))]
+    assert counters['tech'] == {tech: sum(tech in doc.techs for doc in matched)
+                                for tech in {tech for doc in matched for tech in doc.techs}}
+    assert sum(counters['sector'].values()) == sum(len(doc.sectors) for doc in matched)
+
+
+def wait_for(condition, timeout=2):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+def test_ready_builds_in_background_without_blocking(monkeypatch, fake_redis, docs):
+    search_index = JobSearchIndex()
+    started, release = threading.Event(), threading.Event()
+
+    def load_docs(job_ids=None):
+        started.set()
+        release.wait(2)
+        return {doc.id: doc for doc in docs}
+
+    monkeypatch.setattr(search_index, '_load_docs', load_docs)
+    assert search_index.ready() is False
+    assert started.wait(1)
+    assert search_index.ready() is False  # 구성 중에도 기다리지 않음
+
+    release.set()
+    wait_for(search_index.ready)
+    assert list(search_index.search({})) == [doc.id for doc in docs]
+
+
+def test_ready_retries_failed_build(monkeypatch, fake_redis, docs):
+    monkeypatch.setattr(index_module, 'BUILD_RETRY_INTERVAL', 0)
+    search_index = JobSearchIndex()
+    attempts = []
+
+    def load_docs(job_ids=None):
+        attempts.append(job_ids)
+        if len(attempts) == 1:
+            raise RuntimeError("database unavailable")
+        return {doc.id: doc for doc in docs}
+
+    monkeypatch.setattr(search_index, '_load_docs', load_docs)
+    search_index.ready()
+    wait_for(lambda: not search_index._building)
+    assert search_index.ready() is False
+    wait_for(search_index.ready)
+    assert len(attempts) == 2
+
+
+def test_ready_syncs_in_background(search_index, monkeypatch):
+    search_index.sync_interval = 0
+    threads = []
+    monkeypatch.setattr(search_index, '_sync', lambda: threads.append(threading.current_thread()))
+
+    assert search_index.ready() is True
+    wait_for(lambda: threads)
+    assert threads[0] is not threading.current_thread()
+
+
+def test_rebuild_request_rebuilds_in_background(search_index, fake_redis, monkeypatch, docs):
+    # 대량 적재 후 request_rebuild()가 남긴 메시지: 기존 색인으로 응답하면서 DB에서 다시 구성
+    added = make_doc(10 ** 6, title="적재된 공고")
+    search_index.store[added.id] = added
+    stream = [('5-0', {'ids': '1'}), ('6-0', {'rebuild': '1'})]
+
+    def xread(streams, count=None):
+        after = streams[index_module.CHANGE_STREAM]
+        messages = [message for message in stream if message[0] > after]
+        return [(index_module.CHANGE_STREAM, messages)] if messages else []
+
+    monkeypatch.setattr(fake_redis, 'xread', xread)
+    monkeypatch.setattr(fake_redis, 'xrevrange', lambda name, count=None: stream[-1:])
+
+    search_index._sync()
+    assert search_index._stream_id == '6-0'
+    wait_for(lambda: not search_index._building)
+    assert added.id in search_index.search({})
+
+
+def test_rebuild_request_during_build_rebuilds_again(search_index, monkeypatch):
+    loads = []
+    release = threading.Event()
+    load_docs = search_index._load_docs
+
+    def slow_load_docs(job_ids=None):
+        loads.append(job_ids)
+        release.wait(2)
+        return load_docs(job_ids)
+
+    monkeypatch.setattr(search_index, '_load_docs', slow_load_docs)
+    search_index._start_rebuild()
+    search_index.request_rebuild()  # 구성 중에 적재가 끝남
+    release.set()
+    wait_for(lambda: len(loads) == 2 and not search_index._building)
@@ -0,0 +1,84 @@
+"""
+MySQL 검색 결과와 메모리 색인 결과 비교 (.env/환경 변수의 DB에 공고 데이터가 있어야 실행, 없으면 건너뜀)
+- 읽기만 하며 데이터를 바꾸지 않음
+"""
+import mysql.connector
+import pytest
+from flask import Flask
+from app.config import DATABASE_CONFIG
+from app.models import job_model
+from app.models.job_model import Job
+from app.search.index import JobSearchIndex
+from app.utils import db
+
+
+def _sample(query, count):
+    try:
+        conn = mysql.connector.connect(**DATABASE_CONFIG, connection_timeout=2)
+    except mysql.connector.Error as e:
+        pytest.skip(f"MySQL not available: {e}")
+    try:
+        cursor = conn.cursor()
+        cursor.execute(query, (count,))
+        return [row[0] for row in cursor.fetchall()]
+    except mysql.connector.Error as e:
+        pytest.skip(f"Job tables not available: {e}")
+    finally:
+        conn.close()
+
+
+@pytest.fixture(scope='module')
+def sample_filters():
+    titles = _sample("SELECT title FROM job WHERE title <> '' ORDER BY id LIMIT %s", 5)
+    if not titles:
+        pytest.skip("No job rows to compare")
+    techs = _sample("SELECT tech FROM job_tech GROUP BY tech ORDER BY COUNT(*) DESC LIMIT %s", 4)
+    locations = _sample("SELECT location FROM job_location GROUP BY location ORDER BY COUNT(*) DESC LIMIT %s", 3)
+    careers = _sample("SELECT career_condition FROM job WHERE career_condition <> '' "
+                      "GROUP BY career_condition ORDER BY COUNT(*) DESC LIMIT %s", 2)
+    deadlines = _sample("SELECT deadline_date FROM job WHERE deadline_date IS NOT NULL "
+                        "ORDER BY deadline_date LIMIT %s", 1000)
+
+    filters = [{}]
+    filters += [{'keyword': title.split()[0]} for title in titles if title.split()]
+    filters += [{'keyword': title[:1]} for title in titles[:1]]
+    filters += [{'tech': tech} for tech in techs]
+    if len(techs) >= 2:
+        filters += [{'tech': techs[:2]}, {'tech': techs[:2], 'tech_mode': 'all'}]
+    if len(locations) >= 2:
+        filters += [{'location': locations[:2]}, {'location': locations[:2], 'location_mode': 'all'}]
+    if techs and locations:
+        filters.append({'tech': techs[:3], 'tech_mode': 'all', 'location': locations[:1]})
+    filters += [{'career_condition': career} for career in careers]
+    filters += [{'career_min': 1, 'career_max': 3}]
+    if deadlines:
+        filters.append({'closing_before': deadlines[len(deadlines) // 2]})
+    if titles and techs:
+        filters.append({'keyword': titles[0].split()[0], 'tech': techs})
+    return filters
+
+
+@pytest.fixture(scope='module')
+def app():
+    app = Flask(__name__)
+    db.init_app(app)
+    return app
+
+
+@pytest.fixture
+def db_index(monkeypatch, fake_redis, app):
+    search_index = JobSearchIndex()
+    with app.app_context():
+        search_index.rebuild()
+    return search_index
+
+
+def test_index_matches_mysql_results(monkeypatch, app, db_index, sample_filters):
+    monkeypatch.setattr(job_model, 'SEARCH_BACKEND', 'like')
+    for filters in sample_filters:
+        with app.app_context():
+            sql_ids = Job._search_ids(filters, 'id', 'asc', 10 ** 9)
+            sql_count = Job.count_filtered(filters) if filters else len(sql_ids)
+        index_ids = list(db_index.search(filters))
+        assert index_ids == sql_ids, filters
+        assert sql_count == len(sql_ids), filters
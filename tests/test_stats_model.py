@@ -0,0 +1,49 @@
+from app.models import stats_model
+from app.models.stats_model import Stats
+from app.utils.conditional import get_generations
+
+
+class FakeCursor:
+    """
+    실행한 쿼리에 따라 rowcount를 돌려주는 커서 (changed에 포함된 테이블만 값이 바뀐 것으로 처리)
+    """
+    def __init__(self, changed):
+        self.changed = changed
+        self.rowcount = 0
+
+    def execute(self, query, values=None):
+        self.rowcount = 2 if any(table in query for table in self.changed) else 0
+
+    def fetchone(self):
+        return (3,)
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    def __init__(self, changed):
+        self.cursor_ = FakeCursor(changed)
+
+    def cursor(self, **kwargs):
+        return self.cursor_
+
+    def commit(self):
+        pass
+
+
+def versions(names):
+    return [version for version, _ in get_generations(names)]
+
+
+def test_reconcile_bumps_only_generations_of_corrected_tables(monkeypatch, fake_redis):
+    names = ['job', 'company', 'application']
+    monkeypatch.setattr(stats_model, 'get_db', lambda *args, **kwargs: FakeConnection({'tech_job_count'}))
+    before = versions(names)
+    Stats.reconcile_counts()
+    assert versions(names) == [before[0] + 1, before[1], before[2]]
+
+    # 보정할 값이 없으면 ETag/캐시 유지
+    monkeypatch.setattr(stats_model, 'get_db', lambda *args, **kwargs: FakeConnection(set()))
+    Stats.reconcile_counts()
+    assert versions(names) == [before[0] + 1, before[1], before[2]]
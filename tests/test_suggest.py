@@ -0,0 +1,134 @@
+import random
+import pytest
+from app.search import suggest as suggest_module
+from app.search.suggest import PrefixIndex, normalize, score, word_suffixes
+from conftest import make_doc
+
+
+def brute_force(docs, query, limit):
+    """
+    모든 제목/회사명을 확인하는 기준 구현 (점수 내림차순 상위 limit개의 (종류, 표시 문자열, 공고 수))
+    """
+    counts = {}
+    for doc in docs:
+        for phrase in PrefixIndex._phrases(doc):
+            counts[phrase] = counts.get(phrase, 0) + 1
+    prefix = normalize(query)
+    matches = [(kind, display, count) for (kind, display), count in counts.items()
+               if any(key.startswith(prefix) for key in word_suffixes(normalize(display)))]
+    return sorted(matches, key=lambda match: -score(match[2], match[1]))[:limit]
+
+
+def check(index, docs, query, limit=5):
+    result = index.suggest(query, limit)
+    expected = brute_force(docs, query, limit)
+    # 점수가 같은 항목끼리는 순서가 정해지지 않으므로 점수 순서와 항목의 유효성을 확인
+    assert [score(item['count'], item['text']) for item in result] == [score(c, d) for _, d, c in expected], query
+    valid = {(kind, display): count for kind, display, count in brute_force(docs, query, 10 ** 6)}
+    assert all(valid.get((item['type'], item['text'])) == item['count'] for item in result), query
+
+
+def test_normalize_and_word_suffixes():
+    assert normalize("  Python   백엔드 개발자 ") == "python 백엔드 개발자"
+    assert word_suffixes("python 백엔드 개발자") == ["python 백엔드 개발자", "백엔드 개발자", "개발자"]
+
+
+def test_score_prefers_count_then_shorter_text():
+    assert score(2, "긴 제목 문자열") > score(1, "짧음")
+    assert score(1, "짧음") > score(1, "더 긴 제목")
+    assert score(0, "없음") == 0
+
+
+def test_popular_title_wins_over_many_earlier_keys():
+    # 정렬 순서상 앞에 있는 덜 인기 있는 항목이 많아도 인기 항목이 먼저 나와야 함
+    docs = [make_doc(i, title=f"개발자 a{i:04d}") for i in range(1, 3000)]
+    docs += [make_doc(10000 + i, title="zz 개발자 인기") for i in range(5)]
+    index = PrefixIndex()
+    index.reset(docs)
+
+    result = index.suggest("개발", 3)
+    assert result[0] == {"text": "zz 개발자 인기", "type": "title", "count": 5}
+    check(index, docs, "개발", 3)
+
+
+def test_matches_word_in_middle_and_company_names():
+    docs = [make_doc(1, title="Python 백엔드 개발자", company_name="네이버"),
+            make_doc(2, title="백엔드 엔지니어", company_name="네이버 클라우드")]
+    index = PrefixIndex()
+    index.reset(docs)
+
+    assert {item['text'] for item in index.suggest("백엔")} == {"Python 백엔드 개발자", "백엔드 엔지니어"}
+    assert index.suggest("클라우드") == [{"text": "네이버 클라우드", "type": "company", "count": 1}]
+    # 공고 수가 같으면 짧은 문자열 우선
+    assert [item['text'] for item in index.suggest("네이버")] == ["네이버", "네이버 클라우드"]
+
+
+def test_empty_query_returns_nothing():
+    index = PrefixIndex()
+    index.reset([make_doc(1, title="개발자")])
+    assert index.suggest("   ") == []
+    assert PrefixIndex().suggest("개발") == []
+
+
+@pytest.mark.parametrize('delta_limit', [3, 2000])
+def test_incremental_updates_match_brute_force(monkeypatch, delta_limit):
+    monkeypatch.setattr(suggest_module, 'DELTA_LIMIT', delta_limit)
+    rng = random.Random(5)
+    words = ['python', 'java', '백엔드', '프론트엔드', '개발자', '엔지니어', 'ai']
+    companies = ['네이버', '카카오', '토스']
+
+    def random_doc(job_id):
+        title = " ".join(rng.sample(words, rng.randint(1, 3)))
+        return make_doc(job_id, title=title, company_name=rng.choice(companies))
+
+    docs = {job_id: random_doc(job_id) for job_id in range(1, 40)}
+    index = PrefixIndex()
+    index.reset(docs.values())
+
+    next_id = 100
+    for step in range(300):
+        if docs and rng.random() < 0.4:
+            index.on_remove(docs.pop(rng.choice(list(docs))))
+        else:
+            docs[next_id] = random_doc(next_id)
+            index.on_add(docs[next_id])
+            next_id += 1
+        if step % 10 == 0:
+            for query in ['p', 'py', '개', '백엔드', '네', 'ai', 'java 개']:
+                check(index, list(docs.values()), query)
+
+    if delta_limit == 3:
+        assert len(index._extra) <= 3  # 추가 목록이 한도를 넘으면 다시 구성됨
+
+
+def test_removed_phrase_disappears():
+    doc = make_doc(1, title="Rust 개발자")
+    index = PrefixIndex()
+    index.reset([doc, make_doc(2, title="Ruby 개발자")])
+    index.on_remove(doc)
+    assert [item['text'] for item in index.suggest("ru")] == ["Ruby 개발자"]
+
+    index.on_add(make_doc(3, title="Rust 개발자"))
+    assert {item['text'] for item in index.suggest("ru")} == {"Ruby 개발자", "Rust 개발자"}
+
+
+@pytest.fixture
+def client(monkeypatch, fake_redis):
+    from flask import Flask
+    from app.controllers import job_controller
+    app = Flask(__name__)
+    app.register_blueprint(job_controller.job_bp)
+    monkeypatch.setattr(job_controller.job_index, 'ready', lambda: False)
+    return app.test_client()
+
+
+def test_endpoints_do_not_wait_for_index_build(client):
+    # 색인 구성 전: 자동완성은 캐시하지 않는 빈 목록, 비슷한 공고는 503
+    response = client.get('/api/jobs/suggest?q=개발')
+    assert response.status_code == 200
+    assert response.get_json() == {"suggestions": []}
+    assert response.headers['Cache-Control'] == 'no-store'
+
+    response = client.get('/api/jobs/1/similar')
+    assert response.status_code == 503
+    assert response.headers['Retry-After'] == '5'
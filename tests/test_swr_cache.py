@@ -0,0 +1,155 @@
+import threading
+import time
+import pytest
+from flask import Flask, g, jsonify
+from app.utils import swr_cache
+from app.utils.conditional import bump_generation, conditional
+
+
+class Counter:
+    """
+    호출 횟수를 세는 계산 함수 (value를 바꾸면 다음 계산 결과가 바뀜)
+    """
+    def __init__(self, value, delay=0):
+        self.value = value
+        self.delay = delay
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def __call__(self):
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.delay)
+        return self.value
+
+
+@pytest.fixture
+def swr(monkeypatch, fake_redis):
+    monkeypatch.setattr(swr_cache, '_app', None)
+    monkeypatch.setattr(swr_cache, '_registry', {})
+    monkeypatch.setattr(swr_cache, 'STATS_CACHE_REFRESH_INTERVAL', 0)  # 갱신 스레드 시작 안 함
+    return swr_cache
+
+
+@pytest.fixture
+def app(swr, monkeypatch):
+    app = Flask(__name__)
+    monkeypatch.setattr(swr, '_app', app)
+    return app
+
+
+def wait_for(condition, timeout=2):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+def test_cold_miss_computes_once_for_concurrent_callers(swr):
+    compute = Counter({"total": 3}, delay=0.2)
+    results = []
+
+    def call():
+        results.append(swr.get_or_compute('stats:test', compute))
+
+    threads = [threading.Thread(target=call) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [{"total": 3}] * 8
+    assert compute.calls == 1
+
+
+def test_fresh_value_is_served_from_cache(swr):
+    compute = Counter([1, 2])
+    assert swr.get_or_compute('stats:test', compute, ['job']) == [1, 2]
+    compute.value = [3]
+    assert swr.get_or_compute('stats:test', compute, ['job']) == [1, 2]
+    assert compute.calls == 1
+
+
+def test_expired_value_is_served_while_refreshing(swr, monkeypatch):
+    monkeypatch.setattr(swr, 'STATS_CACHE_TTL', 0)  # 저장 즉시 오래된 값
+    compute = Counter("old")
+    swr.get_or_compute('stats:test', compute)
+
+    compute.value = "new"
+    assert swr.get_or_compute('stats:test', compute) == "old"  # 앱이 없으면 반환 전에 동기 갱신
+    assert swr.get_or_compute('stats:test', compute) == "new"
+
+
+def test_stale_value_is_not_recomputed_while_another_worker_holds_the_lock(swr, fake_redis, monkeypatch):
+    monkeypatch.setattr(swr, 'STATS_CACHE_TTL', 0)
+    compute = Counter("old")
+    swr.get_or_compute('stats:test', compute)
+
+    fake_redis.set('lock:stats:test', 'other-worker', nx=True)
+    compute.value = "new"
+    assert swr.get_or_compute('stats:test', compute) == "old"
+    assert compute.calls == 1
+
+
+def test_generation_change_serves_stale_and_refreshes_in_background(app):
+    compute = Counter("v1", delay=0.1)
+    with app.test_request_context():
+        assert swr_cache.get_or_compute('stats:test', compute, ['job']) == "v1"
+        assert 'serving_stale' not in g
+
+    bump_generation('job')
+    compute.value = "v2"
+    with app.test_request_context():
+        assert swr_cache.get_or_compute('stats:test', compute, ['job']) == "v1"
+        assert g.serving_stale is True
+
+    with app.test_request_context():
+        wait_for(lambda: swr_cache.get_or_compute('stats:test', compute, ['job']) == "v2")
+    with app.test_request_context():
+        assert swr_cache.get_or_compute('stats:test', compute, ['job']) == "v2"
+        assert 'serving_stale' not in g
+    assert compute.calls == 2
+
+
+def test_redis_failure_computes_directly(swr, fake_redis):
+    fake_redis.fail = True
+    compute = Counter(42)
+    assert swr.get_or_compute('stats:test', compute, ['job']) == 42
+    assert swr.get_or_compute('stats:test', compute, ['job']) == 42
+    assert compute.calls == 2
+
+
+def test_conditional_omits_etag_for_stale_response(app):
+    compute = Counter({"count": 1}, delay=0.1)
+
+    @app.route('/stats')
+    @conditional(['job'])
+    def stats():
+        return jsonify(swr_cache.get_or_compute('stats:test', compute, ['job']))
+
+    client = app.test_client()
+    first = client.get('/stats')
+    assert first.get_json() == {"count": 1} and first.headers.get('ETag')
+
+    bump_generation('job')
+    compute.value = {"count": 2}
+    stale = client.get('/stats', headers={'If-None-Match': first.headers['ETag']})
+    assert stale.status_code == 200 and stale.get_json() == {"count": 1}
+    assert 'ETag' not in stale.headers
+    assert stale.headers['Cache-Control'] == 'no-cache'
+
+    # 갱신이 끝나면 새 값과 새 ETag
+    wait_for(lambda: client.get('/stats').get_json() == {"count": 2})
+    fresh = client.get('/stats')
+    assert fresh.headers['ETag'] not in (None, first.headers['ETag'])
+
+
+def test_recompute_after_change_reads_primary(app, monkeypatch):
+    reads = []
+    monkeypatch.setattr(swr_cache, 'read_from_primary', lambda: reads.append(True))
+    compute = Counter(1)
+
+    bump_generation('job')
+    with app.test_request_context():
+        swr_cache.get_or_compute('stats:test', compute, ['job'])
+    assert reads == [True]
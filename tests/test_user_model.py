@@ -0,0 +1,41 @@
+from app.models import user_model
+from app.models.user_model import User
+from app.utils.conditional import get_generations
+
+
+class FakeCursor:
+    def __init__(self):
+        self.queries = []
+
+    def execute(self, query, values=None):
+        self.queries.append(query)
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    def __init__(self):
+        self.cursor_ = FakeCursor()
+        self.commits = 0
+
+    def cursor(self, **kwargs):
+        return self.cursor_
+
+    def commit(self):
+        self.commits += 1
+
+
+def test_delete_user_invalidates_application_stats(monkeypatch, fake_redis):
+    conn = FakeConnection()
+    monkeypatch.setattr(user_model, 'get_db', lambda *args, **kwargs: conn)
+    removed = []
+    monkeypatch.setattr(user_model.Stats, 'remove_user_applications',
+                        staticmethod(lambda cursor, user_id: removed.append(user_id)))
+
+    [(before, _)] = get_generations(['application'])
+    assert User.delete_user(7) == {"message": "User deleted successfully"}
+    [(after, _)] = get_generations(['application'])
+
+    assert removed == [7] and conn.commits == 1
+    assert after == before + 1